@@ -1,17 +1,33 @@
+from .client import (
+    BridgeClientPool,
+    BridgeConnection,
+    BridgeConnectionClosed,
+    get_pool,
+)
 from .protocol import (
     PROTOCOL_VERSION,
     ProtocolError,
+    encode_json_message,
     make_error_response,
     make_response,
     recv_json_message,
+    recv_json_message_async,
     send_json_message,
+    send_json_message_async,
 )
 
 __all__ = [
+    "BridgeClientPool",
+    "BridgeConnection",
+    "BridgeConnectionClosed",
+    "get_pool",
     "PROTOCOL_VERSION",
     "ProtocolError",
+    "encode_json_message",
     "make_error_response",
     "make_response",
     "recv_json_message",
+    "recv_json_message_async",
     "send_json_message",
+    "send_json_message_async",
 ]
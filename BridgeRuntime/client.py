@@ -0,0 +1,204 @@
+import socket
+import threading
+import uuid
+from typing import Any
+
+from .protocol import ProtocolError, recv_json_message, send_json_message
+
+
+class BridgeConnectionClosed(ConnectionError):
+    """The connection dropped; `sent` tells whether the request reached the socket."""
+
+    def __init__(self, message: str, sent: bool):
+        super().__init__(message)
+        self.sent = sent
+
+
+class BridgeConnection:
+    """
+    One persistent control connection to the daemon.
+
+    Requests are pipelined: any number of threads may send on the same socket,
+    a reader thread matches every response to its caller by request_id.
+    """
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.alive = False
+        self._sock: socket.socket | None = None
+        self._send_lock = threading.Lock()
+        self._pending: dict[str, list[Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._connect(connect_timeout)
+
+    def _connect(self, timeout: float) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(None)
+        self._sock = sock
+        self.alive = True
+        threading.Thread(target=self._recv_loop, name=f"bridge-client-{self.port}", daemon=True).start()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def _recv_loop(self) -> None:
+        sock = self._sock
+        try:
+            while self.alive and sock is not None:
+                msg = recv_json_message(sock)
+                req_id = str(msg.get("request_id") or "")
+                with self._pending_lock:
+                    slot = self._pending.get(req_id)
+                if slot is None:
+                    # late response for a request that already timed out
+                    continue
+                slot[1] = msg
+                slot[0].set()
+        except Exception:
+            pass
+        finally:
+            self.close()
+
+    def request(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        timeout: float = 5.0,
+        request_id: str | None = None,
+    ) -> dict[str, Any]:
+        if not self.alive or self._sock is None:
+            raise BridgeConnectionClosed("bridge connection closed", sent=False)
+        request_id = request_id or uuid.uuid4().hex
+        slot: list[Any] = [threading.Event(), None]
+        with self._pending_lock:
+            if request_id in self._pending:
+                raise ProtocolError(f"request_id already in flight: {request_id}")
+            self._pending[request_id] = slot
+        try:
+            try:
+                with self._send_lock:
+                    send_json_message(
+                        self._sock,
+                        {"type": "request", "request_id": request_id, "command": command, "params": params or {}},
+                    )
+            except (OSError, AttributeError) as exc:
+                self.close()
+                raise BridgeConnectionClosed(f"bridge connection closed: {exc}", sent=False) from exc
+            if not slot[0].wait(timeout):
+                raise socket.timeout(f"daemon timeout for {command}")
+            if slot[1] is None:
+                raise BridgeConnectionClosed("bridge connection closed", sent=True)
+            return slot[1]
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        self.alive = False
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+            try:
+                sock.close()
+            except Exception:
+                pass
+        # wake every waiter, their slot stays empty so they raise ConnectionError
+        with self._pending_lock:
+            pending = list(self._pending.values())
+        for slot in pending:
+            slot[0].set()
+
+
+class BridgeClientPool:
+    """
+    Small pool of pipelined connections to one daemon control endpoint.
+
+    A request goes to the least loaded live connection. A new connection is
+    only opened once every existing one already carries `max_in_flight`
+    requests, up to `max_connections`. Dead connections (daemon restart, idle
+    timeout on the daemon side) are dropped and replaced on the next request.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_connections: int = 4,
+        max_in_flight: int = 8,
+        connect_timeout: float = 5.0,
+    ):
+        self.host = host
+        self.port = port
+        self.max_connections = max(1, int(max_connections))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.connect_timeout = connect_timeout
+        self._connections: list[BridgeConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> BridgeConnection:
+        with self._lock:
+            self._connections = [c for c in self._connections if c.alive]
+            best = min(self._connections, key=lambda c: c.in_flight, default=None)
+            if best is not None and (
+                best.in_flight < self.max_in_flight or len(self._connections) >= self.max_connections
+            ):
+                return best
+            conn = BridgeConnection(self.host, self.port, connect_timeout=self.connect_timeout)
+            self._connections.append(conn)
+            return conn
+
+    def request(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        timeout: float = 5.0,
+        request_id: str | None = None,
+    ) -> dict[str, Any]:
+        conn = self._acquire()
+        try:
+            return conn.request(command, params, timeout=timeout, request_id=request_id)
+        except BridgeConnectionClosed as exc:
+            # the pooled socket went stale between requests; retry once on a fresh
+            # one, unless the request may already have reached the daemon
+            if exc.sent:
+                raise
+            return self._acquire().request(command, params, timeout=timeout, request_id=request_id)
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+
+_pools: dict[tuple[str, int], BridgeClientPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(host: str, port: int) -> BridgeClientPool:
+    """Process-wide pool for a daemon control endpoint."""
+    key = (host, int(port))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = BridgeClientPool(host, int(port))
+            _pools[key] = pool
+        return pool
+
+
+def request(
+    host: str,
+    port: int,
+    command: str,
+    params: dict[str, Any] | None = None,
+    timeout: float = 5.0,
+    request_id: str | None = None,
+) -> dict[str, Any]:
+    """Send one control request through the shared pool for host:port."""
+    return get_pool(host, port).request(command, params, timeout=timeout, request_id=request_id)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import socket
 import struct
@@ -5,6 +6,7 @@ import time
 from typing import Any
 
 PROTOCOL_VERSION = 1
+MAX_FRAME_SIZE = 16 * 1024 * 1024
 
 
 class ProtocolError(RuntimeError):
@@ -29,24 +31,59 @@ def _read_exact(sock: socket.socket, size: int, timeout: float | None = None) ->
     return b"".join(chunks)
 
 
-def send_json_message(sock: socket.socket, payload: dict[str, Any]) -> None:
+def encode_json_message(payload: dict[str, Any]) -> bytes:
     raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    sock.sendall(struct.pack("<I", len(raw)))
-    sock.sendall(raw)
+    return struct.pack("<I", len(raw)) + raw
 
 
-def recv_json_message(sock: socket.socket, timeout: float | None = None) -> dict[str, Any]:
-    header = _read_exact(sock, 4, timeout=timeout)
+def _frame_size(header: bytes) -> int:
     (size,) = struct.unpack("<I", header)
-    if size <= 0 or size > 16 * 1024 * 1024:
+    if size <= 0 or size > MAX_FRAME_SIZE:
         raise ProtocolError(f"invalid frame size: {size}")
-    raw = _read_exact(sock, size, timeout=timeout)
+    return size
+
+
+def _decode_payload(raw: bytes) -> dict[str, Any]:
     payload = json.loads(raw.decode("utf-8"))
     if not isinstance(payload, dict):
         raise ProtocolError("payload must be object")
     return payload
 
 
+def send_json_message(sock: socket.socket, payload: dict[str, Any]) -> None:
+    sock.sendall(encode_json_message(payload))
+
+
+def recv_json_message(sock: socket.socket, timeout: float | None = None) -> dict[str, Any]:
+    header = _read_exact(sock, 4, timeout=timeout)
+    size = _frame_size(header)
+    raw = _read_exact(sock, size, timeout=timeout)
+    return _decode_payload(raw)
+
+
+async def send_json_message_async(writer: asyncio.StreamWriter, payload: dict[str, Any]) -> None:
+    # a single write() per frame keeps frames from concurrent tasks from interleaving
+    writer.write(encode_json_message(payload))
+    await writer.drain()
+
+
+async def recv_json_message_async(reader: asyncio.StreamReader, timeout: float | None = None) -> dict[str, Any]:
+    async def _read() -> dict[str, Any]:
+        try:
+            header = await reader.readexactly(4)
+            raw = await reader.readexactly(_frame_size(header))
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("socket closed") from exc
+        return _decode_payload(raw)
+
+    if timeout is None:
+        return await _read()
+    try:
+        return await asyncio.wait_for(_read(), timeout)
+    except asyncio.TimeoutError:
+        raise socket.timeout() from None
+
+
 def make_response(request_id: str, result: Any, ok: bool = True) -> dict[str, Any]:
     return {"type": "response", "request_id": request_id, "ok": ok, "result": result}
 
@@ -569,7 +569,7 @@ class FollowFormationPublisher:
             self.state.combat_cached_follow_pos.clear()
 
         for index in range(self.shared_memory_manager.max_num_players):
-            account: AccountStruct = all_accounts.AccountData[index]
+            account: AccountStruct = all_accounts.GetAccountSnapshot(index)
             if not (account.IsSlotActive and account.IsAccount) or all_accounts._is_slot_isolated_from_viewer(index, leader_index):
                 continue
             if not self._same_party_and_map(leader_account, account):
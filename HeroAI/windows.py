@@ -651,9 +651,11 @@ class HeroAI_Windows():
 
         if PyImGui.button("Submit"):
             self_id = Player.GetAgentID()
-            account = GLOBAL_CACHE.ShMem.GetAllAccounts().AccountData[HeroAI_Windows.slot_to_write]
-            options = GLOBAL_CACHE.ShMem.GetAllAccounts().HeroAIOptions[HeroAI_Windows.slot_to_write]
+            all_accounts = GLOBAL_CACHE.ShMem.GetAllAccounts()
+            account = all_accounts.AccountData[HeroAI_Windows.slot_to_write]
+            options = all_accounts.HeroAIOptions[HeroAI_Windows.slot_to_write]
 
+            all_accounts._begin_slot_write(HeroAI_Windows.slot_to_write)
             account.AgentData.AgentID = self_id
             player_id = Player.GetAgentID()
             account.AgentData.Energy.Regen = Agent.GetEnergyRegen(player_id)
@@ -662,6 +664,8 @@ class HeroAI_Windows():
             account.AgentData.Energy.Pips = Utils.calculate_energy_pips(account.AgentData.Energy.Max, account.AgentData.Energy.Regen)
             account.IsSlotActive = True
             account.IsHero = False
+            all_accounts._end_slot_write(HeroAI_Windows.slot_to_write)
+            all_accounts.BumpSlotGeneration()
             
             options.IsFlagged = False
             options.FlagPos.x = 0.0
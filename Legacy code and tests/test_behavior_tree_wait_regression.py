@@ -0,0 +1,232 @@
+"""
+Offline regression checks for BehaviorTree wait nodes.
+
+This script stubs the runtime-heavy modules that BehaviorTree depends on,
+loads the real module by path with a controllable clock, and checks:
+
+- WaitUntilNode throttles condition checks while the condition returns RUNNING
+- the tree sleeps between those checks (skipped_ticks grows)
+- WaitUntilNode finishes and re-arms on SUCCESS/FAILURE
+
+Run:
+    python "Legacy code and tests/test_behavior_tree_wait_regression.py"
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import traceback
+import types
+from pathlib import Path
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+BEHAVIOR_TREE_PATH = REPO_ROOT / "Py4GWCoreLib" / "py4gwcorelib_src" / "BehaviorTree.py"
+
+CLOCK_MS = [1000]
+
+
+def _expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+def _ensure_package(name: str) -> types.ModuleType:
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        module.__path__ = []
+        sys.modules[name] = module
+    return module
+
+
+def _install_stub_modules() -> None:
+    class DummyMessageType:
+        Info = "info"
+        Warning = "warning"
+        Error = "error"
+        Success = "success"
+        Debug = "debug"
+
+    class DummyConsole:
+        MessageType = DummyMessageType
+
+    class DummyUtils:
+        @staticmethod
+        def GetBaseTimestamp() -> int:
+            return CLOCK_MS[0]
+
+    class DummyColor:
+        def to_tuple_normalized(self):
+            return (1.0, 1.0, 1.0, 1.0)
+
+    class DummyColorPalette:
+        @staticmethod
+        def GetColor(_name: str) -> DummyColor:
+            return DummyColor()
+
+    class _IconMeta(type):
+        def __getattr__(cls, _name: str) -> str:
+            return ""
+
+    class DummyIcons(metaclass=_IconMeta):
+        pass
+
+    sys.modules["PyImGui"] = types.ModuleType("PyImGui")
+
+    _ensure_package("Py4GWCoreLib")
+    _ensure_package("Py4GWCoreLib.py4gwcorelib_src")
+    _ensure_package("Py4GWCoreLib.ImGui_src")
+
+    corelib = types.ModuleType("Py4GWCoreLib.Py4GWcorelib")
+    corelib.Console = DummyConsole
+    corelib.ConsoleLog = lambda *_args, **_kwargs: None
+    sys.modules[corelib.__name__] = corelib
+
+    utils = types.ModuleType("Py4GWCoreLib.py4gwcorelib_src.Utils")
+    utils.Utils = DummyUtils
+    sys.modules[utils.__name__] = utils
+
+    color = types.ModuleType("Py4GWCoreLib.py4gwcorelib_src.Color")
+    color.Color = DummyColor
+    color.ColorPalette = DummyColorPalette
+    sys.modules[color.__name__] = color
+
+    icons = types.ModuleType("Py4GWCoreLib.ImGui_src.IconsFontAwesome5")
+    icons.IconsFontAwesome5 = DummyIcons
+    sys.modules[icons.__name__] = icons
+
+
+def _load_behavior_tree():
+    _install_stub_modules()
+    module_name = "Py4GWCoreLib.py4gwcorelib_src.BehaviorTree"
+    spec = importlib.util.spec_from_file_location(module_name, BEHAVIOR_TREE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load {BEHAVIOR_TREE_PATH}.")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module.BehaviorTree
+
+
+def _run_ticks(tree, ticks: int, step_ms: int = 1) -> None:
+    for _ in range(ticks):
+        tree.tick()
+        CLOCK_MS[0] += step_ms
+
+
+def _test_wait_until_running_is_throttled_and_sleeps(BehaviorTree) -> None:
+    CLOCK_MS[0] = 1000
+    calls = {"cond": 0}
+
+    def condition():
+        calls["cond"] += 1
+        return BehaviorTree.NodeState.RUNNING
+
+    tree = BehaviorTree(BehaviorTree.WaitUntilNode(condition, throttle_interval_ms=100))
+    _run_ticks(tree, 1000)
+
+    # 1000 ticks of 1 ms with a 100 ms interval -> about 10 checks, not 1000
+    _expect(calls["cond"] <= 11, f"condition_fn called {calls['cond']} times, expected at most 11")
+    _expect(calls["cond"] >= 9, f"condition_fn called {calls['cond']} times, expected at least 9")
+    _expect(tree.skipped_ticks > 900, f"expected the tree to sleep between checks, skipped_ticks={tree.skipped_ticks}")
+
+    skipped = tree.skipped_ticks
+    _run_ticks(tree, 500)
+    _expect(tree.skipped_ticks > skipped, "skipped_ticks did not grow while the condition kept returning RUNNING")
+
+
+def _test_wait_until_running_without_scheduling_still_throttles(BehaviorTree) -> None:
+    CLOCK_MS[0] = 1000
+    calls = {"cond": 0}
+
+    def condition():
+        calls["cond"] += 1
+        return BehaviorTree.NodeState.RUNNING
+
+    tree = BehaviorTree(BehaviorTree.WaitUntilNode(condition, throttle_interval_ms=100))
+    tree.scheduling = False
+    _run_ticks(tree, 1000)
+
+    _expect(calls["cond"] <= 11, f"condition_fn called {calls['cond']} times, expected at most 11")
+    _expect(tree.skipped_ticks == 0, f"scheduling is off, skipped_ticks={tree.skipped_ticks}")
+
+
+def _test_wait_until_finishes_and_rearms(BehaviorTree) -> None:
+    CLOCK_MS[0] = 1000
+    calls = {"cond": 0}
+
+    def condition():
+        calls["cond"] += 1
+        if calls["cond"] % 3 == 0:
+            return BehaviorTree.NodeState.SUCCESS
+        return BehaviorTree.NodeState.RUNNING
+
+    node = BehaviorTree.WaitUntilNode(condition, throttle_interval_ms=100)
+    tree = BehaviorTree(node)
+    result = None
+    for _ in range(1000):
+        result = tree.tick()
+        CLOCK_MS[0] += 1
+        if result == BehaviorTree.NodeState.SUCCESS:
+            break
+
+    _expect(result == BehaviorTree.NodeState.SUCCESS, f"WaitUntilNode never succeeded, last state {result}")
+    _expect(calls["cond"] == 3, f"condition_fn called {calls['cond']} times before SUCCESS, expected 3")
+    _expect(node._start_time_ms is None and node._last_check_time_ms is None, "WaitUntilNode kept its timers after SUCCESS")
+
+
+def _test_wait_until_times_out_while_running(BehaviorTree) -> None:
+    CLOCK_MS[0] = 1000
+
+    tree = BehaviorTree(BehaviorTree.WaitUntilNode(lambda: BehaviorTree.NodeState.RUNNING,
+                                                   throttle_interval_ms=100, timeout_ms=350))
+    result = None
+    for _ in range(1000):
+        result = tree.tick()
+        CLOCK_MS[0] += 1
+        if result != BehaviorTree.NodeState.RUNNING:
+            break
+
+    _expect(result == BehaviorTree.NodeState.FAILURE, f"expected FAILURE on timeout, got {result}")
+    _expect(350 <= CLOCK_MS[0] - 1000 <= 360, f"timeout fired after {CLOCK_MS[0] - 1000} ms, expected ~350 ms")
+
+
+def main() -> int:
+    BehaviorTree = _load_behavior_tree()
+
+    tests = [
+        ("wait_until_running_is_throttled_and_sleeps", lambda: _test_wait_until_running_is_throttled_and_sleeps(BehaviorTree)),
+        ("wait_until_running_without_scheduling_still_throttles", lambda: _test_wait_until_running_without_scheduling_still_throttles(BehaviorTree)),
+        ("wait_until_finishes_and_rearms", lambda: _test_wait_until_finishes_and_rearms(BehaviorTree)),
+        ("wait_until_times_out_while_running", lambda: _test_wait_until_times_out_while_running(BehaviorTree)),
+    ]
+
+    failures: list[tuple[str, str]] = []
+    for name, test_fn in tests:
+        try:
+            test_fn()
+        except Exception:
+            failures.append((name, traceback.format_exc()))
+            print(f"FAIL: {name}")
+        else:
+            print(f"PASS: {name}")
+
+    if failures:
+        print("")
+        print(f"{len(failures)} regression test(s) failed:")
+        for name, details in failures:
+            print(f"- {name}")
+            print(details.rstrip())
+            print("")
+        return 1
+
+    print("")
+    print(f"PASS: {len(tests)} BehaviorTree wait regression checks passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -33,12 +33,47 @@ class Agent:
     _item_cache: dict[int, "AgentItemStruct"] = {}
     _gadget_cache: dict[int, "AgentGadgetStruct"] = {}
 
+    # frame-scoped values of the hottest accessors, cleared with the struct caches
+    _xy_cache: dict[int, tuple[float, float]] = {}
+    _xyz_cache: dict[int, tuple[float, float, float]] = {}
+    _hp_cache: dict[int, float] = {}
+    _energy_cache: dict[int, float] = {}
+    _model_id_cache: dict[int, int] = {}
+    _dead_cache: dict[int, bool] = {}
+    _alive_cache: dict[int, bool] = {}
+
+    _CACHE_NAMES = ("agent", "living", "item", "gadget", "xy", "xyz", "hp", "energy", "model_id", "dead", "alive")
+    _cache_hits: dict[str, int] = dict.fromkeys(_CACHE_NAMES, 0)
+    _cache_misses: dict[str, int] = dict.fromkeys(_CACHE_NAMES, 0)
+
     @staticmethod
     def _invalidate_property_cache() -> None:
         Agent._agent_cache.clear()
         Agent._living_cache.clear()
         Agent._item_cache.clear()
         Agent._gadget_cache.clear()
+        Agent._xy_cache.clear()
+        Agent._xyz_cache.clear()
+        Agent._hp_cache.clear()
+        Agent._energy_cache.clear()
+        Agent._model_id_cache.clear()
+        Agent._dead_cache.clear()
+        Agent._alive_cache.clear()
+
+    @staticmethod
+    def GetCacheStats() -> dict[str, tuple[int, int]]:
+        """
+        Purpose: Hit/miss counters of the frame-scoped accessor caches.
+        Returns: dict[str, tuple[int, int]]: cache name -> (hits, misses)
+        """
+        return {name: (Agent._cache_hits[name], Agent._cache_misses[name]) for name in Agent._CACHE_NAMES}
+
+    @staticmethod
+    def ResetCacheStats() -> None:
+        """Purpose: Zero the accessor cache hit/miss counters."""
+        for name in Agent._CACHE_NAMES:
+            Agent._cache_hits[name] = 0
+            Agent._cache_misses[name] = 0
 
     @staticmethod
     def enable() -> None:
@@ -58,14 +93,13 @@ class Agent:
             agent_id (int): The ID of the agent to retrieve.
         Returns: PyAgent
         """
-        from .AgentArray import AgentArray
-        return AgentArray.GetAgentByID(agent_id)
-        
-        
         cached = Agent._agent_cache.get(agent_id)
         if cached is not None:
+            Agent._cache_hits["agent"] += 1
             return cached
-        
+        Agent._cache_misses["agent"] += 1
+
+        from .AgentArray import AgentArray
         agent = AgentArray.GetAgentByID(agent_id)
         if agent is not None:
             Agent._agent_cache[agent_id] = agent
@@ -82,7 +116,9 @@ class Agent:
         """
         cached = Agent._living_cache.get(agent_id)
         if cached is not None:
+            Agent._cache_hits["living"] += 1
             return cached
+        Agent._cache_misses["living"] += 1
         agent = Agent.GetAgentByID(agent_id)
         if agent is None:
             return None
@@ -101,7 +137,9 @@ class Agent:
         """
         cached = Agent._item_cache.get(agent_id)
         if cached is not None:
+            Agent._cache_hits["item"] += 1
             return cached
+        Agent._cache_misses["item"] += 1
         agent = Agent.GetAgentByID(agent_id)
         if agent is None:
             return None
@@ -120,7 +158,9 @@ class Agent:
         """
         cached = Agent._gadget_cache.get(agent_id)
         if cached is not None:
+            Agent._cache_hits["gadget"] += 1
             return cached
+        Agent._cache_misses["gadget"] += 1
         agent = Agent.GetAgentByID(agent_id)
         if agent is None:
             return None
@@ -327,10 +367,17 @@ class Agent:
     @staticmethod
     def GetModelID(agent_id : int) -> int:
         """Retrieve the model of an agent."""
+        cached = Agent._model_id_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["model_id"] += 1
+            return cached
+        Agent._cache_misses["model_id"] += 1
         living = Agent.GetLivingAgentByID(agent_id)
         if living is None:
             return 0
-        return living.player_number
+        model_id = living.player_number
+        Agent._model_id_cache[agent_id] = model_id
+        return model_id
 
     @staticmethod
     def IsLiving(agent_id : int) -> bool:
@@ -417,11 +464,18 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: tuple
         """
+        cached = Agent._xy_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["xy"] += 1
+            return cached
+        Agent._cache_misses["xy"] += 1
         agent = Agent.GetAgentByID(agent_id)
         if agent is None:
             return 0.0, 0.0
         pos = agent.pos
-        return pos.x, pos.y
+        xy = (pos.x, pos.y)
+        Agent._xy_cache[agent_id] = xy
+        return xy
 
     @staticmethod
     def GetXYZ(agent_id : int) -> tuple[float, float, float]:
@@ -430,12 +484,18 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: tuple
         """
+        cached = Agent._xyz_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["xyz"] += 1
+            return cached
+        Agent._cache_misses["xyz"] += 1
         agent = Agent.GetAgentByID(agent_id)
         if agent is None:
             return 0.0, 0.0, 0.0
         pos = agent.pos
-        z = agent.z
-        return pos.x, pos.y, z
+        xyz = (pos.x, pos.y, agent.z)
+        Agent._xyz_cache[agent_id] = xyz
+        return xyz
 
     @staticmethod
     def GetZPlane(agent_id : int) -> int:
@@ -845,10 +905,17 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: float
         """
+        cached = Agent._energy_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["energy"] += 1
+            return cached
+        Agent._cache_misses["energy"] += 1
         living = Agent.GetLivingAgentByID(agent_id)
         if living is None:
             return 0.0
-        return living.energy
+        energy = living.energy
+        Agent._energy_cache[agent_id] = energy
+        return energy
     
     @staticmethod
     def GetMaxEnergy(agent_id: int) -> int:
@@ -894,10 +961,17 @@ class Agent:
         Args: agent_id (int): The ID of the agent.
         Returns: float
         """
+        cached = Agent._hp_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["hp"] += 1
+            return cached
+        Agent._cache_misses["hp"] += 1
         living = Agent.GetLivingAgentByID(agent_id)
         if living is None:
             return 0.0
-        return living.hp
+        hp = living.hp
+        Agent._hp_cache[agent_id] = hp
+        return hp
 
     @staticmethod
     def GetMaxHealth(agent_id: int) -> int:
@@ -1011,21 +1085,35 @@ class Agent:
     @staticmethod
     def IsDead(agent_id: int) -> bool:
         """Check if the agent is dead."""
+        cached = Agent._dead_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["dead"] += 1
+            return cached
+        Agent._cache_misses["dead"] += 1
         living = Agent.GetLivingAgentByID(agent_id)
         if living is None:
             return False
         is_dead = living.is_dead
         dead_by_type_map = living.is_dead_by_type_map
         health = living.hp
-        return is_dead or dead_by_type_map or health < 0.01
+        dead = bool(is_dead or dead_by_type_map or health < 0.01)
+        Agent._dead_cache[agent_id] = dead
+        return dead
 
     @staticmethod
     def IsAlive(agent_id: int) -> bool:
+        cached = Agent._alive_cache.get(agent_id)
+        if cached is not None:
+            Agent._cache_hits["alive"] += 1
+            return cached
+        Agent._cache_misses["alive"] += 1
         living = Agent.GetLivingAgentByID(agent_id)
         if living is None:
             return False
         health = living.hp
-        return not Agent.IsDead(agent_id) and health >= 0.01
+        alive = not Agent.IsDead(agent_id) and health >= 0.01
+        Agent._alive_cache[agent_id] = alive
+        return alive
 
     @staticmethod
     def IsWeaponSpelled(agent_id: int) -> bool:
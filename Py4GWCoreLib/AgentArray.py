@@ -7,6 +7,7 @@ from .enums_src.GameData_enums import Allegiance
 from .Context import GWContext
 from typing import Callable
 from .native_src.context.AgentContext import AgentStruct
+from .AgentSpatialIndex import AgentSpatialIndex
 
 
 class AgentArray:
@@ -36,7 +37,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_ally_array()
+        return list(AAW.get_ally_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -53,7 +54,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_neutral_array()
+        return list(AAW.get_neutral_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -69,7 +70,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_enemy_array()
+        return list(AAW.get_enemy_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -85,7 +86,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_spirit_pet_array()
+        return list(AAW.get_spirit_pet_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -103,7 +104,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_minion_array()
+        return list(AAW.get_minion_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -120,7 +121,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_npc_minipet_array()
+        return list(AAW.get_npc_minipet_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -137,7 +138,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_item_array()
+        return list(AAW.get_item_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -154,7 +155,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_owned_item_array()
+        return list(AAW.get_owned_item_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -172,7 +173,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_gadget_array()
+        return list(AAW.get_gadget_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -190,7 +191,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_dead_ally_array()
+        return list(AAW.get_dead_ally_array())
     
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
@@ -209,7 +210,7 @@ class AgentArray:
         AAW = SystemShaMemMgr.get_agent_array_wrapper()
         if AAW is None:
             return []
-        return AAW.get_dead_enemy_array()
+        return list(AAW.get_dead_enemy_array())
     
         agent_array_ctx = GWContext.AgentArray.GetContext()
         if not agent_array_ctx:
@@ -327,14 +328,29 @@ class AgentArray:
             """
             if agent_array is None:
                 return []
-            return AgentArray.Sort.ByCondition(
-                agent_array,
-                condition_func=lambda agent_id: Utils.Distance(
-                    Agent.GetXY(agent_id),
-                    (pos[0], pos[1])
-                ),
-                reverse=descending
-            )
+            grid = AgentSpatialIndex.GetGrid()
+            if grid is None:
+                return AgentArray.Sort.ByCondition(
+                    agent_array,
+                    condition_func=lambda agent_id: Utils.Distance(
+                        Agent.GetXY(agent_id),
+                        (pos[0], pos[1])
+                    ),
+                    reverse=descending
+                )
+
+            px, py = pos[0], pos[1]
+            positions = grid.positions()
+
+            def distance_sq(agent_id):
+                xy = positions.get(agent_id)
+                if xy is None:
+                    xy = Agent.GetXY(agent_id)
+                dx = xy[0] - px
+                dy = xy[1] - py
+                return dx * dx + dy * dy
+
+            return AgentArray.Sort.ByCondition(agent_array, condition_func=distance_sq, reverse=descending)
 
         @staticmethod
         def ByHealth(agent_array, descending=False):
@@ -402,20 +418,47 @@ class AgentArray:
             """
             if agent_array is None:
                 return []
-            def distance_filter(agent_id):
-                agent_x, agent_y = Agent.GetXY(agent_id)
-                distance = Utils.Distance((agent_x, agent_y), (pos[0], pos[1]))
-                return (distance > max_distance) if negate else (distance <= max_distance)
-
-            return AgentArray.Filter.ByCondition(agent_array, distance_filter)
+            grid = AgentSpatialIndex.GetGrid()
+            if grid is None:
+                def distance_filter(agent_id):
+                    agent_x, agent_y = Agent.GetXY(agent_id)
+                    distance = Utils.Distance((agent_x, agent_y), (pos[0], pos[1]))
+                    return (distance > max_distance) if negate else (distance <= max_distance)
+
+                return AgentArray.Filter.ByCondition(agent_array, distance_filter)
+
+            px, py = pos[0], pos[1]
+            max_distance_sq = max_distance * max_distance if max_distance >= 0 else -1.0
+            positions = grid.positions()
+
+            def distance_in_range(agent_id):
+                xy = positions.get(agent_id)
+                if xy is None:
+                    xy = Agent.GetXY(agent_id)
+                dx = xy[0] - px
+                dy = xy[1] - py
+                return dx * dx + dy * dy <= max_distance_sq
+
+            if grid.cell_span(max_distance) < len(agent_array):
+                # small radius: let the grid find the agents in range, only agents missing from it are measured
+                found = set(grid.query_radius(px, py, max_distance))
+
+                def in_range(agent_id):
+                    if agent_id in found:
+                        return True
+                    return agent_id not in positions and distance_in_range(agent_id)
+            else:
+                in_range = distance_in_range
+
+            if negate:
+                return AgentArray.Filter.ByCondition(agent_array, lambda agent_id: not in_range(agent_id))
+            return AgentArray.Filter.ByCondition(agent_array, in_range)
 
     #region Routines
     class Routines:
             @staticmethod
             def DetectLargestAgentCluster(agent_array, cluster_radius):
-                from .GlobalCache import GLOBAL_CACHE
-                from .Py4GWcorelib import Utils
-                from .Agent import Agent
+                from .AgentClustering import AgentClustering
 
                 """
                 Detects the largest cluster of agents based on proximity and returns
@@ -428,55 +471,4 @@ class AgentArray:
                 Returns:
                     int: The ID of the agent closest to the center of the largest cluster.
                 """
-
-                if not agent_array:
-                    return 0  # no agents
-
-                cluster_radius_sq = cluster_radius ** 2
-
-                def is_in_radius(agent1, agent2):
-                    x1, y1 = Agent.GetXY(agent1)
-                    x2, y2 = Agent.GetXY(agent2)
-                    dx, dy = x1 - x2, y1 - y2
-                    return (dx * dx + dy * dy) <= cluster_radius_sq
-
-                # --- Group agents into clusters ---
-                unvisited = set(agent_array)
-                clusters = []
-
-                while unvisited:
-                    current = unvisited.pop()
-                    cluster = [current]
-                    stack = [current]
-
-                    while stack:
-                        node = stack.pop()
-                        neighbors = [a for a in list(unvisited) if is_in_radius(node, a)]
-                        for n in neighbors:
-                            unvisited.remove(n)
-                            cluster.append(n)
-                            stack.append(n)
-
-                    clusters.append(cluster)
-
-                # --- Find largest cluster ---
-                largest_cluster = max(clusters, key=len)
-
-                # --- Compute cluster center (average XY) ---
-                total_x = total_y = 0
-                for agent_id in largest_cluster:
-                    x, y = Agent.GetXY(agent_id)
-                    total_x += x
-                    total_y += y
-                center_x = total_x / len(largest_cluster)
-                center_y = total_y / len(largest_cluster)
-                center_pos = (center_x, center_y)
-
-                # --- Find agent closest to center ---
-                def dist(agent_id):
-                    ax, ay = Agent.GetXY(agent_id)
-                    return Utils.Distance((ax, ay), center_pos)
-
-                closest_agent_id = min(largest_cluster, key=dist)
-                return closest_agent_id
-
+                return AgentClustering.DetectLargestAgentCluster(agent_array, cluster_radius)
@@ -0,0 +1,158 @@
+"""
+Agent Clustering - grid based single-linkage clustering of agent positions.
+
+Two agents belong to the same cluster when a chain of agents connects them
+with every hop no longer than the cluster radius (the same rule the old
+pairwise DetectLargestAgentCluster used). Positions are snapshotted once into
+flat lists and bucketed into cells of `radius` size, so each agent is only
+compared against the agents of its 3x3 cell neighbourhood instead of every
+other unvisited agent.
+
+Usage:
+    ```python
+    from Py4GWCoreLib.AgentClustering import AgentClustering
+
+    members, center = AgentClustering.LargestCluster(enemy_array, Range.Area.value)
+    target = AgentClustering.DetectLargestAgentCluster(enemy_array, Range.Area.value)
+    ```
+"""
+
+import math
+
+
+class AgentClustering:
+    @staticmethod
+    def Snapshot(agent_array: list[int]) -> tuple[list[int], list[float], list[float]]:
+        """
+        Capture agent positions once into flat (ids, xs, ys) lists.
+
+        Duplicated ids are dropped, the first occurrence keeps its position in the order.
+        """
+        from .Agent import Agent
+        from .AgentSpatialIndex import AgentSpatialIndex
+
+        grid = AgentSpatialIndex.GetGrid()
+        positions = grid.positions() if grid is not None else {}
+
+        ids: list[int] = []
+        xs: list[float] = []
+        ys: list[float] = []
+        seen: set[int] = set()
+        for agent_id in agent_array:
+            if agent_id in seen:
+                continue
+            seen.add(agent_id)
+            xy = positions.get(agent_id)
+            if xy is None:
+                xy = Agent.GetXY(agent_id)
+            ids.append(agent_id)
+            xs.append(xy[0])
+            ys.append(xy[1])
+        return ids, xs, ys
+
+    @staticmethod
+    def FindClusters(xs: list[float], ys: list[float], radius: float) -> list[list[int]]:
+        """
+        Group point indices into clusters.
+
+        Args:
+            xs (list[float]): X coordinates.
+            ys (list[float]): Y coordinates.
+            radius (float): Maximum distance between two linked points.
+
+        Returns:
+            list[list[int]]: Clusters as lists of indices into xs/ys, in discovery order.
+        """
+        count = len(xs)
+        if count == 0:
+            return []
+
+        radius_sq = radius * radius if radius >= 0 else -1.0
+        inv_cell = 1.0 / max(radius, 1.0)
+
+        cell_x = [0] * count
+        cell_y = [0] * count
+        cells: dict[tuple[int, int], list[int]] = {}
+        for i in range(count):
+            cx = int(math.floor(xs[i] * inv_cell))
+            cy = int(math.floor(ys[i] * inv_cell))
+            cell_x[i] = cx
+            cell_y[i] = cy
+            bucket = cells.get((cx, cy))
+            if bucket is None:
+                cells[(cx, cy)] = [i]
+            else:
+                bucket.append(i)
+
+        visited = [False] * count
+        clusters: list[list[int]] = []
+        for start in range(count):
+            if visited[start]:
+                continue
+            visited[start] = True
+            cluster = [start]
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                nx = xs[node]
+                ny = ys[node]
+                ncx = cell_x[node]
+                ncy = cell_y[node]
+                for cx in (ncx - 1, ncx, ncx + 1):
+                    for cy in (ncy - 1, ncy, ncy + 1):
+                        bucket = cells.get((cx, cy))
+                        if not bucket:
+                            continue
+                        for other in bucket:
+                            if visited[other]:
+                                continue
+                            dx = xs[other] - nx
+                            dy = ys[other] - ny
+                            if dx * dx + dy * dy <= radius_sq:
+                                visited[other] = True
+                                cluster.append(other)
+                                stack.append(other)
+            clusters.append(cluster)
+        return clusters
+
+    @staticmethod
+    def LargestCluster(agent_array: list[int], cluster_radius: float) -> tuple[list[int], tuple[float, float]]:
+        """
+        Find the largest cluster and its center of mass.
+
+        Returns:
+            tuple[list[int], tuple[float, float]]: Agent ids of the largest cluster and
+            its average position. ([], (0.0, 0.0)) when `agent_array` is empty.
+        """
+        if not agent_array:
+            return [], (0.0, 0.0)
+
+        ids, xs, ys = AgentClustering.Snapshot(agent_array)
+        clusters = AgentClustering.FindClusters(xs, ys, cluster_radius)
+        largest = max(clusters, key=len)
+
+        total_x = total_y = 0.0
+        for i in largest:
+            total_x += xs[i]
+            total_y += ys[i]
+        center = (total_x / len(largest), total_y / len(largest))
+        return [ids[i] for i in largest], center
+
+    @staticmethod
+    def DetectLargestAgentCluster(agent_array: list[int], cluster_radius: float) -> int:
+        """
+        Return the agent closest to the center of mass of the largest cluster, or 0 without agents.
+        """
+        members, (center_x, center_y) = AgentClustering.LargestCluster(agent_array, cluster_radius)
+        if not members:
+            return 0
+
+        ids, xs, ys = AgentClustering.Snapshot(members)
+        best = 0
+        best_dist = math.inf
+        for i in range(len(ids)):
+            dist = math.hypot(xs[i] - center_x, ys[i] - center_y)
+            if dist < best_dist:
+                best_dist = dist
+                best = i
+        return ids[best]
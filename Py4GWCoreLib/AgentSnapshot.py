@@ -0,0 +1,476 @@
+"""
+Agent Snapshot - columnar per-frame copy of agent state with a fused query engine.
+
+Targeting helpers used to narrow the enemy array through three to five chained
+AgentArray.Filter.ByCondition passes (distance, alive, not-self, aggressive,
+the helper's own flag) and then sort the survivors by distance, resolving the
+same agents through Agent.* accessors on every pass. HeroAI calls several of
+those helpers per skill slot per tick.
+
+This module reads every agent once per frame (Draw PreUpdate, right after the
+system shared memory and the agent caches are refreshed) into flat columns
+indexed by row. AgentQuery then combines all filters with a single reduction
+(nearest / lowest / highest) into one loop over the rows of a category, so
+every targeting variant costs one pass over plain Python lists.
+
+Usage:
+    ```python
+    from Py4GWCoreLib.AgentSnapshot import AgentSnapshot
+
+    player_pos = Player.GetXY()
+
+    # nearest hexed enemy within spellcast range
+    target = (AgentSnapshot.Query("enemy")
+              .InRange(player_pos, Range.Spellcast.value)
+              .Alive()
+              .Has("hexed")
+              .Nearest(player_pos))
+
+    # lowest health enemy, closest one on ties
+    target = AgentSnapshot.Query("enemy").Alive().Lowest("hp", player_pos)
+
+    # plain filtered list in category order
+    casters = AgentSnapshot.Query("enemy").Alive().Where(Agent.IsCaster).ToList()
+    ```
+"""
+
+import math
+from typing import Callable, Iterable
+
+
+# category name -> AgentArraySHMemWrapper getter
+_CATEGORY_GETTERS: dict[str, str] = {
+    "all": "get_all_array",
+    "ally": "get_ally_array",
+    "neutral": "get_neutral_array",
+    "enemy": "get_enemy_array",
+    "spirit_pet": "get_spirit_pet_array",
+    "minion": "get_minion_array",
+    "npc_minipet": "get_npc_minipet_array",
+    "living": "get_living_array",
+    "item": "get_item_array",
+    "owned_item": "get_owned_item_array",
+    "gadget": "get_gadget_array",
+    "dead_ally": "get_dead_ally_array",
+    "dead_enemy": "get_dead_enemy_array",
+}
+
+# boolean columns usable with AgentQuery.Has / AgentQuery.Lacks
+FLAG_COLUMNS: tuple[str, ...] = (
+    "living",
+    "alive",
+    "casting",
+    "attacking",
+    "aggressive",
+    "moving",
+    "knocked_down",
+    "hexed",
+    "degen_hexed",
+    "enchanted",
+    "conditioned",
+    "bleeding",
+    "poisoned",
+    "crippled",
+    "deep_wounded",
+    "weapon_spelled",
+)
+
+# numeric columns usable with AgentQuery.Lowest / AgentQuery.Highest
+VALUE_COLUMNS: tuple[str, ...] = (
+    "hp",
+    "max_hp",
+    "energy",
+    "allegiance",
+    "model_id",
+    "casting_skill",
+    "weapon_type",
+)
+
+
+class AgentColumns:
+    """
+    Flat per-agent columns of one frame.
+
+    Row `r` of every column describes agent `ids[r]`; `row_of` maps agent ids
+    back to rows. Non living agents (items, gadgets) keep their position and
+    report False / 0 everywhere else.
+    """
+
+    __slots__ = (
+        "ids", "row_of", "x", "y",
+        "hp", "max_hp", "energy", "allegiance", "model_id", "casting_skill", "weapon_type",
+        *FLAG_COLUMNS,
+        "_wrapper", "_category_rows",
+    )
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.ids: list[int] = []
+        self.row_of: dict[int, int] = {}
+        self.x: list[float] = []
+        self.y: list[float] = []
+        for name in VALUE_COLUMNS:
+            setattr(self, name, [])
+        for name in FLAG_COLUMNS:
+            setattr(self, name, [])
+        self._wrapper = None
+        self._category_rows: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def build(self, wrapper) -> None:
+        """Fill the columns from an AgentArraySHMemWrapper snapshot."""
+        from .native_src.context.AgentContext import AgentArray as AgentArrayContext
+
+        self.clear()
+        self._wrapper = wrapper
+        if wrapper is None:
+            return
+
+        ids = self.ids
+        row_of = self.row_of
+        xs = self.x
+        ys = self.y
+        hp_col = self.hp
+        max_hp_col = self.max_hp
+        energy_col = self.energy
+        allegiance_col = self.allegiance
+        model_col = self.model_id
+        skill_col = self.casting_skill
+        weapon_col = self.weapon_type
+        living_col = self.living
+        alive_col = self.alive
+        casting_col = self.casting
+        attacking_col = self.attacking
+        aggressive_col = self.aggressive
+        moving_col = self.moving
+        knocked_col = self.knocked_down
+        hexed_col = self.hexed
+        degen_col = self.degen_hexed
+        enchanted_col = self.enchanted
+        conditioned_col = self.conditioned
+        bleeding_col = self.bleeding
+        poisoned_col = self.poisoned
+        crippled_col = self.crippled
+        deep_col = self.deep_wounded
+        spelled_col = self.weapon_spelled
+
+        for agent_id in wrapper.to_int_list():
+            agent = AgentArrayContext.GetAgentByID(agent_id)
+            if agent is None:
+                continue
+            row_of[agent_id] = len(ids)
+            ids.append(agent_id)
+            pos = agent.pos
+            xs.append(pos.x)
+            ys.append(pos.y)
+
+            living = agent.GetAsAgentLiving()
+            if living is None:
+                hp_col.append(0.0)
+                max_hp_col.append(0)
+                energy_col.append(0.0)
+                allegiance_col.append(0)
+                model_col.append(0)
+                skill_col.append(0)
+                weapon_col.append(0)
+                for column in (living_col, alive_col, casting_col, attacking_col, aggressive_col,
+                               moving_col, knocked_col, hexed_col, degen_col, enchanted_col,
+                               conditioned_col, bleeding_col, poisoned_col, crippled_col,
+                               deep_col, spelled_col):
+                    column.append(False)
+                continue
+
+            # same bit tests as the AgentLivingStruct properties, read once per agent
+            hp = living.hp
+            effects = living.effects
+            type_map = living.type_map
+            model_state = living.model_state
+            casting = model_state == 65 or model_state == 581
+            attacking = model_state == 96 or model_state == 1088 or model_state == 1120
+
+            hp_col.append(hp)
+            max_hp_col.append(living.max_hp)
+            energy_col.append(living.energy)
+            allegiance_col.append(living.allegiance)
+            model_col.append(living.player_number)
+            skill_col.append(living.skill if casting else 0)
+            weapon_col.append(living.weapon_type)
+            living_col.append(True)
+            alive_col.append(
+                not (effects & 0x0010) and not (type_map & 0x0008) and hp >= 0.01
+            )
+            casting_col.append(casting)
+            attacking_col.append(attacking)
+            aggressive_col.append(casting or attacking)
+            moving_col.append(model_state == 12 or model_state == 76 or model_state == 204)
+            knocked_col.append(model_state == 1104)
+            hexed_col.append((effects & 0x0800) != 0)
+            degen_col.append((effects & 0x0400) != 0)
+            enchanted_col.append((effects & 0x0080) != 0)
+            conditioned_col.append((effects & 0x0002) != 0)
+            bleeding_col.append((effects & 0x0001) != 0)
+            poisoned_col.append((effects & 0x0040) != 0)
+            crippled_col.append((effects & 0x000A) == 0x000A)
+            deep_col.append((effects & 0x0020) != 0)
+            spelled_col.append((effects & 0x8000) != 0)
+
+    def rows(self, category: str | None = None) -> list[int]:
+        """
+        Rows of a shared memory category ("enemy", "ally", ...), in category order.
+
+        None returns every row. Agents listed in the category but missing from
+        the snapshot are dropped.
+        """
+        if category is None:
+            return list(range(len(self.ids)))
+        cached = self._category_rows.get(category)
+        if cached is not None:
+            return cached
+        getter = _CATEGORY_GETTERS.get(category)
+        if getter is None:
+            raise ValueError(f"Unknown agent category: {category}")
+        row_of = self.row_of
+        rows: list[int] = []
+        if self._wrapper is not None:
+            for agent_id in getattr(self._wrapper, getter)():
+                row = row_of.get(agent_id)
+                if row is not None:
+                    rows.append(row)
+        self._category_rows[category] = rows
+        return rows
+
+    def rows_of(self, agent_array: Iterable[int]) -> list[int]:
+        """Rows of arbitrary agent ids, in the given order."""
+        row_of = self.row_of
+        return [row for row in (row_of.get(agent_id) for agent_id in agent_array) if row is not None]
+
+
+class AgentQuery:
+    """
+    Lazily evaluated filter chain over AgentColumns rows.
+
+    Filters only record what to test; the terminal call (ToList, First,
+    Nearest, Lowest, Highest, Count) runs one loop that applies the distance
+    test, then the flag columns, then excluded ids, then the Python
+    predicates, in that order, and reduces on the fly.
+    """
+
+    def __init__(self, columns: AgentColumns, rows: list[int]):
+        self._columns = columns
+        self._rows = rows
+        self._center: tuple[float, float] | None = None
+        self._range_sq = math.inf
+        self._required: list[list[bool]] = []
+        self._forbidden: list[list[bool]] = []
+        self._excluded: set[int] = set()
+        self._predicates: list[Callable[[int], bool]] = []
+
+    def InRange(self, pos, max_distance: float) -> "AgentQuery":
+        """Keep agents within `max_distance` of `pos` (inclusive)."""
+        self._center = (pos[0], pos[1])
+        self._range_sq = max_distance * max_distance if max_distance >= 0 else -1.0
+        return self
+
+    def Alive(self) -> "AgentQuery":
+        """Keep living, alive agents (same rule as Agent.IsAlive)."""
+        self._required.append(self._columns.alive)
+        return self
+
+    def Has(self, *flags: str) -> "AgentQuery":
+        """Keep agents whose flag columns are all True, e.g. Has("casting")."""
+        for flag in flags:
+            self._required.append(self._flag(flag))
+        return self
+
+    def Lacks(self, *flags: str) -> "AgentQuery":
+        """Keep agents whose flag columns are all False."""
+        for flag in flags:
+            self._forbidden.append(self._flag(flag))
+        return self
+
+    def Exclude(self, *agent_ids: int) -> "AgentQuery":
+        self._excluded.update(agent_ids)
+        return self
+
+    def Where(self, predicate: Callable[[int], bool]) -> "AgentQuery":
+        """Keep agents for which `predicate(agent_id)` is truthy; evaluated after the column filters."""
+        self._predicates.append(predicate)
+        return self
+
+    def _flag(self, name: str) -> list[bool]:
+        if name not in FLAG_COLUMNS:
+            raise ValueError(f"Unknown agent flag column: {name}")
+        return getattr(self._columns, name)
+
+    def _value(self, name: str) -> list:
+        if name not in VALUE_COLUMNS:
+            raise ValueError(f"Unknown agent value column: {name}")
+        return getattr(self._columns, name)
+
+    def _iter_rows(self):
+        columns = self._columns
+        ids = columns.ids
+        xs = columns.x
+        ys = columns.y
+        center = self._center
+        cx, cy = center if center is not None else (0.0, 0.0)
+        range_sq = self._range_sq
+        required = self._required
+        forbidden = self._forbidden
+        excluded = self._excluded
+        predicates = self._predicates
+
+        for row in self._rows:
+            if center is not None:
+                dx = xs[row] - cx
+                dy = ys[row] - cy
+                if dx * dx + dy * dy > range_sq:
+                    continue
+            rejected = False
+            for column in required:
+                if not column[row]:
+                    rejected = True
+                    break
+            if rejected:
+                continue
+            for column in forbidden:
+                if column[row]:
+                    rejected = True
+                    break
+            if rejected:
+                continue
+            agent_id = ids[row]
+            if agent_id in excluded:
+                continue
+            for predicate in predicates:
+                if not predicate(agent_id):
+                    rejected = True
+                    break
+            if rejected:
+                continue
+            yield row
+
+    def ToList(self) -> list[int]:
+        """Matching agent ids, in source order."""
+        ids = self._columns.ids
+        return [ids[row] for row in self._iter_rows()]
+
+    def First(self) -> int:
+        """First matching agent id in source order, or 0."""
+        for row in self._iter_rows():
+            return self._columns.ids[row]
+        return 0
+
+    def Count(self) -> int:
+        return sum(1 for _ in self._iter_rows())
+
+    def Nearest(self, pos) -> int:
+        """Matching agent closest to `pos`, or 0. Ties keep source order."""
+        xs = self._columns.x
+        ys = self._columns.y
+        px, py = pos[0], pos[1]
+        best_row = -1
+        best = math.inf
+        for row in self._iter_rows():
+            dx = xs[row] - px
+            dy = ys[row] - py
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < best:
+                best = dist_sq
+                best_row = row
+        return self._columns.ids[best_row] if best_row >= 0 else 0
+
+    def Lowest(self, column: str, pos=None) -> int:
+        """
+        Matching agent with the smallest `column` value, or 0.
+
+        With `pos`, ties are broken by distance to it; remaining ties keep source order.
+        """
+        return self._reduce(self._value(column), 1.0, pos)
+
+    def Highest(self, column: str, pos=None) -> int:
+        """Matching agent with the largest `column` value, or 0. Ties as in Lowest."""
+        return self._reduce(self._value(column), -1.0, pos)
+
+    def _reduce(self, values: list, sign: float, pos) -> int:
+        xs = self._columns.x
+        ys = self._columns.y
+        px, py = (pos[0], pos[1]) if pos is not None else (0.0, 0.0)
+        best_row = -1
+        best_key = (math.inf, math.inf)
+        for row in self._iter_rows():
+            if pos is not None:
+                dx = xs[row] - px
+                dy = ys[row] - py
+                key = (sign * values[row], dx * dx + dy * dy)
+            else:
+                key = (sign * values[row], 0.0)
+            if key < best_key:
+                best_key = key
+                best_row = row
+        return self._columns.ids[best_row] if best_row >= 0 else 0
+
+
+class AgentSnapshot:
+    """
+    Frame-scoped columnar agent snapshot.
+
+    Rebuilt in Draw PreUpdate once enabled, and lazily on the first access
+    after SystemShaMemMgr publishes a new agent array otherwise.
+    """
+
+    _columns: AgentColumns = AgentColumns()
+    _source: object | None = None
+
+    @staticmethod
+    def _refresh() -> None:
+        from .native_src.ShMem.SysShaMem import SystemShaMemMgr
+
+        wrapper = SystemShaMemMgr.get_agent_array_wrapper()
+        if wrapper is not AgentSnapshot._source or wrapper is None:
+            AgentSnapshot._columns.build(wrapper)
+            AgentSnapshot._source = wrapper
+
+    @staticmethod
+    def enable() -> None:
+        import PyCallback
+        PyCallback.PyCallback.Register(
+            "AgentSnapshot.Refresh",
+            PyCallback.Phase.PreUpdate,
+            AgentSnapshot._refresh,
+            priority=8,
+            context=PyCallback.Context.Draw
+        )
+
+    @staticmethod
+    def Get() -> AgentColumns:
+        """Columns for the current frame (empty when no snapshot is available)."""
+        AgentSnapshot._refresh()
+        return AgentSnapshot._columns
+
+    @staticmethod
+    def Invalidate() -> None:
+        """Force a rebuild on the next access."""
+        AgentSnapshot._source = None
+
+    @staticmethod
+    def Query(category: str | None = "all", agent_array: list[int] | None = None) -> AgentQuery:
+        """
+        Start a query over a shared memory category, or over `agent_array` when given.
+
+        Args:
+            category (str | None): One of "all", "ally", "neutral", "enemy", "spirit_pet",
+                "minion", "npc_minipet", "living", "item", "owned_item", "gadget",
+                "dead_ally", "dead_enemy"; None for every snapshot row.
+            agent_array (list[int] | None): Explicit agent ids, overrides `category`.
+        """
+        columns = AgentSnapshot.Get()
+        rows = columns.rows_of(agent_array) if agent_array is not None else columns.rows(category)
+        return AgentQuery(columns, rows)
+
+
+AgentSnapshot.enable()
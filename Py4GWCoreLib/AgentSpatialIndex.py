@@ -0,0 +1,306 @@
+"""
+Agent Spatial Index - per-frame uniform grid over agent positions.
+
+AgentArray distance helpers used to resolve every agent through Agent.GetXY on
+every call. Targeting code calls them many times per frame with the same agent
+arrays, so this module snapshots the positions of every agent in the shared
+memory agent array once per frame and buckets them into a uniform grid.
+
+The index is rebuilt lazily: the first query after SystemShaMemMgr publishes a
+new AgentArraySHMemWrapper (once per Draw PreUpdate) re-reads the positions,
+every later query in the same frame reuses them.
+
+Usage:
+    ```python
+    from Py4GWCoreLib.AgentSpatialIndex import AgentSpatialIndex
+
+    # all agents within spellcast range of the player
+    ids = AgentSpatialIndex.QueryRadius(Player.GetXY(), Range.Spellcast.value)
+
+    # the 3 agents closest to a point, restricted to enemies
+    ids = AgentSpatialIndex.QueryNearest((x, y), 3, AgentArray.GetEnemyArray())
+
+    # everything inside a rectangle
+    ids = AgentSpatialIndex.QueryRect(min_x, min_y, max_x, max_y)
+    ```
+"""
+
+import heapq
+import math
+from typing import Iterable
+
+
+class SpatialGrid:
+    """Uniform bucket grid over 2D points keyed by integer ids."""
+
+    def __init__(self, cell_size: float = 500.0):
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._positions: dict[int, tuple[float, float]] = {}
+        self._min_cx = self._min_cy = 0
+        self._max_cx = self._max_cy = -1
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._positions
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._positions.clear()
+        self._min_cx = self._min_cy = 0
+        self._max_cx = self._max_cy = -1
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return int(math.floor(x * self._inv_cell)), int(math.floor(y * self._inv_cell))
+
+    def insert(self, key: int, x: float, y: float) -> None:
+        cx, cy = self._cell_of(x, y)
+        if not self._positions:
+            self._min_cx = self._max_cx = cx
+            self._min_cy = self._max_cy = cy
+        else:
+            if cx < self._min_cx: self._min_cx = cx
+            if cx > self._max_cx: self._max_cx = cx
+            if cy < self._min_cy: self._min_cy = cy
+            if cy > self._max_cy: self._max_cy = cy
+
+        self._positions[key] = (x, y)
+        bucket = self._cells.get((cx, cy))
+        if bucket is None:
+            self._cells[(cx, cy)] = [key]
+        else:
+            bucket.append(key)
+
+    def build(self, points: Iterable[tuple[int, float, float]]) -> None:
+        """Replace the grid contents with (key, x, y) points."""
+        self.clear()
+        for key, x, y in points:
+            self.insert(key, x, y)
+
+    def get_position(self, key: int) -> tuple[float, float] | None:
+        return self._positions.get(key)
+
+    def positions(self) -> dict[int, tuple[float, float]]:
+        return self._positions
+
+    def cell_span(self, radius: float) -> int:
+        """Number of cells a radius query of this size has to visit."""
+        side = int(2.0 * radius * self._inv_cell) + 2
+        return side * side
+
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        """Return keys whose position lies inside the axis-aligned rectangle (inclusive)."""
+        if not self._positions:
+            return []
+        cx0, cy0 = self._cell_of(min_x, min_y)
+        cx1, cy1 = self._cell_of(max_x, max_y)
+        cx0 = max(cx0, self._min_cx)
+        cy0 = max(cy0, self._min_cy)
+        cx1 = min(cx1, self._max_cx)
+        cy1 = min(cy1, self._max_cy)
+
+        cells = self._cells
+        positions = self._positions
+        result: list[int] = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key in bucket:
+                    px, py = positions[key]
+                    if min_x <= px <= max_x and min_y <= py <= max_y:
+                        result.append(key)
+        return result
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[int]:
+        """Return keys within `radius` of (x, y), in no particular order."""
+        if not self._positions or radius < 0:
+            return []
+        cx0, cy0 = self._cell_of(x - radius, y - radius)
+        cx1, cy1 = self._cell_of(x + radius, y + radius)
+        cx0 = max(cx0, self._min_cx)
+        cy0 = max(cy0, self._min_cy)
+        cx1 = min(cx1, self._max_cx)
+        cy1 = min(cy1, self._max_cy)
+
+        radius_sq = radius * radius
+        cells = self._cells
+        positions = self._positions
+        result: list[int] = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key in bucket:
+                    px, py = positions[key]
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(key)
+        return result
+
+    def query_nearest(self, x: float, y: float, k: int = 1,
+                      max_distance: float = math.inf,
+                      allowed: set[int] | None = None) -> list[int]:
+        """
+        Return up to `k` keys nearest to (x, y), closest first.
+
+        Searches outward ring by ring and stops as soon as the k-th best
+        candidate is closer than anything an unvisited ring could hold.
+        """
+        if k <= 0 or not self._positions:
+            return []
+        qx, qy = self._cell_of(x, y)
+        cells = self._cells
+        positions = self._positions
+        max_distance_sq = max_distance * max_distance
+
+        # farthest ring that can still contain a point of the grid
+        max_ring = max(
+            abs(qx - self._min_cx), abs(qx - self._max_cx),
+            abs(qy - self._min_cy), abs(qy - self._max_cy),
+        )
+
+        candidates: list[tuple[float, int]] = []
+        ring = 0
+        while ring <= max_ring:
+            if ring == 0:
+                ring_cells = [(qx, qy)]
+            else:
+                ring_cells = []
+                for cx in range(qx - ring, qx + ring + 1):
+                    ring_cells.append((cx, qy - ring))
+                    ring_cells.append((cx, qy + ring))
+                for cy in range(qy - ring + 1, qy + ring):
+                    ring_cells.append((qx - ring, cy))
+                    ring_cells.append((qx + ring, cy))
+
+            for cell in ring_cells:
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for key in bucket:
+                    if allowed is not None and key not in allowed:
+                        continue
+                    px, py = positions[key]
+                    dx = px - x
+                    dy = py - y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq <= max_distance_sq:
+                        candidates.append((dist_sq, key))
+
+            # every point outside the visited square is at least this far away
+            covered = ring * self.cell_size
+            covered_sq = covered * covered
+            if covered_sq >= max_distance_sq:
+                break
+            if len(candidates) >= k:
+                kth = heapq.nsmallest(k, candidates)[-1][0]
+                if kth <= covered_sq:
+                    break
+            ring += 1
+
+        return [key for _, key in heapq.nsmallest(k, candidates)]
+
+
+class AgentSpatialIndex:
+    """
+    Frame-scoped spatial index over the shared memory agent array.
+
+    All methods are static; the grid is rebuilt on the first query after the
+    system shared memory publishes a new snapshot.
+    """
+
+    CELL_SIZE: float = 500.0
+
+    _grid: SpatialGrid = SpatialGrid(CELL_SIZE)
+    _source: object | None = None
+
+    @staticmethod
+    def _rebuild(wrapper) -> None:
+        from .native_src.context.AgentContext import AgentArray as AgentArrayContext
+
+        grid = AgentSpatialIndex._grid
+        grid.clear()
+        for agent_id in wrapper.to_int_list():
+            agent = AgentArrayContext.GetAgentByID(agent_id)
+            if agent is None:
+                continue
+            pos = agent.pos
+            grid.insert(agent_id, pos.x, pos.y)
+
+    @staticmethod
+    def GetGrid() -> SpatialGrid | None:
+        """Return the grid for the current frame, or None when no snapshot is available."""
+        from .native_src.ShMem.SysShaMem import SystemShaMemMgr
+
+        wrapper = SystemShaMemMgr.get_agent_array_wrapper()
+        if wrapper is None:
+            AgentSpatialIndex._source = None
+            AgentSpatialIndex._grid.clear()
+            return None
+        if wrapper is not AgentSpatialIndex._source:
+            AgentSpatialIndex._rebuild(wrapper)
+            AgentSpatialIndex._source = wrapper
+        return AgentSpatialIndex._grid
+
+    @staticmethod
+    def Invalidate() -> None:
+        """Force a rebuild on the next query."""
+        AgentSpatialIndex._source = None
+
+    @staticmethod
+    def GetXY(agent_id: int) -> tuple[float, float] | None:
+        """Position captured for this frame, or None if the agent is not indexed."""
+        grid = AgentSpatialIndex.GetGrid()
+        if grid is None:
+            return None
+        return grid.get_position(agent_id)
+
+    @staticmethod
+    def QueryRadius(pos, radius: float, agent_array: list[int] | None = None) -> list[int]:
+        """
+        Agents within `radius` of `pos`.
+
+        Args:
+            pos (tuple[float, float]): Query point.
+            radius (float): Search radius.
+            agent_array (list[int] | None): Optional subset to restrict the result to.
+                When given, the result keeps the order of `agent_array`.
+        """
+        grid = AgentSpatialIndex.GetGrid()
+        if grid is None:
+            return []
+        found = grid.query_radius(pos[0], pos[1], radius)
+        if agent_array is None:
+            return found
+        found_set = set(found)
+        return [agent_id for agent_id in agent_array if agent_id in found_set]
+
+    @staticmethod
+    def QueryRect(min_x: float, min_y: float, max_x: float, max_y: float,
+                  agent_array: list[int] | None = None) -> list[int]:
+        """Agents inside the given rectangle, optionally restricted to `agent_array`."""
+        grid = AgentSpatialIndex.GetGrid()
+        if grid is None:
+            return []
+        found = grid.query_rect(min_x, min_y, max_x, max_y)
+        if agent_array is None:
+            return found
+        found_set = set(found)
+        return [agent_id for agent_id in agent_array if agent_id in found_set]
+
+    @staticmethod
+    def QueryNearest(pos, k: int = 1, agent_array: list[int] | None = None,
+                     max_distance: float = math.inf) -> list[int]:
+        """Up to `k` agents closest to `pos`, closest first, optionally restricted to `agent_array`."""
+        grid = AgentSpatialIndex.GetGrid()
+        if grid is None:
+            return []
+        allowed = set(agent_array) if agent_array is not None else None
+        return grid.query_nearest(pos[0], pos[1], k, max_distance, allowed)
@@ -565,36 +565,9 @@ class BuildMgr:
         if not enemy_array:
             return 0
 
-        cluster_radius_sq = cluster_radius ** 2
+        from Py4GWCoreLib.AgentClustering import AgentClustering
 
-        def is_in_radius(agent1: int, agent2: int) -> bool:
-            x1, y1 = Agent.GetXY(agent1)
-            x2, y2 = Agent.GetXY(agent2)
-            dx, dy = x1 - x2, y1 - y2
-            return (dx * dx + dy * dy) <= cluster_radius_sq
-
-        unvisited = set(enemy_array)
-        clusters: list[list[int]] = []
-
-        while unvisited:
-            current = unvisited.pop()
-            cluster = [current]
-            stack = [current]
-
-            while stack:
-                node = stack.pop()
-                neighbors = [agent_id for agent_id in list(unvisited) if is_in_radius(node, agent_id)]
-                for neighbor in neighbors:
-                    unvisited.remove(neighbor)
-                    cluster.append(neighbor)
-                    stack.append(neighbor)
-
-            clusters.append(cluster)
-
-        if not clusters:
-            return 0
-
-        largest_cluster = max(clusters, key=len)
+        largest_cluster, _ = AgentClustering.LargestCluster(enemy_array, cluster_radius)
 
         if preferred_condition is not None:
             preferred_targets = [agent_id for agent_id in largest_cluster if preferred_condition(agent_id)]
@@ -205,6 +205,20 @@ _stances: dict = {}    # agent_id -> (skill_id, start, end)
 _tracked_agents: set = set()  # agent IDs that receive actual recharge packets from server
 _callbacks: dict = {}  # event_name -> [callbacks]
 
+# Per-agent state index, kept in sync with _events by _process().
+# Entries older than the oldest buffered event are dropped, like the events they came from.
+_casts: dict = {}           # agent_id -> [skill_id, target_id, start, duration, has_duration]
+_attacks: dict = {}         # agent_id -> (ts, target_id, is_attacking) of last attack start/stop
+_knockdowns: dict = {}      # agent_id -> (ts, duration_seconds) of last knockdown
+_pending_skills: dict = {}  # agent_id -> (ts, skill_id) of last activation
+_instance_key: tuple = (0, 0)  # (map_id, instance uptime) seen by the last update()
+
+_CAST_END_TYPES = frozenset((EventType.SKILL_FINISHED, EventType.ATTACK_SKILL_FINISHED,
+                             EventType.SKILL_STOPPED, EventType.ATTACK_SKILL_STOPPED,
+                             EventType.INTERRUPTED))
+_ATTACK_END_TYPES = frozenset((EventType.ATTACK_STOPPED, EventType.MELEE_ATTACK_FINISHED,
+                               EventType.ATTACK_SKILL_FINISHED, EventType.ATTACK_SKILL_STOPPED))
+
 
 def _ensure_init():
     """Initialize on first use."""
@@ -450,6 +464,7 @@ class CombatEvents:
     def clear_events():
         """Clear the event log."""
         _events.clear()
+        CombatEvents._clear_index()
 
     @staticmethod
     def get_recent_damage(count: int = 20) -> List[Tuple[int, int, int, float, int, bool]]:
@@ -542,30 +557,12 @@ class CombatEvents:
     @staticmethod
     def _find_cast(agent_id: int) -> Optional[Tuple[int, int, int, float]]:
         """Find active cast. Returns (skill, target, start, duration) or None."""
+        cast = _casts.get(agent_id)
+        if cast is None:
+            return None
+        skill_id, target_id, cast_start, duration, _ = cast
         now = _get_tick_count()
-        cast_start = None
-        skill_id = 0
-        target_id = 0
-        duration = 0.0
-
-        for ts, etype, agent, val, target, fval in reversed(list(_events)):
-            if agent != agent_id:
-                continue
-            if now - ts > 30000:
-                break
-            if etype in (EventType.SKILL_FINISHED, EventType.ATTACK_SKILL_FINISHED,
-                        EventType.SKILL_STOPPED, EventType.ATTACK_SKILL_STOPPED,
-                        EventType.INTERRUPTED):
-                return None
-            if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED):
-                cast_start = ts
-                skill_id = val
-                target_id = target
-                break
-            if etype == EventType.CASTTIME:
-                duration = fval
-
-        if cast_start is None:
+        if now - cast_start > 30000:
             return None
         if duration > 0 and now - cast_start > duration * 1000:
             return None
@@ -574,43 +571,85 @@ class CombatEvents:
     @staticmethod
     def _find_attack(agent_id: int) -> Optional[int]:
         """Find active attack. Returns target_id or None."""
-        now = _get_tick_count()
-        for ts, etype, agent, _, target, _ in reversed(list(_events)):
-            if agent != agent_id:
-                continue
-            if now - ts > 10000:
-                break
-            if etype in (EventType.ATTACK_STOPPED, EventType.MELEE_ATTACK_FINISHED,
-                        EventType.ATTACK_SKILL_FINISHED, EventType.ATTACK_SKILL_STOPPED):
-                return None
-            if etype in (EventType.ATTACK_STARTED, EventType.ATTACK_SKILL_ACTIVATED):
-                return target
-        return None
+        attack = _attacks.get(agent_id)
+        if attack is None:
+            return None
+        ts, target, is_attacking = attack
+        if not is_attacking or _get_tick_count() - ts > 10000:
+            return None
+        return target
 
     @staticmethod
     def _find_knockdown(agent_id: int) -> Optional[Tuple[int, float]]:
         """Find active knockdown. Returns (start, duration) or None."""
-        now = _get_tick_count()
-        for ts, etype, agent, _, _, fval in reversed(list(_events)):
-            if agent != agent_id:
-                continue
-            if now - ts > 10000:
-                break
-            if etype == EventType.KNOCKED_DOWN:
-                if now - ts < fval * 1000:
-                    return (ts, fval)
-                return None
-        return None
+        kd = _knockdowns.get(agent_id)
+        if kd is None:
+            return None
+        ts, fval = kd
+        elapsed = _get_tick_count() - ts
+        if elapsed > 10000 or elapsed >= fval * 1000:
+            return None
+        return kd
 
     @staticmethod
     def _get_pending_skill(agent_id: int) -> int:
         """Get skill being cast."""
-        for _, etype, agent, val, _, _ in reversed(list(_events)):
-            if agent != agent_id:
-                continue
-            if etype in (EventType.SKILL_ACTIVATED, EventType.ATTACK_SKILL_ACTIVATED, EventType.SKILL_ACTIVATE_PACKET):
-                return val
-        return 0
+        pending = _pending_skills.get(agent_id)
+        return pending[1] if pending is not None else 0
+
+    @staticmethod
+    def _index(ts: int, etype: int, agent: int, val: int, target: int, fval: float):
+        """Update the per-agent state index with a new event."""
+        if etype == EventType.SKILL_ACTIVATED or etype == EventType.ATTACK_SKILL_ACTIVATED:
+            _casts[agent] = [val, target, ts, 0.0, False]
+            _pending_skills[agent] = (ts, val)
+        elif etype == EventType.SKILL_ACTIVATE_PACKET:
+            _pending_skills[agent] = (ts, val)
+        elif etype == EventType.CASTTIME:
+            cast = _casts.get(agent)
+            # The first cast time reported after the activation is the one that applies
+            if cast is not None and not cast[4]:
+                cast[3] = fval
+                cast[4] = True
+        elif etype in _CAST_END_TYPES:
+            _casts.pop(agent, None)
+        elif etype == EventType.KNOCKED_DOWN:
+            _knockdowns[agent] = (ts, fval)
+
+        if etype == EventType.ATTACK_STARTED or etype == EventType.ATTACK_SKILL_ACTIVATED:
+            _attacks[agent] = (ts, target, True)
+        elif etype in _ATTACK_END_TYPES:
+            _attacks[agent] = (ts, 0, False)
+
+    @staticmethod
+    def _clear_index():
+        """Drop the per-agent state index (agent IDs are reused by the next instance)."""
+        _casts.clear()
+        _attacks.clear()
+        _knockdowns.clear()
+        _pending_skills.clear()
+
+    @staticmethod
+    def _prune_index(oldest_ts: int):
+        """Drop index entries from events that already fell out of the _events window."""
+        for agent in [a for a, cast in _casts.items() if cast[2] < oldest_ts]:
+            del _casts[agent]
+        for index in (_attacks, _knockdowns, _pending_skills):
+            for agent in [a for a, entry in index.items() if entry[0] < oldest_ts]:
+                del index[agent]
+
+    @staticmethod
+    def _check_instance():
+        """Drop the per-agent state index when the map or instance changes."""
+        global _instance_key
+        from .Map import Map
+
+        map_id = Map.GetMapID()
+        uptime = Map.GetInstanceUptime()
+        last_map_id, last_uptime = _instance_key
+        if map_id != last_map_id or uptime < last_uptime:
+            CombatEvents._clear_index()
+        _instance_key = (map_id, uptime)
 
     # ==========================================================================
     # Internal: Update (called each frame)
@@ -623,8 +662,13 @@ class CombatEvents:
         if not _queue:
             return
 
-        for event in _queue.GetAndClearEvents():
+        CombatEvents._check_instance()
+
+        events = _queue.GetAndClearEvents()
+        for event in events:
             CombatEvents._process(event)
+        if events and len(_events) == _events.maxlen:
+            CombatEvents._prune_index(_events[0][0])
 
         # Check expired stances
         now = _get_tick_count()
@@ -643,6 +687,7 @@ class CombatEvents:
         fval = event.float_value
 
         _events.append((ts, etype, agent, val, target, fval))
+        CombatEvents._index(ts, etype, agent, val, target, fval)
 
         # Fire callbacks based on event type
         if etype == EventType.SKILL_ACTIVATED or etype == EventType.ATTACK_SKILL_ACTIVATED:
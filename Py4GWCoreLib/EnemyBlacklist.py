@@ -1,3 +1,5 @@
+import time
+
 import PyImGui
 
 from Py4GWCoreLib.IniManager import IniManager
@@ -18,15 +20,27 @@ class EnemyBlacklist:
     completely ignored by the combat system (no targeting, no aggro detection).
 
     Persisted to Settings/Global/HeroAI/EnemyBlacklist.ini.
-    The IniHandler reloads the file whenever its mtime changes, so changes
-    made by any other game instance are picked up automatically on the next
-    call to contains() / get_all().
+    The file is compiled into in-memory sets; once per REFRESH_INTERVAL the
+    PreUpdate callback re-checks the file's mtime and recompiles, so changes
+    made by any other game instance are picked up within that interval.
+    is_blacklisted() verdicts are cached per agent id until the sets change or
+    the player changes map/instance (agent ids are reused across instances).
     """
 
+    REFRESH_INTERVAL: float = 1.0
+
     _instance = None
     _class_initialized = False
     _ini_key: str = ""
 
+    _model_ids: frozenset[int] = frozenset()
+    _names: frozenset[str] = frozenset()
+    _compiled: bool = False
+    _compiled_mtime: float = -1.0
+    _next_check: float = 0.0
+    _verdicts: dict[int, bool] = {}
+    _instance_key: tuple[int, int] = (0, 0)
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -51,11 +65,8 @@ class EnemyBlacklist:
         node = IniManager()._get_node(self.__class__._ini_key)
         return node.ini_handler if node else None
 
-    def _read(self) -> set[int]:
-        handler = self._handler()
-        if not handler:
-            return set()
-        raw = handler.read_key(_INI_SECTION, _INI_KEY, "")
+    @staticmethod
+    def _parse_ids(raw: str) -> set[int]:
         ids: set[int] = set()
         if raw.strip():
             for part in raw.split(","):
@@ -64,6 +75,24 @@ class EnemyBlacklist:
                     ids.add(int(part))
         return ids
 
+    @staticmethod
+    def _parse_names(raw: str) -> set[str]:
+        names: set[str] = set()
+        if raw.strip():
+            for part in raw.split("|"):
+                stripped = part.strip().lower()
+                if stripped:
+                    names.add(stripped)
+        return names
+
+    def _read(self) -> set[int]:
+        handler = self._handler()
+        if not handler:
+            return set()
+        # read-modify-write: never start from a throttled, possibly stale config
+        handler.reload(force=True)
+        return self._parse_ids(handler.read_key(_INI_SECTION, _INI_KEY, ""))
+
     def _write(self, ids: set[int]):
         handler = self._handler()
         if not handler:
@@ -71,19 +100,14 @@ class EnemyBlacklist:
         value = ",".join(str(m) for m in sorted(ids))
         handler.write_key(_INI_SECTION, _INI_KEY, value)
         handler.save(handler.config)
+        self._compile(handler)
 
     def _read_names(self) -> set[str]:
         handler = self._handler()
         if not handler:
             return set()
-        raw = handler.read_key(_INI_SECTION, _INI_KEY_NAMES, "")
-        names: set[str] = set()
-        if raw.strip():
-            for part in raw.split("|"):
-                stripped = part.strip().lower()
-                if stripped:
-                    names.add(stripped)
-        return names
+        handler.reload(force=True)
+        return self._parse_names(handler.read_key(_INI_SECTION, _INI_KEY_NAMES, ""))
 
     def _write_names(self, names: set[str]):
         handler = self._handler()
@@ -92,6 +116,71 @@ class EnemyBlacklist:
         value = "|".join(sorted(names))
         handler.write_key(_INI_SECTION, _INI_KEY_NAMES, value)
         handler.save(handler.config)
+        self._compile(handler)
+
+    # ------------------------------------------------------------------
+    # Compiled sets / verdict cache
+    # ------------------------------------------------------------------
+
+    def _compile(self, handler=None):
+        """Rebuild the in-memory sets from the INI and drop cached verdicts."""
+        cls = self.__class__
+        handler = handler or self._handler()
+        if not handler:
+            cls._model_ids = frozenset()
+            cls._names = frozenset()
+        else:
+            # read_key reloads the file if its mtime moved
+            cls._model_ids = frozenset(self._parse_ids(handler.read_key(_INI_SECTION, _INI_KEY, "")))
+            cls._names = frozenset(self._parse_names(handler.read_key(_INI_SECTION, _INI_KEY_NAMES, "")))
+            cls._compiled_mtime = handler.last_modified
+        cls._compiled = True
+        cls._verdicts.clear()
+
+    def _ensure_compiled(self):
+        if not self.__class__._compiled:
+            self._compile()
+
+    def refresh(self, force: bool = False):
+        """Recompile if the INI changed on disk; throttled to REFRESH_INTERVAL unless forced."""
+        cls = self.__class__
+        now = time.monotonic()
+        if not force and cls._compiled and now < cls._next_check:
+            return
+        cls._next_check = now + cls.REFRESH_INTERVAL
+        handler = self._handler()
+        if not handler:
+            self._compile(None)
+            return
+        handler.reload()
+        if force or not cls._compiled or handler.last_modified != cls._compiled_mtime:
+            self._compile(handler)
+
+    def _check_instance(self):
+        """Drop cached verdicts when the map or instance changes."""
+        from Py4GWCoreLib.Map import Map
+
+        cls = self.__class__
+        map_id = Map.GetMapID()
+        uptime = Map.GetInstanceUptime()
+        last_map_id, last_uptime = cls._instance_key
+        if map_id != last_map_id or uptime < last_uptime:
+            cls._verdicts.clear()
+        cls._instance_key = (map_id, uptime)
+
+    def _on_pre_update(self):
+        self._check_instance()
+        self.refresh()
+
+    @staticmethod
+    def enable():
+        import PyCallback
+        PyCallback.PyCallback.Register(
+            "EnemyBlacklist.Refresh",
+            PyCallback.Phase.PreUpdate,
+            lambda: EnemyBlacklist()._on_pre_update(),
+            priority=9
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -99,7 +188,8 @@ class EnemyBlacklist:
 
     def is_empty(self) -> bool:
         """True if neither model-ID list nor name list contains any entries."""
-        return not self._read() and not self._read_names()
+        self._ensure_compiled()
+        return not self._model_ids and not self._names
 
     def add(self, model_id: int):
         if model_id > 0:
@@ -113,10 +203,12 @@ class EnemyBlacklist:
         self._write(ids)
 
     def contains(self, model_id: int) -> bool:
-        return model_id in self._read()
+        self._ensure_compiled()
+        return model_id in self._model_ids
 
     def get_all(self) -> list[int]:
-        return sorted(self._read())
+        self._ensure_compiled()
+        return sorted(self._model_ids)
 
     def add_name(self, name: str):
         name = name.strip().lower()
@@ -131,20 +223,35 @@ class EnemyBlacklist:
         self._write_names(names)
 
     def get_all_names(self) -> list[str]:
-        return sorted(self._read_names())
+        self._ensure_compiled()
+        return sorted(self._names)
 
     def is_blacklisted(self, agent_id: int) -> bool:
         """Returns True if the agent should be ignored (by model ID or by name)."""
-        if Agent.GetModelID(agent_id) in self._read():
+        verdict = self._verdicts.get(agent_id)
+        if verdict is not None:
+            return verdict
+        self._ensure_compiled()
+
+        if Agent.GetModelID(agent_id) in self._model_ids:
+            self._verdicts[agent_id] = True
             return True
-        names = self._read_names()
+        names = self._names
         if names:
             agent_name = Agent.GetNameByID(agent_id)
-            if agent_name and agent_name.lower() in names:
+            if not agent_name:
+                # name not resolved yet, decide again next time
+                return False
+            if agent_name.lower() in names:
+                self._verdicts[agent_id] = True
                 return True
+        self._verdicts[agent_id] = False
         return False
 
 
+EnemyBlacklist.enable()
+
+
 # ------------------------------------------------------------------
 # UI — shared between HeroAI configure window and CB botting panel
 # ------------------------------------------------------------------
@@ -4,7 +4,8 @@ import Py4GW
 
 from Py4GWCoreLib.Py4GWcorelib import ThrottledTimer
 from Py4GWCoreLib import Bag
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import time
 from enum import Enum
 
@@ -39,6 +40,8 @@ class Bag_enum(Enum):
 
 class RawItemCache:
     _instance = None
+    # LRU bound of transitory_items (items looked up by id that are in no cached bag)
+    TRANSITORY_CACHE_SIZE = 256
 
     def __new__(cls, throttle: int = 75):
         if cls._instance is None:
@@ -53,7 +56,10 @@ class RawItemCache:
         
         self.throttle = throttle
         self.bags: Dict[int, PyInventory.Bag] = {}
-        self.transitory_items: Dict[int, PyItem.PyItem] = {}
+        self.transitory_items: "OrderedDict[int, PyItem.PyItem]" = OrderedDict()
+        # rebuilt on every refresh: item_id -> (bag, slot, item) and model_id -> item ids in bag order
+        self.items_by_id: Dict[int, Tuple[int, int, PyItem.PyItem]] = {}
+        self.item_ids_by_model: Dict[int, Tuple[int, ...]] = {}
         self.update_throttle = ThrottledTimer(throttle)
         self.map_valid = False
         self._initialized = True
@@ -61,6 +67,8 @@ class RawItemCache:
     def reset(self):
         self.bags.clear()
         self.transitory_items.clear()
+        self.items_by_id.clear()
+        self.item_ids_by_model.clear()
         self.update_throttle.Reset()
         self.map_valid = False
         
@@ -71,6 +79,8 @@ class RawItemCache:
 
         self.update_throttle.Reset()
         self.bags.clear()
+        items_by_id: Dict[int, Tuple[int, int, PyItem.PyItem]] = {}
+        item_ids_by_model: Dict[int, List[int]] = {}
 
         for bag in range(Bag_enum.Backpack.value, Bag_enum.Max.value):
             try:
@@ -79,6 +89,18 @@ class RawItemCache:
             except Exception:
                 continue  # Skip invalid bags
             
+            for item in bag_instance.GetItems():
+                item_id = item.item_id
+                items_by_id[item_id] = (bag, item.slot, item)
+                ids = item_ids_by_model.get(item.model_id)
+                if ids is None:
+                    item_ids_by_model[item.model_id] = [item_id]
+                else:
+                    ids.append(item_id)
+
+        self.items_by_id = items_by_id
+        self.item_ids_by_model = {model_id: tuple(ids) for model_id, ids in item_ids_by_model.items()}
+            
         # Clean up transitory items that no longer exist
         to_remove = []
         for item_id, item in self.transitory_items.items():
@@ -102,7 +124,13 @@ class RawItemCache:
 
         item = PyItem.PyItem(item_id)
         if item.item_id != 0:
-            self.transitory_items[item_id] = item
+            self._remember_transitory(item_id, item)
+            
+    def _remember_transitory(self, item_id: int, item: PyItem.PyItem):
+        self.transitory_items[item_id] = item
+        self.transitory_items.move_to_end(item_id)
+        while len(self.transitory_items) > RawItemCache.TRANSITORY_CACHE_SIZE:
+            self.transitory_items.popitem(last=False)
             
     def get_items(self, bag: int):
         """
@@ -168,24 +196,39 @@ class RawItemCache:
         return list(self.bags.values())
     
     def get_item_by_id(self, item_id: int):
-        for bag in self.bags.values():
-            item = bag.FindItemById(item_id)
-            if item:
-                return item
+        entry = self.items_by_id.get(item_id)
+        if entry is not None:
+            return entry[2]
         
         # Check transitory cache
         item = self.transitory_items.get(item_id)
         if item and item.item_id != 0:
+            self.transitory_items.move_to_end(item_id)
             return item
 
         # Attempt to create and cache it
         item = PyItem.PyItem(item_id)
         if item.item_id != 0:
-            self.transitory_items[item_id] = item
+            self._remember_transitory(item_id, item)
             return item
     
         return None  # Item not found
     
+    def get_item_location(self, item_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns (bag, slot) of the item as of the last refresh, or None if it is in no cached bag.
+        """
+        entry = self.items_by_id.get(item_id)
+        if entry is None:
+            return None
+        return entry[0], entry[1]
+    
+    def get_item_ids_by_model(self, model_id: int) -> Tuple[int, ...]:
+        """
+        Returns the IDs of all bagged items with the given model ID, in bag order.
+        """
+        return self.item_ids_by_model.get(model_id, ())
+    
 class ItemCache:
     def __init__(self, raw_item_array):
         self.raw_item_array:RawItemCache = raw_item_array
@@ -231,15 +274,8 @@ class ItemCache:
     
     def GetItemIdFromModelID(self, model_id):
         """Purpose: Retrieve the item ID from the model ID."""
-        bags = self.raw_item_array.get_all_bags()
-
-        for bag in bags:
-            for item in bag.GetItems():
-                # Check if the item's model ID matches the given model ID
-                if item.model_id == model_id:
-                    return item.item_id  # Return the item ID if a match is found
-
-        return 0  # Return 0 if no matching item is found
+        item_ids = self.raw_item_array.get_item_ids_by_model(model_id)
+        return item_ids[0] if item_ids else 0  # Return 0 if no matching item is found
     
     def GetItemByAgentID(self, agent_id: int):
         item = self.raw_item_array.get_item_by_id(agent_id)
@@ -97,6 +97,14 @@ class Py4GWSharedMemoryManager:
     
     def GetAccountData(self, index: int) -> AccountStruct:
         return self.GetAllAccounts().GetAccountData(index)
+
+    def GetAccountSnapshot(self, index: int) -> AccountStruct:
+        """Get an untorn, read-only copy of the slot at index."""
+        return self.GetAllAccounts().GetAccountSnapshot(index)
+
+    def GetVisibleSlotsSnapshot(self, accounts_only: bool = False, sort_results: bool = True) -> list[AccountStruct]:
+        """Get untorn, read-only copies of every visible slot."""
+        return self.GetAllAccounts().GetVisibleSlotsSnapshot(accounts_only=accounts_only, sort_results=sort_results)
             
     #region Messaging
     def GetAllMessages(self) -> list[tuple[int, SharedMessageStruct]]:
@@ -152,9 +160,13 @@ class Py4GWSharedMemoryManager:
     def ResetPlayerData(self, index):
         """Reset data for a specific player."""
         if 0 <= index < self.max_num_players:
-            player : AccountStruct = self.GetAccountData(index)
+            all_accounts = self.GetAllAccounts()
+            player : AccountStruct = all_accounts.GetAccountData(index)
+            all_accounts._begin_slot_write(index)
             player.reset()  # Reset all player fields to default values
             player.LastUpdated = self.GetBaseTimestamp()
+            all_accounts._end_slot_write(index)
+            all_accounts.BumpSlotGeneration()
            
     def ResetHeroAIData(self, index): 
             option:HeroAIOptionStruct = self.GetAllAccounts().HeroAIOptions[index]
@@ -298,7 +310,19 @@ class Py4GWSharedMemoryManager:
     def MarkMessageAsFinished(self, account_email: str, message_index: int):
         """Mark a specific message as finished."""
         return self.GetAllAccounts().MarkMessageAsFinished(account_email, message_index)
-    
+
+    def GetInboxStats(self, account_email: str) -> tuple[int, int]:
+        """Return (queued, dropped) message counts for the account's inbox ring."""
+        return self.GetAllAccounts().GetInboxStats(account_email)
+
+    def SendBroadcast(self, sender_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0), ExtraData: tuple = ()) -> int:
+        """Publish a message to every account. Returns the broadcast sequence or -1 on failure."""
+        return self.GetAllAccounts().SendBroadcast(sender_email, command, params, ExtraData)
+
+    def GetNextBroadcast(self, account_email: str) -> tuple[int, SharedMessageStruct | None]:
+        """Read the next unread broadcast for the given account."""
+        return self.GetAllAccounts().GetNextBroadcast(account_email)
+
     #region Callback
     def update_callback(self):
         """Callback function to update shared memory data."""
@@ -1,4 +1,5 @@
-from ctypes import Structure, c_uint, c_bool, c_wchar, c_uint64
+from ctypes import Structure, addressof, c_uint, c_bool, c_wchar, c_uint64, memmove
+from typing import Callable
 import Py4GW
 from PyParty import HeroPartyMember, PetInfo
 from Py4GWCoreLib import ThrottledTimer
@@ -24,6 +25,7 @@ from .AvailableCharacterStruct import AvailableCharacterStruct
 from .KeyStruct import KeyStruct
 from .AgentPartyStruct import AgentPartyStruct
 from .AgentDataStruct import AgentDataStruct
+from .ChangeCountersStruct import ChangeCountersStruct
 
 
 _player_meta_timers: dict[int, ThrottledTimer] = {}
@@ -47,6 +49,9 @@ _pet_meta_stage: dict[int, int] = {}
 _pet_progress_stage: dict[int, int] = {}
 _pet_static_stage: dict[int, int] = {}
 
+# (slot, sub-struct name) -> (private scratch copy, bytes last published from it)
+_delta_scratch: dict[tuple[int, str], tuple[Structure, bytes]] = {}
+
 
 def _get_slot_timer(timer_map: dict[int, ThrottledTimer], slot_index: int, throttle_ms: int) -> ThrottledTimer:
     timer = timer_map.get(slot_index)
@@ -57,6 +62,28 @@ def _get_slot_timer(timer_map: dict[int, ThrottledTimer], slot_index: int, throt
         timer.SetThrottleTime(throttle_ms)
     return timer
 
+def _hero_party_from_context(party: AgentPartyStruct) -> None:
+    party.from_context()
+    party.IsPartyLeader = False
+
+def _pet_party_from_context(party: AgentPartyStruct) -> None:
+    from ...Party import Party
+    party.PartyID = Party.GetPartyID()
+    party.PartyPosition = Party.GetOwnPartyNumber()
+    party.IsTicked = False
+    party.IsPartyLeader = False
+
+def _pet_party_reset(party: AgentPartyStruct) -> None:
+    party.reset()
+    _pet_party_from_context(party)
+
+def _clear_party_leader(party: AgentPartyStruct) -> None:
+    party.IsPartyLeader = False
+
+def _clear_agent_owner(agent_data: AgentDataStruct) -> None:
+    agent_data.OwnerAgentID = 0
+    agent_data.HeroID = 0
+
 class AccountStruct(Structure):
     _pack_ = 1
     _fields_ = [      
@@ -75,6 +102,7 @@ class AccountStruct(Structure):
         ("MissionData", MissionDataStruct),
         ("UnlockedSkills", UnlockedSkillsStruct),
         ("AvailableCharacters", AvailableCharacterStruct),    
+        ("ChangeCounters", ChangeCountersStruct),
         
         ("SlotNumber", c_uint),  # Slot number for the player
         ("IsSlotActive", c_bool),
@@ -107,6 +135,7 @@ class AccountStruct(Structure):
     MissionData: MissionDataStruct
     UnlockedSkills: UnlockedSkillsStruct
     AvailableCharacters: AvailableCharacterStruct
+    ChangeCounters: ChangeCountersStruct
     
     SlotNumber: int
     IsSlotActive: bool
@@ -121,6 +150,42 @@ class AccountStruct(Structure):
 
     LastUpdated: int
     
+    # Build sub-structs in a private scratch copy and only copy them into shared memory when their bytes changed.
+    # When disabled every refresh writes in place and counts as a change.
+    delta_publishing: bool = True
+    
+    def _publish(self, slot_index: int, name: str, fill: Callable[[Structure], None]) -> bool:
+        """Refresh sub-struct `name` with fill(); returns True (and bumps its change counter) if it changed."""
+        target = getattr(self, name)
+        if not AccountStruct.delta_publishing:
+            fill(target)
+            self.ChangeCounters.bump(name)
+            return True
+        
+        key = (slot_index, name)
+        current = bytes(target)
+        entry = _delta_scratch.get(key)
+        if entry is None:
+            scratch = type(target).from_buffer_copy(current)
+        else:
+            scratch = entry[0]
+            if entry[1] != current:
+                # written by someone else since our last publish, start over from the shared state
+                memmove(addressof(scratch), addressof(target), len(current))
+        
+        fill(scratch)
+        data = bytes(scratch)
+        _delta_scratch[key] = (scratch, data)
+        if data == current:
+            return False
+        memmove(addressof(target), addressof(scratch), len(data))
+        self.ChangeCounters.bump(name)
+        return True
+    
+    def GetChangeCounter(self, name: str) -> int:
+        """Change counter of sub-struct `name`; poll it to skip sub-structs that did not change."""
+        return getattr(self.ChangeCounters, name)
+    
     def reset(self) -> None:
         """Reset all fields to zero or default values."""
         #--------------------
@@ -139,6 +204,8 @@ class AccountStruct(Structure):
         self.MissionData.reset()
         self.UnlockedSkills.reset()
         self.AvailableCharacters.reset()
+        # keep counting so readers holding an old counter still see the reset
+        self.ChangeCounters.bump_all()
         
         self.SlotNumber = 0
         self.IsSlotActive = False
@@ -176,8 +243,7 @@ class AccountStruct(Structure):
         self.IsNPC = False
         self.InAggro = previous_in_aggro
         self.InAggroTick64 = previous_in_aggro_tick64
-        self.AgentData.OwnerAgentID = 0
-        self.AgentData.HeroID = 0
+        self._publish(slot_index, "AgentData", _clear_agent_owner)
         
         if Map.IsMapLoading(): return
         if not Player.IsPlayerLoaded(): return
@@ -189,15 +255,15 @@ class AccountStruct(Structure):
             self.AccountName = Player.GetAccountName() if Player.IsPlayerLoaded() else ""
 
         agent_id = Player.GetAgentID()
-        self.AgentData.from_context(agent_id, throttle_key=slot_index)
+        self._publish(slot_index, "AgentData", lambda agent_data: agent_data.from_context(agent_id, throttle_key=slot_index))
 
         meta_timer = _get_slot_timer(_player_meta_timers, slot_index, SHMEM_PLAYER_META_UPDATE_THROTTLE_MS)
         if force_full or meta_timer.IsExpired():
             if force_full:
-                self.AgentPartyData.from_context()
-                self.RankData.from_context()
-                self.FactionData.from_context()
-                self.ExperienceData.from_context()
+                self._publish(slot_index, "AgentPartyData", AgentPartyStruct.from_context)
+                self._publish(slot_index, "RankData", RankStruct.from_context)
+                self._publish(slot_index, "FactionData", FactionStruct.from_context)
+                self._publish(slot_index, "ExperienceData", ExperienceStruct.from_context)
                 _player_meta_stage[slot_index] = 0
                 
                 self.InAggro = bool(Routines.Checks.Agents.InAggro(Range.Earshot.value))
@@ -206,13 +272,13 @@ class AccountStruct(Structure):
             else:
                 meta_stage = _player_meta_stage.get(slot_index, 0)
                 if meta_stage == 0:
-                    self.AgentPartyData.from_context()
+                    self._publish(slot_index, "AgentPartyData", AgentPartyStruct.from_context)
                 elif meta_stage == 1:
-                    self.RankData.from_context()
+                    self._publish(slot_index, "RankData", RankStruct.from_context)
                 elif meta_stage == 2:
-                    self.FactionData.from_context()
+                    self._publish(slot_index, "FactionData", FactionStruct.from_context)
                 elif meta_stage == 3:
-                    self.ExperienceData.from_context()
+                    self._publish(slot_index, "ExperienceData", ExperienceStruct.from_context)
                 else:
                     self.InAggro = bool(Routines.Checks.Agents.InAggro(Range.Earshot.value))
                     self.InAggroTick64 = Py4GW.Game.get_tick_count64() if self.InAggro else 0
@@ -222,15 +288,15 @@ class AccountStruct(Structure):
         progress_timer = _get_slot_timer(_player_progress_timers, slot_index, SHMEM_PLAYER_PROGRESS_UPDATE_THROTTLE_MS)
         if force_full or progress_timer.IsExpired():
             if force_full:
-                self.TitlesData.from_context()
-                self.QuestLog.from_context()
+                self._publish(slot_index, "TitlesData", TitlesStruct.from_context)
+                self._publish(slot_index, "QuestLog", QuestLogStruct.from_context)
                 _player_progress_stage[slot_index] = 0
             else:
                 progress_stage = _player_progress_stage.get(slot_index, 0)
                 if progress_stage == 0:
-                    self.TitlesData.from_context()
+                    self._publish(slot_index, "TitlesData", TitlesStruct.from_context)
                 else:
-                    self.QuestLog.from_context()
+                    self._publish(slot_index, "QuestLog", QuestLogStruct.from_context)
                 _player_progress_stage[slot_index] = (progress_stage + 1) % 2
             
             progress_timer.Reset()
@@ -238,18 +304,18 @@ class AccountStruct(Structure):
         static_timer = _get_slot_timer(_player_static_timers, slot_index, SHMEM_PLAYER_STATIC_UPDATE_THROTTLE_MS)
         if force_full or static_timer.IsExpired():
             if force_full:
-                self.AvailableCharacters.from_context()
-                self.UnlockedSkills.from_context()
-                self.MissionData.from_context()
+                self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.from_context)
+                self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.from_context)
+                self._publish(slot_index, "MissionData", MissionDataStruct.from_context)
                 _player_static_stage[slot_index] = 0
             else:
                 static_stage = _player_static_stage.get(slot_index, 0)
                 if static_stage == 0:
-                    self.AvailableCharacters.from_context()
+                    self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.from_context)
                 elif static_stage == 1:
-                    self.UnlockedSkills.from_context()
+                    self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.from_context)
                 else:
-                    self.MissionData.from_context()
+                    self._publish(slot_index, "MissionData", MissionDataStruct.from_context)
                 _player_static_stage[slot_index] = (static_stage + 1) % 3
             static_timer.Reset()
         
@@ -286,72 +352,75 @@ class AccountStruct(Structure):
             self.AccountName = Player.GetAccountName() if Player.IsPlayerLoaded() else ""
         
         agent_id = hero_data.agent_id
-        self.AgentData.from_context(agent_id, throttle_key=slot_index)
-        self.AgentData.Morale = 100
-        self.AgentData.TargetID = 0
-        self.AgentData.LoginNumber = 0
-        self.AgentData.AgentID = agent_id
-        self.AgentData.CharacterName = hero_data.hero_id.GetName()
-        if self.AgentData.OwnerAgentID == 0:
-            self.AgentData.OwnerAgentID = Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
-        self.AgentData.HeroID = hero_data.hero_id.GetID()
-        
+
+        def _agent_from_hero(agent_data: AgentDataStruct) -> None:
+            agent_data.from_context(agent_id, throttle_key=slot_index)
+            agent_data.Morale = 100
+            agent_data.TargetID = 0
+            agent_data.LoginNumber = 0
+            agent_data.AgentID = agent_id
+            agent_data.CharacterName = hero_data.hero_id.GetName()
+            if agent_data.OwnerAgentID == 0:
+                agent_data.OwnerAgentID = Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
+            agent_data.HeroID = hero_data.hero_id.GetID()
+
+        self._publish(slot_index, "AgentData", _agent_from_hero)
 
         meta_timer = _get_slot_timer(_hero_meta_timers, slot_index, SHMEM_HERO_EXTRA_UPDATE_THROTTLE_MS)
         if force_full or meta_timer.IsExpired():
             if force_full:
-                self.AgentData.Skillbar.from_hero_context(slot_index, agent_id)
-                self.AgentPartyData.from_context()
+                self._publish(slot_index, "AgentData", lambda agent_data: agent_data.Skillbar.from_hero_context(slot_index, agent_id))
+                self._publish(slot_index, "AgentPartyData", _hero_party_from_context)
                 _hero_meta_stage[slot_index] = 0
             else:
                 meta_stage = _hero_meta_stage.get(slot_index, 0)
                 if meta_stage == 0:
-                    self.AgentData.Skillbar.from_hero_context(slot_index, agent_id)
+                    self._publish(slot_index, "AgentData", lambda agent_data: agent_data.Skillbar.from_hero_context(slot_index, agent_id))
                 else:
-                    self.AgentPartyData.from_context()
+                    self._publish(slot_index, "AgentPartyData", _hero_party_from_context)
                 _hero_meta_stage[slot_index] = (meta_stage + 1) % 2
             meta_timer.Reset()
-        self.AgentPartyData.IsPartyLeader = False
+        self._publish(slot_index, "AgentPartyData", _clear_party_leader)
 
         progress_timer = _get_slot_timer(_hero_progress_timers, slot_index, SHMEM_PLAYER_PROGRESS_UPDATE_THROTTLE_MS)
         if force_full or progress_timer.IsExpired():
             if force_full:
-                self.FactionData.reset()
-                self.TitlesData.reset()
-                self.QuestLog.reset()
-                self.ExperienceData.reset()
-                self.RankData.reset()
+                self._publish(slot_index, "FactionData", FactionStruct.reset)
+                self._publish(slot_index, "TitlesData", TitlesStruct.reset)
+                self._publish(slot_index, "QuestLog", QuestLogStruct.reset)
+                self._publish(slot_index, "ExperienceData", ExperienceStruct.reset)
+                self._publish(slot_index, "RankData", RankStruct.reset)
                 _hero_progress_stage[slot_index] = 0
             else:
                 progress_stage = _hero_progress_stage.get(slot_index, 0)
                 if progress_stage == 0:
-                    self.FactionData.reset()
+                    self._publish(slot_index, "FactionData", FactionStruct.reset)
                 elif progress_stage == 1:
-                    self.TitlesData.reset()
+                    self._publish(slot_index, "TitlesData", TitlesStruct.reset)
                 elif progress_stage == 2:
-                    self.QuestLog.reset()
+                    self._publish(slot_index, "QuestLog", QuestLogStruct.reset)
                 elif progress_stage == 3:
-                    self.ExperienceData.reset()
+                    self._publish(slot_index, "ExperienceData", ExperienceStruct.reset)
                 else:
-                    self.RankData.reset()
+                    self._publish(slot_index, "RankData", RankStruct.reset)
                 _hero_progress_stage[slot_index] = (progress_stage + 1) % 5
             progress_timer.Reset()
 
         static_timer = _get_slot_timer(_hero_static_timers, slot_index, SHMEM_PLAYER_STATIC_UPDATE_THROTTLE_MS)
         if force_full or static_timer.IsExpired():
             if force_full:
-                self.AvailableCharacters.reset()
-                self.MissionData.reset()
-                self.UnlockedSkills.reset()
+                self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.reset)
+                self._publish(slot_index, "MissionData", MissionDataStruct.reset)
+                self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.reset)
                 _hero_static_stage[slot_index] = 0
             else:
                 static_stage = _hero_static_stage.get(slot_index, 0)
                 if static_stage == 0:
-                    self.AvailableCharacters.reset()
+                    self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.reset)
                 elif static_stage == 1:
-                    self.MissionData.reset()
+                    self._publish(slot_index, "MissionData", MissionDataStruct.reset)
                 else:
-                    self.UnlockedSkills.reset()
+                    self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.reset)
                 _hero_static_stage[slot_index] = (static_stage + 1) % 3
             static_timer.Reset()
         self.LastUpdated = Py4GW.Game.get_tick_count64()
@@ -387,82 +456,74 @@ class AccountStruct(Structure):
         self.InAggroTick64 = 0
         
         agent_id = pet_data.agent_id
-        self.AgentData.from_context(agent_id, throttle_key=slot_index)
-        self.AgentData.AgentID = agent_id
-        self.AgentData.CharacterName = pet_data.pet_name or f"PET {pet_data.owner_agent_id}s Pet"
-        self.AgentData.OwnerAgentID = pet_data.owner_agent_id
-        self.AgentData.HeroID = 0
-        self.AgentData.Morale = 100
-        self.AgentData.TargetID = pet_data.locked_target_id
-        self.AgentData.LoginNumber = 0
-        self.AgentPartyData.PartyID = Party.GetPartyID()
-        self.AgentPartyData.PartyPosition = Party.GetOwnPartyNumber()
-        self.AgentPartyData.IsTicked = False
-        self.AgentPartyData.IsPartyLeader = False
+
+        def _agent_from_pet(agent_data: AgentDataStruct) -> None:
+            agent_data.from_context(agent_id, throttle_key=slot_index)
+            agent_data.AgentID = agent_id
+            agent_data.CharacterName = pet_data.pet_name or f"PET {pet_data.owner_agent_id}s Pet"
+            agent_data.OwnerAgentID = pet_data.owner_agent_id
+            agent_data.HeroID = 0
+            agent_data.Morale = 100
+            agent_data.TargetID = pet_data.locked_target_id
+            agent_data.LoginNumber = 0
+
+        self._publish(slot_index, "AgentData", _agent_from_pet)
+        self._publish(slot_index, "AgentPartyData", _pet_party_from_context)
 
         meta_timer = _get_slot_timer(_pet_meta_timers, slot_index, SHMEM_PET_EXTRA_UPDATE_THROTTLE_MS)
         if force_full or meta_timer.IsExpired():
             if force_full:
-                self.AgentData.Skillbar.reset()
-                self.AgentPartyData.reset()
-                self.AgentPartyData.PartyID = Party.GetPartyID()
-                self.AgentPartyData.PartyPosition = Party.GetOwnPartyNumber()
-                self.AgentPartyData.IsTicked = False
-                self.AgentPartyData.IsPartyLeader = False
-                self.RankData.reset()
+                self._publish(slot_index, "AgentData", lambda agent_data: agent_data.Skillbar.reset())
+                self._publish(slot_index, "AgentPartyData", _pet_party_reset)
+                self._publish(slot_index, "RankData", RankStruct.reset)
                 _pet_meta_stage[slot_index] = 0
             else:
                 meta_stage = _pet_meta_stage.get(slot_index, 0)
                 if meta_stage == 0:
-                    self.AgentData.Skillbar.reset()
+                    self._publish(slot_index, "AgentData", lambda agent_data: agent_data.Skillbar.reset())
                 elif meta_stage == 1:
-                    self.AgentPartyData.reset()
-                    self.AgentPartyData.PartyID = Party.GetPartyID()
-                    self.AgentPartyData.PartyPosition = Party.GetOwnPartyNumber()
-                    self.AgentPartyData.IsTicked = False
-                    self.AgentPartyData.IsPartyLeader = False
+                    self._publish(slot_index, "AgentPartyData", _pet_party_reset)
                 else:
-                    self.RankData.reset()
+                    self._publish(slot_index, "RankData", RankStruct.reset)
                 _pet_meta_stage[slot_index] = (meta_stage + 1) % 3
             meta_timer.Reset()
-        self.AgentPartyData.IsPartyLeader = False
 
         progress_timer = _get_slot_timer(_pet_progress_timers, slot_index, SHMEM_PLAYER_PROGRESS_UPDATE_THROTTLE_MS)
         if force_full or progress_timer.IsExpired():
             if force_full:
-                self.FactionData.reset()
-                self.TitlesData.reset()
-                self.QuestLog.reset()
-                self.ExperienceData.reset()
+                self._publish(slot_index, "FactionData", FactionStruct.reset)
+                self._publish(slot_index, "TitlesData", TitlesStruct.reset)
+                self._publish(slot_index, "QuestLog", QuestLogStruct.reset)
+                self._publish(slot_index, "ExperienceData", ExperienceStruct.reset)
                 _pet_progress_stage[slot_index] = 0
             else:
                 progress_stage = _pet_progress_stage.get(slot_index, 0)
                 if progress_stage == 0:
-                    self.FactionData.reset()
+                    self._publish(slot_index, "FactionData", FactionStruct.reset)
                 elif progress_stage == 1:
-                    self.TitlesData.reset()
+                    self._publish(slot_index, "TitlesData", TitlesStruct.reset)
                 elif progress_stage == 2:
-                    self.QuestLog.reset()
+                    self._publish(slot_index, "QuestLog", QuestLogStruct.reset)
                 else:
-                    self.ExperienceData.reset()
+                    self._publish(slot_index, "ExperienceData", ExperienceStruct.reset)
                 _pet_progress_stage[slot_index] = (progress_stage + 1) % 4
             progress_timer.Reset()
 
         static_timer = _get_slot_timer(_pet_static_timers, slot_index, SHMEM_PLAYER_STATIC_UPDATE_THROTTLE_MS)
         if force_full or static_timer.IsExpired():
             if force_full:
-                self.AvailableCharacters.reset()
-                self.MissionData.reset()
-                self.UnlockedSkills.reset()
+                self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.reset)
+                self._publish(slot_index, "MissionData", MissionDataStruct.reset)
+                self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.reset)
                 _pet_static_stage[slot_index] = 0
             else:
                 static_stage = _pet_static_stage.get(slot_index, 0)
                 if static_stage == 0:
-                    self.AvailableCharacters.reset()
+                    self._publish(slot_index, "AvailableCharacters", AvailableCharacterStruct.reset)
                 elif static_stage == 1:
-                    self.MissionData.reset()
+                    self._publish(slot_index, "MissionData", MissionDataStruct.reset)
                 else:
-                    self.UnlockedSkills.reset()
+                    self._publish(slot_index, "UnlockedSkills", UnlockedSkillsStruct.reset)
                 _pet_static_stage[slot_index] = (static_stage + 1) % 3
             static_timer.Reset()
         self.LastUpdated = Py4GW.Game.get_tick_count64()
@@ -2,7 +2,7 @@ import ctypes
 from operator import index
 import Py4GW
 from PyParty import HeroPartyMember, PetInfo
-from ctypes import Structure, c_float
+from ctypes import Structure, c_float, c_uint
 from Py4GWCoreLib.enums_src.Multiboxing_enums import SharedCommandType
 from Py4GWCoreLib.py4gwcorelib_src.Console import ConsoleLog
 
@@ -11,45 +11,211 @@ from .Globals import (
     SHMEM_MODULE_NAME,
     SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS,
     SHMEM_MAX_CHAR_LEN,
-    SHMEM_MAX_NUMBER_OF_SKILLS
-    
+    SHMEM_MAX_NUMBER_OF_SKILLS,
+    SHMEM_MESSAGE_RING_SIZE,
+    SHMEM_BROADCAST_RING_SIZE,
+    SHMEM_SEQLOCK_READ_RETRIES,
 )
 
 from .SharedMessageStruct import SharedMessageStruct
+from .MessageRingStruct import MessageRingStruct
 from .HeroAIOptionStruct import HeroAIOptionStruct
 from .AccountStruct import AccountStruct
 from .KeyStruct import KeyStruct
 
+#region SlotIndex
+class _SlotIndex:
+    """
+    Per-process lookup tables over the shared slot table.
+    Rebuilt in one pass whenever AllAccounts.SlotGeneration differs from the
+    generation the tables were built for; activity and isolation are still
+    checked per hit since they change without a generation bump.
+    """
+    def __init__(self):
+        self.generation = -1
+        self.email_slots: dict[str, int] = {}
+        self.party_slots: dict[int, list[int]] = {}
+        self.hero_slots: dict[int, list[int]] = {}
+        self.pet_slots: dict[int, list[int]] = {}
+
+    def rebuild(self, all_accounts: "AllAccounts", generation: int) -> None:
+        email_slots: dict[str, int] = {}
+        party_slots: dict[int, list[int]] = {}
+        hero_slots: dict[int, list[int]] = {}
+        pet_slots: dict[int, list[int]] = {}
+        accounts = all_accounts.AccountData
+        for i in range(SHMEM_MAX_PLAYERS):
+            account = accounts[i]
+            if account.IsAccount:
+                email = account.AccountEmail
+                if email and email not in email_slots:
+                    email_slots[email] = i
+                party_slots.setdefault(int(account.AgentPartyData.PartyPosition), []).append(i)
+            elif account.IsHero:
+                hero_slots.setdefault(int(account.AgentData.OwnerAgentID), []).append(i)
+            elif account.IsPet:
+                pet_slots.setdefault(int(account.AgentData.OwnerAgentID), []).append(i)
+        self.email_slots = email_slots
+        self.party_slots = party_slots
+        self.hero_slots = hero_slots
+        self.pet_slots = pet_slots
+        self.generation = generation
+
+
 #region AllAccounts 
 class AllAccounts(Structure):
     _pack_ = 1
     _fields_ = [
         ("Keys", KeyStruct * SHMEM_MAX_PLAYERS),  # KeyStruct for each player slot
         ("AccountData", AccountStruct * SHMEM_MAX_PLAYERS),
-        ("Inbox", SharedMessageStruct * SHMEM_MAX_PLAYERS),  # Messages for each player
+        ("SlotSequences", c_uint * SHMEM_MAX_PLAYERS),  # Seqlock counter per slot, odd while the slot is being written
+        ("SlotGeneration", c_uint),  # Bumped whenever a slot's identity (email, kind, party position, owner) changes
+        ("Inbox", SharedMessageStruct * (SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE)),  # One message ring per receiver slot
+        ("InboxRings", MessageRingStruct * SHMEM_MAX_PLAYERS),  # Ring headers for Inbox
+        ("Broadcast", SharedMessageStruct * SHMEM_BROADCAST_RING_SIZE),  # Messages for every account
+        ("BroadcastHead", c_uint),  # next broadcast sequence
         ("HeroAIOptions", HeroAIOptionStruct * SHMEM_MAX_PLAYERS),  # Game options for HeroAI
     ]
     
     # Type hints for IntelliSense
     AccountData: list["AccountStruct"]
+    SlotSequences: list[int]
+    SlotGeneration: int
     Inbox: list["SharedMessageStruct"]
+    InboxRings: list["MessageRingStruct"]
+    Broadcast: list["SharedMessageStruct"]
+    BroadcastHead: int
     HeroAIOptions: list[HeroAIOptionStruct]
     Keys: list["KeyStruct"]
     
+    # per-process lookup tables, see _SlotIndex
+    _slot_index = _SlotIndex()
+    # per-process slot index -> (sequence, private copy) of the last consistent read
+    _slot_snapshots: dict[int, tuple[int, AccountStruct]] = {}
+    
     def reset(self) -> None:
         """Reset all fields to zero."""
         for i in range(SHMEM_MAX_PLAYERS):
             self.Keys[i].reset()
             self.AccountData[i].reset()
-            self.Inbox[i].reset()
+            self.SlotSequences[i] = 0
+            self.InboxRings[i].reset()
             self.HeroAIOptions[i].reset()
+        for i in range(SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE):
+            self.Inbox[i].reset()
+        for i in range(SHMEM_BROADCAST_RING_SIZE):
+            self.Broadcast[i].reset()
+        self.BroadcastHead = 0
+        self.SlotGeneration = 0
             
     #region Account
     def GetAccountData(self, index: int) -> AccountStruct:
         if index < 0 or index >= SHMEM_MAX_PLAYERS:
             raise IndexError(f"Index {index} is out of bounds for max players {SHMEM_MAX_PLAYERS}.")
         return self.AccountData[index]
-    
+
+    #region Seqlock
+    def _begin_slot_write(self, index: int) -> None:
+        """Make the slot's sequence odd; readers retry until the matching _end_slot_write."""
+        # | 1 also recovers a counter left odd by a writer that died mid-update
+        self.SlotSequences[index] = ((self.SlotSequences[index] + 1) | 1) & 0xFFFFFFFF
+
+    def _end_slot_write(self, index: int) -> None:
+        """Make the slot's sequence even again, publishing the update."""
+        self.SlotSequences[index] = (self.SlotSequences[index] + 1) & 0xFFFFFFFE
+
+    def GetSlotSequence(self, index: int) -> int:
+        """Return the slot's seqlock counter. It changes on every published update and is odd during one."""
+        if index < 0 or index >= SHMEM_MAX_PLAYERS:
+            raise IndexError(f"Index {index} is out of bounds for max players {SHMEM_MAX_PLAYERS}.")
+        return self.SlotSequences[index]
+
+    def GetAccountSnapshot(self, index: int) -> AccountStruct:
+        """
+        Return a private, untorn copy of the slot.
+        The copy is only refreshed when the slot's sequence moved since the last call,
+        and is shared between callers of this process: treat it as read-only.
+        If the writer keeps the slot busy for SHMEM_SEQLOCK_READ_RETRIES attempts the
+        previous consistent copy is returned (or the last attempt, when there is none).
+        """
+        if index < 0 or index >= SHMEM_MAX_PLAYERS:
+            raise IndexError(f"Index {index} is out of bounds for max players {SHMEM_MAX_PLAYERS}.")
+
+        sequences = self.SlotSequences
+        cached = AllAccounts._slot_snapshots.get(index)
+        seq = sequences[index]
+        if cached is not None and cached[0] == seq:
+            return cached[1]
+
+        source = self.AccountData[index]
+        copy = AccountStruct()
+        for _ in range(SHMEM_SEQLOCK_READ_RETRIES):
+            if seq & 1 == 0:
+                ctypes.memmove(ctypes.addressof(copy), ctypes.addressof(source), ctypes.sizeof(AccountStruct))
+                if sequences[index] == seq:
+                    AllAccounts._slot_snapshots[index] = (seq, copy)
+                    return copy
+            seq = sequences[index]
+
+        if cached is not None:
+            return cached[1]
+        ctypes.memmove(ctypes.addressof(copy), ctypes.addressof(source), ctypes.sizeof(AccountStruct))
+        return copy
+
+    def GetVisibleSlotsSnapshot(self, accounts_only: bool = False, sort_results: bool = True) -> list[AccountStruct]:
+        """
+        Consistent copies of every visible slot (accounts only if accounts_only).
+        Only slots whose sequence changed since the previous call are copied again.
+        """
+        snapshots: list[AccountStruct] = []
+        for i in range(SHMEM_MAX_PLAYERS):
+            if not (self._is_visible_account(i) if accounts_only else self._is_visible_slot(i)):
+                continue
+            snapshots.append(self.GetAccountSnapshot(i))
+
+        if sort_results and len(snapshots) > 1:
+            snapshots.sort(key=lambda p: (
+                p.AgentData.Map.MapID,
+                p.AgentData.Map.Region,
+                p.AgentData.Map.District,
+                p.AgentData.Map.Language,
+                p.AgentPartyData.PartyID,
+                p.AgentPartyData.PartyPosition,
+                p.AgentData.LoginNumber,
+                p.AgentData.CharacterName
+            ))
+        return snapshots
+
+    #region Slot Index
+    @staticmethod
+    def _slot_identity(account: AccountStruct) -> tuple:
+        """The fields _SlotIndex is keyed on."""
+        return (
+            account.IsAccount,
+            account.IsHero,
+            account.IsPet,
+            account.AccountEmail,
+            account.AgentPartyData.PartyPosition,
+            account.AgentData.OwnerAgentID,
+        )
+
+    def BumpSlotGeneration(self) -> None:
+        """Invalidate every process' slot index after a slot's identity changed."""
+        self.SlotGeneration = (self.SlotGeneration + 1) & 0xFFFFFFFF
+
+    def _get_slot_index(self) -> _SlotIndex:
+        slot_index = AllAccounts._slot_index
+        generation = self.SlotGeneration
+        if slot_index.generation != generation:
+            slot_index.rebuild(self, generation)
+        return slot_index
+
+    def _resync_slot_index(self) -> _SlotIndex:
+        """Rebuild unconditionally; used before submitting a new slot so a stale index never duplicates one."""
+        slot_index = AllAccounts._slot_index
+        slot_index.rebuild(self, self.SlotGeneration)
+        return slot_index
+
     def _is_slot_active(self, index: int) -> bool:
         """Check if the slot at the given index is active."""
         slot_data = self.GetAccountData(index)
@@ -174,11 +340,15 @@ class AllAccounts(Structure):
     def _find_account_slot_by_email(self, account_email: str) -> int:
         if not account_email:
             return -1
-        all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            account = all_accounts[i]
-            if account.AccountEmail == account_email and account.IsAccount:
-                return i
+        slot_index = self._get_slot_index()
+        index = slot_index.email_slots.get(account_email, -1)
+        if index != -1:
+            account = self.AccountData[index]
+            if account.IsAccount and account.AccountEmail == account_email:
+                return index
+            # a writer changed the slot without bumping the generation, resync once
+            slot_index.rebuild(self, self.SlotGeneration)
+            return slot_index.email_slots.get(account_email, -1)
         return -1
 
     def IsAccountIsolated(self, account_email: str) -> bool:
@@ -196,7 +366,9 @@ class AllAccounts(Structure):
         account = self.AccountData[index]
         if not account.IsAccount:
             return False
+        self._begin_slot_write(index)
         account.IsIsolated = isolated
+        self._end_slot_write(index)
         return True
 
     def SetAccountIsolatedByEmail(self, account_email: str) -> bool:
@@ -214,7 +386,9 @@ class AllAccounts(Structure):
         account = self.AccountData[index]
         if not account.IsAccount:
             return False
+        self._begin_slot_write(index)
         account.IsolationGroupID = group_id
+        self._end_slot_write(index)
         return True
 
     def GetAccountGroupByEmail(self, account_email: str) -> int:
@@ -306,10 +480,12 @@ class AllAccounts(Structure):
         new_account.from_context(account_email, slot_index)
         
         Key = KeyStruct().AsPlayerKey(Py4GW.Console.get_gw_window_handle())
+        self._begin_slot_write(slot_index)
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
-        
-
+        self._end_slot_write(slot_index)
+        self.BumpSlotGeneration()
+        self._reset_inbox_ring(slot_index)
         
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted account data for {account_email} at slot {slot_index}.", Py4GW.Console.MessageType.Info)
         return slot_index
@@ -326,8 +502,11 @@ class AllAccounts(Structure):
         new_account.from_hero_context(hero_data, slot_index)
         
         Key = KeyStruct().AsHeroKey(Py4GW.Console.get_gw_window_handle(), slot_index)
+        self._begin_slot_write(slot_index)
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
+        self._end_slot_write(slot_index)
+        self.BumpSlotGeneration()
 
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted hero data for HeroID {hero_data.hero_id.GetID()} at slot {slot_index}.", Py4GW.Console.MessageType.Info)
         return slot_index
@@ -343,8 +522,11 @@ class AllAccounts(Structure):
         new_account.from_pet_context(pet_data, slot_index)
         
         Key = KeyStruct().AsPetKey(Py4GW.Console.get_gw_window_handle(), slot_index)
+        self._begin_slot_write(slot_index)
         self.Keys[slot_index] = new_account.Key = Key
         self.AccountData[slot_index] = new_account
+        self._end_slot_write(slot_index)
+        self.BumpSlotGeneration()
         
         ConsoleLog(SHMEM_MODULE_NAME, f"Submitted pet data for AgentID {pet_data.agent_id} at slot {slot_index}.", Py4GW.Console.MessageType.Info)
         return slot_index
@@ -358,7 +540,15 @@ class AllAccounts(Structure):
             ConsoleLog(SHMEM_MODULE_NAME, f"No slot found for account {account_email}.", Py4GW.Console.MessageType.Warning)
             return
         
-        self.AccountData[index].from_context(account_email, index)
+        account = self.AccountData[index]
+        identity = self._slot_identity(account)
+        self._begin_slot_write(index)
+        try:
+            account.from_context(account_email, index)
+        finally:
+            self._end_slot_write(index)
+        if self._slot_identity(account) != identity:
+            self.BumpSlotGeneration()
         
     def SetHeroesData(self):
         """Set data for all heroes in the given list."""
@@ -379,7 +569,14 @@ class AllAccounts(Structure):
             return
         
         account = self.AccountData[index]
-        account.from_hero_context(hero_data, index)
+        identity = self._slot_identity(account)
+        self._begin_slot_write(index)
+        try:
+            account.from_hero_context(hero_data, index)
+        finally:
+            self._end_slot_write(index)
+        if self._slot_identity(account) != identity:
+            self.BumpSlotGeneration()
         if account.AgentData.AgentID == 0:
             return
         
@@ -400,7 +597,14 @@ class AllAccounts(Structure):
             return
         
         account = self.AccountData[index]
-        account.from_pet_context(pet_info, index)
+        identity = self._slot_identity(account)
+        self._begin_slot_write(index)
+        try:
+            account.from_pet_context(pet_info, index)
+        finally:
+            self._end_slot_write(index)
+        if self._slot_identity(account) != identity:
+            self.BumpSlotGeneration()
         if account.AgentData.AgentID == 0:
             return
 
@@ -410,11 +614,12 @@ class AllAccounts(Structure):
             return -1
         
         """Find the index of the account with the given email."""
-        all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            account = all_accounts[i]
-            if account.AccountEmail == account_email and account.IsAccount:
-                return i
+        index = self._find_account_slot_by_email(account_email)
+        if index != -1:
+            return index
+        index = self._resync_slot_index().email_slots.get(account_email, -1)
+        if index != -1:
+            return index
             
         #submit if not found
         return self.SubmitAccountData(account_email)
@@ -436,26 +641,36 @@ class AllAccounts(Structure):
     
     def GetAccountDataFromPartyNumber(self, party_number: int, log : bool = False) -> AccountStruct | None:
         """Get player data for the account with the given party number."""
+        index = self._find_visible_slot_by_party_number(party_number)
+        if index != -1:
+            return self.AccountData[index]
+        return None
+
+    def _find_visible_slot_by_party_number(self, party_number: int) -> int:
         all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
+        for i in self._get_slot_index().party_slots.get(party_number, ()):
             player = all_accounts[i]
             if self._is_visible_account(i) and player.AgentPartyData.PartyPosition == party_number:
-                return player
-            
-        return None
+                return i
+        return -1
     
     def GetHeroSlotByHeroData(self, hero_data:HeroPartyMember) -> int:
         """Find the index of the hero with the given ID."""
         from ...Party import Party
         all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            player = all_accounts[i]
-   
-            if (player.IsHero and 
-                player.AgentData.HeroID == hero_data.hero_id.GetID() and 
-                player.AgentData.OwnerAgentID == Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
-            ):
-                return i
+        hero_id = hero_data.hero_id.GetID()
+        owner_agent_id = Party.Players.GetAgentIDByLoginNumber(hero_data.owner_player_id)
+        # retry on a freshly rebuilt index before submitting, a stale one must not duplicate the slot
+        for resync in (False, True):
+            slot_index = self._resync_slot_index() if resync else self._get_slot_index()
+            for i in slot_index.hero_slots.get(owner_agent_id, ()):
+                player = all_accounts[i]
+       
+                if (player.IsHero and 
+                    player.AgentData.HeroID == hero_id and 
+                    player.AgentData.OwnerAgentID == owner_agent_id
+                ):
+                    return i
             
         #submit if not found
         return self.SubmitHeroData(hero_data)
@@ -464,14 +679,16 @@ class AllAccounts(Structure):
     def GetPetSlotByPetData(self, pet_data:PetInfo) -> int:
         """Find the index of the pet with the given ID."""
         all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):
-            player = all_accounts[i]
-  
-            if (player.IsPet and 
-                player.AgentData.AgentID == pet_data.agent_id and 
-                player.AgentData.OwnerAgentID == pet_data.owner_agent_id
-            ):
-                return i
+        for resync in (False, True):
+            slot_index = self._resync_slot_index() if resync else self._get_slot_index()
+            for i in slot_index.pet_slots.get(pet_data.owner_agent_id, ()):
+                player = all_accounts[i]
+      
+                if (player.IsPet and 
+                    player.AgentData.AgentID == pet_data.agent_id and 
+                    player.AgentData.OwnerAgentID == pet_data.owner_agent_id
+                ):
+                    return i
         return self.SubmitPetData(pet_data)
     
     def GetAllActivePlayers(self, sort_results: bool = True, include_isolated: bool = False) -> list[AccountStruct]:
@@ -516,7 +733,7 @@ class AllAccounts(Structure):
         """Get a list of heroes owned by the specified player."""
         heroes : list[AccountStruct] = []
         all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):   
+        for i in self._get_slot_index().hero_slots.get(owner_agent_id, ()):
             account_data = all_accounts[i]
 
             if (self._is_visible_slot(i) and account_data.IsHero and
@@ -534,7 +751,7 @@ class AllAccounts(Structure):
         """Get a list of pets owned by the specified player."""
         pets : list[AccountStruct] = []
         all_accounts = self.AccountData
-        for i in range(SHMEM_MAX_PLAYERS):   
+        for i in self._get_slot_index().pet_slots.get(owner_agent_id, ()):
             account_data = all_accounts[i]
 
             if (self._is_visible_slot(i) and account_data.IsPet and
@@ -627,10 +844,9 @@ class AllAccounts(Structure):
 
     def GetHeroAIOptionsByPartyNumber(self, party_number: int) -> HeroAIOptionStruct | None:
         """Get HeroAI options for the account with the given party number."""
-        for i in range(SHMEM_MAX_PLAYERS):
-            player = self.AccountData[i]
-            if self._is_visible_account(i) and player.AgentPartyData.PartyPosition == party_number:
-                return self.HeroAIOptions[i]
+        index = self._find_visible_slot_by_party_number(party_number)
+        if index != -1:
+            return self.HeroAIOptions[index]
         return None 
     
     def SetHeroAIOptionsByEmail(self, account_email: str, options: HeroAIOptionStruct):
@@ -729,30 +945,106 @@ class AllAccounts(Structure):
             out.append(self._str_to_c_wchar_array(str(val), maxlen))
         return tuple(out)
     
+    #region Message Rings
+    _SEQ_MASK = 0xFFFFFFFF
+    
+    def _inbox_slot(self, account_email: str) -> int:
+        """Return the account slot owning the inbox ring of account_email, or -1."""
+        return self._find_account_slot_by_email(account_email)
+    
+    def _reset_inbox_ring(self, slot_index: int) -> None:
+        """Drop everything queued for a slot and start reading broadcasts from now on."""
+        base = slot_index * SHMEM_MESSAGE_RING_SIZE
+        for i in range(base, base + SHMEM_MESSAGE_RING_SIZE):
+            self.Inbox[i].reset()
+        ring = self.InboxRings[slot_index]
+        ring.reset()
+        ring.BroadcastCursor = self.BroadcastHead
+    
+    def _finished_sequence(self, sequence: int) -> int:
+        """Sequence marker of a finished entry, the one its place is claimed with on the next lap.
+        A claimed entry still being written never carries it, since Head is past that sequence
+        only once Tail is.
+        """
+        return (sequence + SHMEM_MESSAGE_RING_SIZE) & self._SEQ_MASK
+    
+    def _retire_inbox_ring(self, slot_index: int) -> MessageRingStruct:
+        """Advance Tail past entries the receiver marked finished so their places can be reused.
+        Stops at the first entry that is still live or claimed but not yet published.
+        Only the receiver (MarkMessageAsFinished) calls this, so Tail has a single writer.
+        """
+        ring = self.InboxRings[slot_index]
+        base = slot_index * SHMEM_MESSAGE_RING_SIZE
+        tail = ring.Tail
+        head = ring.Head
+        while tail != head:
+            message = self.Inbox[base + tail % SHMEM_MESSAGE_RING_SIZE]
+            if message.Active or message.Sequence != self._finished_sequence(tail):
+                break
+            tail = (tail + 1) & self._SEQ_MASK
+        ring.Tail = tail
+        return ring
+    
+    def _iter_inbox_ring(self, slot_index: int):
+        """Yield (index, message) for the live entries of a slot's ring, oldest first. Read only."""
+        ring = self.InboxRings[slot_index]
+        base = slot_index * SHMEM_MESSAGE_RING_SIZE
+        seq = ring.Tail
+        head = ring.Head
+        while seq != head:
+            index = base + seq % SHMEM_MESSAGE_RING_SIZE
+            message = self.Inbox[index]
+            if message.Active and message.Sequence == seq:
+                yield index, message
+            seq = (seq + 1) & self._SEQ_MASK
+    
+    def _write_message(self, message: SharedMessageStruct, sender_email: str, receiver_email: str, command: SharedCommandType, params: tuple, ExtraData: tuple, sequence: int) -> None:
+        import ctypes as ct
+        message.Active = False
+        message.Sequence = sequence
+        message.SenderEmail = sender_email
+        message.ReceiverEmail = receiver_email
+        message.Command = command.value
+        message.Params = (c_float * 4)(*params)
+        # Pack 4 strings into 4 arrays of c_wchar[SHMEM_MAX_CHAR_LEN]
+        arr_type = ct.c_wchar * SHMEM_MAX_CHAR_LEN
+        packed = [self._str_to_c_wchar_array(
+                    ExtraData[j] if j < len(ExtraData) else "",
+                    SHMEM_MAX_CHAR_LEN)
+                for j in range(4)]
+        message.ExtraData = (arr_type * 4)(*packed)
+        message.Running = False
+        message.Timestamp = Py4GW.Game.get_tick_count64()
+        # publish last, readers only pick up Active entries with a matching sequence
+        message.Active = True
+    
     def GetAllMessages(self) -> list[tuple[int, SharedMessageStruct]]:
         """Get all messages in shared memory with their index."""
         messages = []
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if message.Active and self._can_communicate(message.SenderEmail, message.ReceiverEmail):
-                messages.append((index, message))  # Add index and message
+        for slot_index in range(SHMEM_MAX_PLAYERS):
+            ring = self.InboxRings[slot_index]
+            if ring.Head == ring.Tail:
+                continue
+            for index, message in self._iter_inbox_ring(slot_index):
+                if self._can_communicate(message.SenderEmail, message.ReceiverEmail):
+                    messages.append((index, message))  # Add index and message
         return messages
     
     def GetInbox(self, index: int) -> SharedMessageStruct:
-        if index < 0 or index >= SHMEM_MAX_PLAYERS:
-            raise IndexError(f"Index {index} is out of bounds for max players {SHMEM_MAX_PLAYERS}.")
+        if index < 0 or index >= SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE:
+            raise IndexError(f"Index {index} is out of bounds for inbox size {SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE}.")
         return self.Inbox[index]
     
+    def GetInboxStats(self, account_email: str) -> tuple[int, int]:
+        """Return (queued, dropped) message counts for the account's inbox ring."""
+        slot_index = self._inbox_slot(account_email)
+        if slot_index == -1:
+            return 0, 0
+        ring = self.InboxRings[slot_index]
+        return (ring.Head - ring.Tail) & self._SEQ_MASK, ring.Dropped
+    
     def SendMessage(self, sender_email: str, receiver_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0), ExtraData: tuple = ()) -> int:
         """Send a message to another player. Returns the message index or -1 on failure."""
-        
-        import ctypes as ct
-        index = self.GetSlotByEmail(receiver_email)
-        
-        if index == -1:
-            ConsoleLog(SHMEM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
-            return -1
-        
         if not receiver_email:
             ConsoleLog(SHMEM_MODULE_NAME, "Receiver email is empty.", Py4GW.Console.MessageType.Error)
             return -1
@@ -760,41 +1052,42 @@ class AllAccounts(Structure):
         if not sender_email:
             ConsoleLog(SHMEM_MODULE_NAME, "Sender email is empty.", Py4GW.Console.MessageType.Error)
             return -1
+        
+        index = self._inbox_slot(receiver_email)
+        if index == -1:
+            index = self.GetSlotByEmail(receiver_email)
+        
+        if index == -1:
+            ConsoleLog(SHMEM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
+            return -1
 
         if not self._can_communicate(sender_email, receiver_email):
             ConsoleLog(SHMEM_MODULE_NAME, f"Cannot communicate between {sender_email} and {receiver_email} (isolated or different groups).", Py4GW.Console.MessageType.Warning)
             return -1
         
-        for i in range(SHMEM_MAX_PLAYERS):
-            message = self.GetInbox(i)
-            if message.Active:
-                continue  # Find the first unfinished message slot
-            
-            message.SenderEmail = sender_email
-            message.ReceiverEmail = receiver_email
-            message.Command = command.value
-            message.Params = (c_float * 4)(*params)
-            # Pack 4 strings into 4 arrays of c_wchar[SHMEM_MAX_CHAR_LEN]
-            arr_type = ct.c_wchar * SHMEM_MAX_CHAR_LEN
-            packed = [self._str_to_c_wchar_array(
-                        ExtraData[j] if j < len(ExtraData) else "",
-                        SHMEM_MAX_CHAR_LEN)
-                    for j in range(4)]
-            message.ExtraData = (arr_type * 4)(*packed)
-            message.Active = True
-            message.Running = False
-            message.Timestamp = Py4GW.Game.get_tick_count64()
-            return i
-
-        return -1
+        ring = self.InboxRings[index]
+        seq = ring.Head
+        message_index = index * SHMEM_MESSAGE_RING_SIZE + seq % SHMEM_MESSAGE_RING_SIZE
+        message = self.Inbox[message_index]
+        if ((seq - ring.Tail) & self._SEQ_MASK) >= SHMEM_MESSAGE_RING_SIZE or message.Active:
+            ring.Dropped += 1
+            ConsoleLog(SHMEM_MODULE_NAME, f"Inbox of {receiver_email} is full, message dropped.", Py4GW.Console.MessageType.Warning)
+            return -1
+        
+        # claim the sequence before filling the entry so concurrent senders move on to the next one
+        ring.Head = (seq + 1) & self._SEQ_MASK
+        self._write_message(message, sender_email, receiver_email, command, params, ExtraData, seq)
+        return message_index
     
     def GetNextMessage(self, account_email: str) -> tuple[int, SharedMessageStruct | None]:
         """Read the next message for the given account.
         Returns the raw SharedMessage. Use self._c_wchar_array_to_str() to read ExtraData safely.
         """
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if (message.ReceiverEmail == account_email and message.Active and not message.Running
+        slot_index = self._inbox_slot(account_email)
+        if slot_index == -1:
+            return -1, None
+        for index, message in self._iter_inbox_ring(slot_index):
+            if (message.ReceiverEmail == account_email and not message.Running
                 and self._can_communicate(message.SenderEmail, account_email)):
                 return index, message
         return -1, None
@@ -804,9 +1097,11 @@ class AllAccounts(Structure):
         If include_running is True, will also return a running message.
         Ensures ExtraData is returned as tuple[str] using existing helpers.
         """
-        for index in range(SHMEM_MAX_PLAYERS):
-            message = self.Inbox[index]
-            if message.ReceiverEmail != account_email or not message.Active:
+        slot_index = self._inbox_slot(account_email)
+        if slot_index == -1:
+            return -1, None
+        for index, message in self._iter_inbox_ring(slot_index):
+            if message.ReceiverEmail != account_email:
                 continue
             if not self._can_communicate(message.SenderEmail, account_email):
                 continue
@@ -816,7 +1111,7 @@ class AllAccounts(Structure):
     
     def MarkMessageAsRunning(self, account_email: str, message_index: int):
         """Mark a specific message as running."""
-        if 0 <= message_index < SHMEM_MAX_PLAYERS:
+        if 0 <= message_index < SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE:
             message = self.Inbox[message_index]
             if message.ReceiverEmail == account_email:
                 message.Running = True
@@ -830,7 +1125,7 @@ class AllAccounts(Structure):
     def MarkMessageAsFinished(self, account_email: str, message_index: int):
         """Mark a specific message as finished."""
         import ctypes as ct
-        if 0 <= message_index < SHMEM_MAX_PLAYERS:
+        if 0 <= message_index < SHMEM_MAX_PLAYERS * SHMEM_MESSAGE_RING_SIZE:
             message = self.Inbox[message_index]
             if message.ReceiverEmail == account_email:
                 message.SenderEmail = ""
@@ -845,7 +1140,11 @@ class AllAccounts(Structure):
 
                 message.Timestamp = Py4GW.Game.get_tick_count64()
                 message.Running = False
+                if message.Active:
+                    # mark the entry done so Tail can move past it, only once per published message
+                    message.Sequence = self._finished_sequence(message.Sequence)
                 message.Active = False
+                self._retire_inbox_ring(message_index // SHMEM_MESSAGE_RING_SIZE)
             else:
                 ConsoleLog(
                     SHMEM_MODULE_NAME,
@@ -858,3 +1157,46 @@ class AllAccounts(Structure):
                 f"Invalid message index: {message_index}.",
                 Py4GW.Console.MessageType.Error
             )
+    
+    #region Broadcast
+    def SendBroadcast(self, sender_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0), ExtraData: tuple = ()) -> int:
+        """Publish a message to every account that can communicate with the sender. Returns its sequence or -1 on failure.
+        Broadcasts are not marked running/finished, the oldest one is overwritten once the ring wraps.
+        """
+        if not sender_email:
+            ConsoleLog(SHMEM_MODULE_NAME, "Sender email is empty.", Py4GW.Console.MessageType.Error)
+            return -1
+        
+        seq = self.BroadcastHead
+        message = self.Broadcast[seq % SHMEM_BROADCAST_RING_SIZE]
+        self._write_message(message, sender_email, "", command, params, ExtraData, seq)
+        # readers never look past BroadcastHead, so bump it once the entry is complete
+        self.BroadcastHead = (seq + 1) & self._SEQ_MASK
+        return seq
+    
+    def GetNextBroadcast(self, account_email: str) -> tuple[int, SharedMessageStruct | None]:
+        """Read the next unread broadcast for the given account and advance its cursor.
+        Returns (sequence, message). Broadcasts sent by the account itself are skipped.
+        """
+        slot_index = self._inbox_slot(account_email)
+        if slot_index == -1:
+            return -1, None
+        
+        ring = self.InboxRings[slot_index]
+        head = self.BroadcastHead
+        cursor = ring.BroadcastCursor
+        if ((head - cursor) & self._SEQ_MASK) > SHMEM_BROADCAST_RING_SIZE:
+            # fell behind by more than a full ring, the skipped broadcasts were overwritten
+            cursor = (head - SHMEM_BROADCAST_RING_SIZE) & self._SEQ_MASK
+        
+        while cursor != head:
+            seq = cursor
+            message = self.Broadcast[seq % SHMEM_BROADCAST_RING_SIZE]
+            cursor = (cursor + 1) & self._SEQ_MASK
+            if (message.Active and message.Sequence == seq and message.SenderEmail != account_email
+                and self._can_communicate(message.SenderEmail, account_email)):
+                ring.BroadcastCursor = cursor
+                return seq, message
+        
+        ring.BroadcastCursor = cursor
+        return -1, None
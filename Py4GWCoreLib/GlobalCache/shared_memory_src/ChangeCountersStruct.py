@@ -0,0 +1,42 @@
+from ctypes import Structure, c_uint
+#region ChangeCounters
+class ChangeCountersStruct(Structure):
+    """Per sub-struct counters, bumped every time AccountStruct publishes a changed sub-struct."""
+    _pack_ = 1
+    _fields_ = [
+        ("AgentData", c_uint),
+        ("AgentPartyData", c_uint),
+        ("RankData", c_uint),
+        ("FactionData", c_uint),
+        ("TitlesData", c_uint),
+        ("QuestLog", c_uint),
+        ("ExperienceData", c_uint),
+        ("MissionData", c_uint),
+        ("UnlockedSkills", c_uint),
+        ("AvailableCharacters", c_uint),
+    ]
+    
+    # Type hints for IntelliSense
+    AgentData: int
+    AgentPartyData: int
+    RankData: int
+    FactionData: int
+    TitlesData: int
+    QuestLog: int
+    ExperienceData: int
+    MissionData: int
+    UnlockedSkills: int
+    AvailableCharacters: int
+    
+    def reset(self) -> None:
+        """Reset all fields to zero."""
+        for name, _ in self._fields_:
+            setattr(self, name, 0)
+            
+    def bump(self, name: str) -> None:
+        setattr(self, name, (getattr(self, name) + 1) & 0xFFFFFFFF)
+        
+    def bump_all(self) -> None:
+        """Bump every counter, for writes that replace the whole slot."""
+        for name, _ in self._fields_:
+            self.bump(name)
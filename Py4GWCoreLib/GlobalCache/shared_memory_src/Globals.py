@@ -13,6 +13,10 @@ SHMEM_MAX_NUMBER_OF_ATTRIBUTES = len(Attribute) #5 primary + 3 secondary + 1 fro
 SHMEM_MAX_TITLES = 48
 SHMEM_MAX_QUESTS = 150
 
+SHMEM_MESSAGE_RING_SIZE = 16 # inbox ring capacity per receiver slot
+SHMEM_BROADCAST_RING_SIZE = 32 # broadcast ring capacity shared by all senders
+SHMEM_SEQLOCK_READ_RETRIES = 4 # copies attempted before a reader falls back to its last consistent snapshot
+
 MISSION_BITMAP_ENTRIES = 25 #each entry is a bitmap of a mission flags (32 bits each)
 SKILL_BITMAP_ENTRIES = 108 #each entry is a bitmap of a skill flags (32 bits each)
 
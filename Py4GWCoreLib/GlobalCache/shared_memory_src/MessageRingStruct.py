@@ -0,0 +1,28 @@
+from ctypes import Structure, c_uint
+
+#region MessageRing
+class MessageRingStruct(Structure):
+    """
+    Ring header of one receiver slot's inbox.
+    Sequences are free running 32 bit counters, the entry of sequence `seq`
+    lives at Inbox[slot * SHMEM_MESSAGE_RING_SIZE + seq % SHMEM_MESSAGE_RING_SIZE].
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("Head", c_uint), # next sequence a sender will publish
+        ("Tail", c_uint), # oldest sequence not yet finished by the receiver
+        ("BroadcastCursor", c_uint), # next broadcast sequence this slot will read
+        ("Dropped", c_uint), # sends rejected because the ring was full
+    ]
+    
+    Head: int
+    Tail: int
+    BroadcastCursor: int
+    Dropped: int
+    
+    def reset(self) -> None:
+        """Reset all fields to zero."""
+        self.Head = 0
+        self.Tail = 0
+        self.BroadcastCursor = 0
+        self.Dropped = 0
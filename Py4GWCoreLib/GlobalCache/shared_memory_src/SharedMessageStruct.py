@@ -15,6 +15,7 @@ class SharedMessageStruct(Structure):
         ("Active", c_bool), 
         ("Running", c_bool),
         ("Timestamp", c_uint), 
+        ("Sequence", c_uint), # ring sequence the entry was published with, one lap ahead once finished
     ]
     
     # Type hints for IntelliSense
@@ -26,6 +27,7 @@ class SharedMessageStruct(Structure):
     Active: bool
     Running: bool
     Timestamp: int
+    Sequence: int
     
     def reset(self) -> None:
         """Reset all fields to zero or default values."""
@@ -38,4 +40,5 @@ class SharedMessageStruct(Structure):
                 self.ExtraData[i][j] = '\0'
         self.Active = False
         self.Running = False
-        self.Timestamp = 0
\ No newline at end of file
+        self.Timestamp = 0
+        self.Sequence = 0
\ No newline at end of file
@@ -1,6 +1,7 @@
 from platform import node
 import Py4GW
 import os
+import time
 import PyImGui
 from Py4GWCoreLib.Player import Player
 from Py4GWCoreLib.py4gwcorelib_src.IniHandler import IniHandler
@@ -18,6 +19,16 @@ class IniVarDef:
     key: str
     default: Any
     var_type: str  # "bool" | "int" | "float" | "str"
+
+
+@dataclass
+class FlushStats:
+    flushes: int = 0          # file writes
+    keys_written: int = 0     # (section, key) pairs applied
+    bytes_written: int = 0
+    errors: int = 0
+    last_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
     
     
 @dataclass
@@ -41,6 +52,7 @@ class ConfigNode:
     pending_writes: dict[tuple[str, str], str] = field(default_factory=dict)
     cached_values: dict[tuple[str, str], str] = field(default_factory=dict)
     needs_flush: bool = False
+    flush_stats: FlushStats = field(default_factory=FlushStats)
     
     begin_called: bool = False
     begin_returned_true: bool = False
@@ -270,6 +282,31 @@ class IniManager:
         return str(value)
     
     
+    @staticmethod
+    def _flush_node(node: ConfigNode) -> bool:
+        """Apply every pending write of a node to its config and write the file once."""
+        pending = node.pending_writes
+        stats = node.flush_stats
+        started = time.perf_counter()
+        try:
+            written = node.ini_handler.write_keys(pending)
+        except Exception as e:
+            stats.errors += 1
+            Py4GW.Console.Log("IniManager", f"Flush failed for {node.filename}: {e}", Py4GW.Console.MessageType.Error)
+            return False
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        stats.flushes += 1
+        stats.keys_written += len(pending)
+        stats.bytes_written += written
+        stats.last_flush_ms = elapsed_ms
+        stats.total_flush_ms += elapsed_ms
+
+        node.cached_values.update(pending)
+        node.pending_writes = {}
+        node.needs_flush = False
+        return True
+
     @staticmethod
     def _flush_callback(*args, **kwargs):
         cm = IniManager()
@@ -278,19 +315,29 @@ class IniManager:
             if not node.needs_flush or not node.pending_writes or not node.write_time.IsExpired():
                 continue
 
-            for (section, name), value in node.pending_writes.items():
-                node.ini_handler.write_key(section, name, value)
-                node.cached_values[(section, name)] = value
-
-            node.pending_writes.clear()
-            node.needs_flush = False
+            IniManager._flush_node(node)
+            # on failure the writes stay pending and are retried next interval
             node.write_time.Reset()
             node.write_time.Start()
 
+    def flush(self, key: str = "") -> None:
+        """Write pending changes now instead of waiting for the flush interval (all nodes when key is empty)."""
+        nodes = [self._handlers[key]] if key in self._handlers else ([] if key else list(self._handlers.values()))
+        for node in nodes:
+            if node.pending_writes:
+                IniManager._flush_node(node)
+
+    def get_flush_stats(self, key: str = "") -> dict[str, FlushStats]:
+        """Disk write statistics per config key (only `key` when given)."""
+        if key:
+            node = self._handlers.get(key)
+            return {key: node.flush_stats} if node else {}
+        return {k: node.flush_stats for k, node in self._handlers.items()}
+
 
     def reload(self, key: str):
         node = self._handlers.get(key)
-        return node.ini_handler.reload() if node else None
+        return node.ini_handler.reload(force=True) if node else None
 
 
     def save(self, key: str, config):
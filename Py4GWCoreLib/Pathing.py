@@ -3,6 +3,19 @@ import PyPathing
 import math
 import heapq
 import pickle
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the vectorized post-processing pipeline needs it
+    np = None
 
 from .enums import name_to_map_id
 from typing import List, Tuple, Optional, Dict
@@ -11,6 +24,11 @@ from Py4GWCoreLib import Utils
 from Py4GWCoreLib.Map import Map
 from Py4GWCoreLib.native_src.context.MapContext import PathingTrapezoid
 
+def _require_numpy(caller: str) -> None:
+    """Raise a clear ImportError from the *_np helpers when NumPy is not installed."""
+    if np is None:
+        raise ImportError(f"{caller} requires numpy; install it or use the pure-Python variant.")
+
 class AABB:
     """Axis-aligned bounding box for trapezoid geometry checks."""
     def __init__(self, t: PathingTrapezoid):
@@ -101,6 +119,54 @@ class TrapezoidBSP:
                     stack.append(node.above)
         return None
 
+    def to_arrays(self, index_of: Dict[int, int]):
+        """Flatten the tree in preorder into packed arrays.
+
+        Returns (split_y, above, below, leaf_start, leaf_count, items) where leaves
+        have above == below == -1 and items holds dense trapezoid indices.
+        """
+        split_y, above, below = array('d'), array('i'), array('i')
+        leaf_start, leaf_count, items = array('i'), array('i'), array('i')
+        if self._root is None:
+            return split_y, above, below, leaf_start, leaf_count, items
+
+        def emit(node) -> int:
+            idx = len(split_y)
+            split_y.append(0.0); above.append(-1); below.append(-1)
+            leaf_start.append(0); leaf_count.append(0)
+            if isinstance(node, _BspLeaf):
+                leaf_start[idx] = len(items)
+                leaf_count[idx] = len(node.traps)
+                items.extend(index_of[t.id] for t in node.traps)
+            else:
+                split_y[idx] = node.split_y
+                above[idx] = emit(node.above)
+                below[idx] = emit(node.below)
+            return idx
+
+        emit(self._root)
+        return split_y, above, below, leaf_start, leaf_count, items
+
+    @classmethod
+    def from_arrays(cls, split_y, above, below, leaf_start, leaf_count, items, traps: list) -> "TrapezoidBSP":
+        """Rebuild a tree flattened by to_arrays; traps is indexed by the dense indices in items."""
+        bsp = cls.__new__(cls)
+        count = len(split_y)
+        if count == 0:
+            bsp._root = None
+            return bsp
+
+        nodes: list = [None] * count
+        # children are always emitted after their parent
+        for idx in range(count - 1, -1, -1):
+            if above[idx] < 0:
+                start = leaf_start[idx]
+                nodes[idx] = _BspLeaf([traps[i] for i in items[start:start + leaf_count[idx]]])
+            else:
+                nodes[idx] = _BspSplit(split_y[idx], nodes[above[idx]], nodes[below[idx]])
+        bsp._root = nodes[0]
+        return bsp
+
     def find_with_margin(self, x: float, y: float, margin: float) -> bool:
         """Return True if (x, y) is inside a trapezoid with margin inset from edges."""
         if self._root is None:
@@ -133,6 +199,34 @@ class TrapezoidBSP:
 
 #region NavMesh
 
+# Binary navmesh cache format
+_NAVMESH_CACHE_MAGIC = b"P4NM"
+_NAVMESH_CACHE_VERSION = 1
+# magic, version, map_id, pathing hash, trapezoids, edges, bsp nodes, bsp leaf items
+_NAVMESH_CACHE_HEADER = struct.Struct("<4sIIIIIII")
+
+
+def pathing_maps_hash(pathing_maps) -> int:
+    """CRC32 over the trapezoid geometry, neighbors and portals of a set of pathing maps."""
+    crc = 0
+    for layer_idx, layer in enumerate(pathing_maps):
+        values = array('d')
+        for t in layer.trapezoids:
+            neighbors = t.neighbor_ids
+            values.extend((t.id, layer_idx, t.XTL, t.XTR, t.YT, t.XBL, t.XBR, t.YB, len(neighbors)))
+            values.extend(neighbors)
+        for portal in layer.portals:
+            indices = portal.trapezoid_indices
+            values.extend((portal.left_layer_id, portal.right_layer_id, len(indices)))
+            values.extend(indices)
+        crc = zlib.crc32(values.tobytes(), crc)
+    return crc & 0xFFFFFFFF
+
+
+def _align8(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
 # Portal creation tolerances
 _PORTAL_TOLERANCE = 32.0
 _PORTAL_VERT_TOL = 100.2
@@ -154,6 +248,7 @@ class NavMesh:
 
         self.create_all_local_portals()
         self._create_cross_layer_portals_from_snapshots(pathing_maps)
+        self.build_adjacency()
 
     def get_adjacent_side(self, a: PathingTrapezoid, b: PathingTrapezoid) -> Optional[str]:
         if abs(a.YB - b.YT) < 1.0: return 'bottom_top'
@@ -288,6 +383,58 @@ class NavMesh:
                                 self.create_portal(ai, aj, None)
 
 
+    def build_adjacency(self):
+        """Flatten portal_graph into CSR arrays with precomputed edge costs.
+
+        Nodes are dense indices into node_ids / node_x / node_y. The neighbors of
+        node i are adj_targets[adj_offsets[i]:adj_offsets[i + 1]], with the
+        centroid-to-centroid distance of each edge in adj_costs.
+        """
+        node_ids = list(self.trapezoids.keys())
+        node_index = {t_id: i for i, t_id in enumerate(node_ids)}
+        node_x = array('d')
+        node_y = array('d')
+        for t_id in node_ids:
+            cx, cy = self.get_position(t_id)
+            node_x.append(cx)
+            node_y.append(cy)
+
+        adj_offsets = array('i', [0])
+        adj_targets = array('i')
+        adj_costs = array('d')
+        for i, t_id in enumerate(node_ids):
+            seen = set()
+            x, y = node_x[i], node_y[i]
+            for n_id in self.portal_graph.get(t_id, []):
+                j = node_index.get(n_id)
+                if j is None or j == i or j in seen:
+                    continue
+                seen.add(j)
+                adj_targets.append(j)
+                adj_costs.append(math.hypot(node_x[j] - x, node_y[j] - y))
+            adj_offsets.append(len(adj_targets))
+
+        self.node_ids = node_ids
+        self.node_index = node_index
+        self.node_x = node_x
+        self.node_y = node_y
+        self.adj_offsets = adj_offsets
+        self.adj_targets = adj_targets
+        self.adj_costs = adj_costs
+
+    def ensure_adjacency(self):
+        """Build the CSR adjacency if it has not been built yet."""
+        if getattr(self, "adj_offsets", None) is None:
+            self.build_adjacency()
+
+    def get_hierarchy(self) -> "HierarchicalNavMesh":
+        """Return the HierarchicalNavMesh for this mesh, building it on first use."""
+        hierarchy = getattr(self, "_hierarchy", None)
+        if hierarchy is None:
+            hierarchy = HierarchicalNavMesh(self)
+            self._hierarchy = hierarchy
+        return hierarchy
+
     def get_position(self, t_id: int) -> Tuple[float, float]:
         t = self.trapezoids[t_id]
         cx = (t.XTL + t.XTR + t.XBL + t.XBR) / 4
@@ -361,6 +508,158 @@ class NavMesh:
 
 
 
+    # ── Vectorized (NumPy) geometry ──────────────────────────────────────────
+
+    def _get_trap_grid(self):
+        """Uniform grid over the mesh for vectorized point location, built once.
+
+        Returns (params, table, origin_x, origin_y, inv_cell, nx, ny): params is an
+        (N + 1, 6) array of (YB, YT, XBL, XBR, XTL, XTR) whose last row never
+        contains anything, table maps each cell to the padded list of trapezoid rows
+        overlapping it (padding points at that last row).
+        """
+        grid = getattr(self, "_trap_grid", None)
+        if grid is not None:
+            return grid
+
+        traps = list(self.trapezoids.values())
+        count = len(traps)
+        params = np.empty((count + 1, 6), dtype=np.float64)
+        params[:count] = [(t.YB, t.YT, t.XBL, t.XBR, t.XTL, t.XTR) for t in traps]
+        params[count] = (1.0, 0.0, 0.0, 0.0, 0.0, 0.0)  # empty: YB > YT
+
+        yb, yt = params[:count, 0], params[:count, 1]
+        x_min = np.minimum(params[:count, 2], params[:count, 4])
+        x_max = np.maximum(params[:count, 3], params[:count, 5])
+        origin_x, origin_y = float(x_min.min()), float(yb.min())
+        width = max(float(x_max.max()) - origin_x, 1.0)
+        height = max(float(yt.max()) - origin_y, 1.0)
+        cell = max(100.0, 2.0 * math.sqrt(width * height / count))
+        inv_cell = 1.0 / cell
+        nx = int(width * inv_cell) + 1
+        ny = int(height * inv_cell) + 1
+
+        cx0 = ((x_min - origin_x) * inv_cell).astype(np.int64)
+        cx1 = ((x_max - origin_x) * inv_cell).astype(np.int64)
+        cy0 = ((yb - origin_y) * inv_cell).astype(np.int64)
+        cy1 = ((yt - origin_y) * inv_cell).astype(np.int64)
+        cells: List[List[int]] = [[] for _ in range(nx * ny)]
+        for i in range(count):
+            for cy in range(cy0[i], cy1[i] + 1):
+                row = cy * nx
+                for cx in range(cx0[i], cx1[i] + 1):
+                    cells[row + cx].append(i)
+
+        depth = max(1, max(len(c) for c in cells))
+        table = np.full((nx * ny, depth), count, dtype=np.int64)
+        for cell_idx, members in enumerate(cells):
+            if members:
+                table[cell_idx, :len(members)] = members
+
+        grid = (params, table, origin_x, origin_y, inv_cell, nx, ny)
+        self._trap_grid = grid
+        return grid
+
+    def contains_batch(self, xs, ys, margin: float = 20.0):
+        """Vectorized contains(): boolean array telling which (xs[i], ys[i]) lie on the mesh."""
+        _require_numpy("contains_batch")
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        result = np.zeros(xs.shape, dtype=bool)
+        if xs.size == 0 or not self.trapezoids:
+            return result
+
+        params, table, origin_x, origin_y, inv_cell, nx, ny = self._get_trap_grid()
+        fx = np.floor((xs - origin_x) * inv_cell)
+        fy = np.floor((ys - origin_y) * inv_cell)
+        on_grid = (fx >= 0) & (fx < nx) & (fy >= 0) & (fy < ny)
+        if not on_grid.any():
+            return result
+
+        px = xs[on_grid, None]
+        py = ys[on_grid, None]
+        rows = table[fy[on_grid].astype(np.int64) * nx + fx[on_grid].astype(np.int64)]
+        cand = params[rows]  # (M, depth, 6)
+        yb, yt = cand[..., 0], cand[..., 1]
+        xbl, xbr, xtl, xtr = cand[..., 2], cand[..., 3], cand[..., 4], cand[..., 5]
+        trap_height = yt - yb
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (py - yb) / trap_height
+        left_x = xbl + (xtl - xbl) * ratio
+        right_x = xbr + (xtr - xbr) * ratio
+        inside = ((trap_height != 0) & (py >= yb) & (py <= yt) &
+                  (px >= left_x + margin) & (px <= right_x - margin))
+        result[on_grid] = inside.any(axis=1)
+        return result
+
+    @staticmethod
+    def _segment_samples(p1, p2s, step_dist: float):
+        """Interior LOS samples of the segments p1 -> p2s[k], as has_line_of_sight takes them.
+
+        Returns (xs, ys, owner) where owner[i] is the segment index of sample i.
+        """
+        p2s = np.asarray(p2s, dtype=np.float64).reshape(-1, 2)
+        deltas = p2s - np.asarray(p1, dtype=np.float64)
+        dists = np.hypot(deltas[:, 0], deltas[:, 1])
+        steps = (dists / step_dist).astype(np.int64) + 1
+        counts = steps - 1
+        owner = np.repeat(np.arange(len(p2s)), counts)
+        first = np.cumsum(counts) - counts
+        i = np.arange(counts.sum()) - np.repeat(first, counts) + 1
+        frac = i / steps[owner]
+        xs = p1[0] + deltas[owner, 0] * frac
+        ys = p1[1] + deltas[owner, 1] * frac
+        return xs, ys, owner
+
+    def has_line_of_sight_np(self,
+                             p1: Tuple[float, float],
+                             p2: Tuple[float, float],
+                             margin: float = 100,
+                             step_dist: float = 200.0) -> bool:
+        """Vectorized has_line_of_sight(): all samples are tested in one batch."""
+        _require_numpy("has_line_of_sight_np")
+        xs, ys, _ = self._segment_samples(p1, [p2], step_dist)
+        return bool(self.contains_batch(xs, ys, margin).all())
+
+    # candidate segments tested per batch by smooth_path_by_los_np
+    _SMOOTH_BLOCK = 8
+
+    def smooth_path_by_los_np(self, path, margin: float = 100, step_dist: float = 200.0):
+        """Vectorized smooth_path_by_los(): from each kept point the candidate
+        segments are sampled and tested a block at a time, farthest first, and the
+        farthest visible point is kept.
+
+        Accepts and returns an (N, 2) array.
+        """
+        _require_numpy("smooth_path_by_los_np")
+        points = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+        if len(points) <= 2:
+            return points
+
+        block = self._SMOOTH_BLOCK
+        keep = [0]
+        i = 0
+        last = len(points) - 1
+        while i < last:
+            j = i + 1
+            # test the farthest candidates first, one block of segments per batch
+            hi = last
+            while hi > i + 1:
+                lo = max(i + 2, hi - block + 1)
+                candidates = points[lo:hi + 1]
+                xs, ys, owner = self._segment_samples(points[i], candidates, step_dist)
+                blocked = np.zeros(len(candidates), dtype=bool)
+                if xs.size:
+                    blocked[owner[~self.contains_batch(xs, ys, margin)]] = True
+                visible = np.flatnonzero(~blocked)
+                if visible.size:
+                    j = lo + int(visible[-1])
+                    break
+                hi = lo - 1
+            keep.append(j)
+            i = j
+        return points[keep]
+
     def smooth_path_by_los(self,
                            path: List[Tuple[float, float]],
                            margin: float = 100,
@@ -392,6 +691,100 @@ class NavMesh:
             pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
+    @staticmethod
+    def binary_cache_path(folder: str, map_id: int, pathing_hash: int) -> str:
+        return os.path.join(folder, f"navmesh_{map_id}_{pathing_hash:08x}.p4nm")
+
+    def save_binary(self, filepath: str, pathing_hash: int):
+        """Write portals, CSR adjacency and BSP as packed arrays (temp file + rename)."""
+        self.ensure_adjacency()
+        layers = array('i', (self.trap_id_to_layer.get(t_id, 0) for t_id in self.node_ids))
+        bsp_arrays = self._bsp.to_arrays(self.node_index)
+        sections = [array('i', self.node_ids), layers, self.node_x, self.node_y,
+                    self.adj_offsets, self.adj_targets, self.adj_costs, *bsp_arrays]
+
+        header = _NAVMESH_CACHE_HEADER.pack(
+            _NAVMESH_CACHE_MAGIC, _NAVMESH_CACHE_VERSION, self.map_id, pathing_hash,
+            len(self.node_ids), len(self.adj_targets), len(bsp_arrays[0]), len(bsp_arrays[5]))
+
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            offset = len(header)
+            for section in sections:
+                pad = _align8(offset) - offset
+                f.write(b"\0" * pad)
+                data = section.tobytes()
+                f.write(data)
+                offset += pad + len(data)
+        os.replace(tmp_path, filepath)
+
+    @staticmethod
+    def load_binary(pathing_maps, map_id: int, filepath: str, pathing_hash: int) -> Optional["NavMesh"]:
+        """Memory-map a cache written by save_binary. Returns None if missing, stale or corrupt."""
+        if not os.path.isfile(filepath):
+            return None
+
+        nav = NavMesh.__new__(NavMesh)
+        nav.map_id = map_id
+        nav.trapezoids = {}
+        nav.trap_id_to_layer = {}
+        for layer in pathing_maps:
+            nav.trapezoids.update({t.id: t for t in layer.trapezoids})
+
+        try:
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                (magic, version, file_map_id, file_hash,
+                 n_traps, n_edges, n_bsp, n_items) = _NAVMESH_CACHE_HEADER.unpack_from(mm, 0)
+                if (magic != _NAVMESH_CACHE_MAGIC or version != _NAVMESH_CACHE_VERSION
+                        or file_map_id != map_id or file_hash != pathing_hash
+                        or n_traps != len(nav.trapezoids)):
+                    return None
+
+                offset = _NAVMESH_CACHE_HEADER.size
+                def take(typecode: str, count: int) -> array:
+                    nonlocal offset
+                    offset = _align8(offset)
+                    out = array(typecode)
+                    end = offset + count * out.itemsize
+                    if end > len(mm):
+                        raise ValueError("truncated navmesh cache")
+                    out.frombytes(mm[offset:end])
+                    offset = end
+                    return out
+
+                node_ids = take('i', n_traps)
+                layers = take('i', n_traps)
+                nav.node_x = take('d', n_traps)
+                nav.node_y = take('d', n_traps)
+                nav.adj_offsets = take('i', n_traps + 1)
+                nav.adj_targets = take('i', n_edges)
+                nav.adj_costs = take('d', n_edges)
+                bsp_arrays = (take('d', n_bsp), take('i', n_bsp), take('i', n_bsp),
+                              take('i', n_bsp), take('i', n_bsp), take('i', n_items))
+        except (OSError, ValueError, struct.error) as e:
+            Py4GW.Console.Log("NavMesh", f"Ignoring navmesh cache {filepath}: {e}", Py4GW.Console.MessageType.Warning)
+            return None
+
+        nav.node_ids = node_ids.tolist()
+        if any(t_id not in nav.trapezoids for t_id in nav.node_ids):
+            return None
+        nav.node_index = {t_id: i for i, t_id in enumerate(nav.node_ids)}
+        nav.trap_id_to_layer = dict(zip(nav.node_ids, layers))
+
+        portal_graph: Dict[int, List[int]] = {}
+        offsets, targets = nav.adj_offsets, nav.adj_targets
+        for i, t_id in enumerate(nav.node_ids):
+            start, end = offsets[i], offsets[i + 1]
+            if start != end:
+                portal_graph[t_id] = [node_ids[j] for j in targets[start:end]]
+        nav.portal_graph = portal_graph
+
+        traps = [nav.trapezoids[t_id] for t_id in nav.node_ids]
+        nav._bsp = TrapezoidBSP.from_arrays(*bsp_arrays, traps)
+        return nav
+
     @staticmethod
     def load_from_file(pathing_maps, map_id: int, folder: str) -> "NavMesh":
         """Load serialized NavMesh portal graph and rebuild BSP from current trapezoid data."""
@@ -424,6 +817,72 @@ class NavMesh:
 
 #region AStar
 
+def _csr_astar(nav: NavMesh, start: int, goal: int,
+               cluster_of: Optional[array] = None, cluster: int = -1) -> Tuple[Optional[List[int]], int]:
+    """A* over the NavMesh CSR adjacency between dense node indices.
+
+    When cluster_of is given, only nodes with cluster_of[node] == cluster are expanded.
+    Returns (node indices from start to goal or None, number of expansions).
+    """
+    node_x, node_y = nav.node_x, nav.node_y
+    offsets, targets, costs = nav.adj_offsets, nav.adj_targets, nav.adj_costs
+    gx, gy = node_x[goal], node_y[goal]
+
+    g_score: Dict[int, float] = {start: 0.0}
+    came_from: Dict[int, int] = {}
+    open_list = [(math.hypot(gx - node_x[start], gy - node_y[start]), 0.0, start)]
+    heappush, heappop, hypot = heapq.heappush, heapq.heappop, math.hypot
+    inf = math.inf
+    expansions = 0
+
+    while open_list:
+        _, g, current = heappop(open_list)
+        if current == goal:
+            nodes = [goal]
+            while current in came_from:
+                current = came_from[current]
+                nodes.append(current)
+            nodes.reverse()
+            return nodes, expansions
+        if g > g_score.get(current, inf):
+            continue  # stale heap entry
+        expansions += 1
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            if cluster_of is not None and cluster_of[neighbor] != cluster:
+                continue
+            new_cost = g + costs[k]
+            if new_cost < g_score.get(neighbor, inf):
+                g_score[neighbor] = new_cost
+                came_from[neighbor] = current
+                priority = new_cost + hypot(gx - node_x[neighbor], gy - node_y[neighbor])
+                heappush(open_list, (priority, new_cost, neighbor))
+    return None, expansions
+
+
+def _csr_dijkstra(nav: NavMesh, source: int, cluster_of: array, cluster: int) -> Dict[int, float]:
+    """Distances from source to every node of its cluster, moving only inside the cluster."""
+    offsets, targets, costs = nav.adj_offsets, nav.adj_targets, nav.adj_costs
+    dist: Dict[int, float] = {source: 0.0}
+    open_list = [(0.0, source)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    inf = math.inf
+    while open_list:
+        d, current = heappop(open_list)
+        if d > dist.get(current, inf):
+            continue
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            if cluster_of[neighbor] != cluster:
+                continue
+            nd = d + costs[k]
+            if nd < dist.get(neighbor, inf):
+                dist[neighbor] = nd
+                heappush(open_list, (nd, neighbor))
+    return dist
+
+
 class AStarNode:
     def __init__(self, node_id, g, f, parent=None):
         self.id = node_id
@@ -432,7 +891,14 @@ class AStarNode:
         self.parent = parent
     def __lt__(self, other): return self.f < other.f
 
+# Marks a cached (start, goal) pair that has no path
+_NO_PATH: Tuple[Tuple[float, float], ...] = ()
+
 class AStar:
+    # LRU of (map_id, start trapezoid, goal trapezoid) -> trapezoid centroid route
+    PATH_CACHE_SIZE = 256
+    _path_cache: "OrderedDict[Tuple[int, int, int], Tuple[Tuple[float, float], ...]]" = OrderedDict()
+
     def __init__(self, navmesh: NavMesh):
         self.navmesh = navmesh
         self.path: List[Tuple[float, float]] = []
@@ -442,6 +908,29 @@ class AStar:
         bx, by = self.navmesh.get_position(b)
         return math.hypot(bx - ax, by - ay)
 
+    @staticmethod
+    def clear_path_cache():
+        AStar._path_cache.clear()
+
+    @staticmethod
+    def _cache_get(key: Tuple[int, int, int]) -> Optional[Tuple[Tuple[float, float], ...]]:
+        route = AStar._path_cache.get(key)
+        if route is not None:
+            AStar._path_cache.move_to_end(key)
+        return route
+
+    @staticmethod
+    def _cache_put(key: Tuple[int, int, int], route: Tuple[Tuple[float, float], ...]):
+        AStar._path_cache[key] = route
+        AStar._path_cache.move_to_end(key)
+        while len(AStar._path_cache) > AStar.PATH_CACHE_SIZE:
+            AStar._path_cache.popitem(last=False)
+
+    def _search_nodes(self, start: int, goal: int) -> Optional[List[int]]:
+        """A* over the CSR adjacency. Returns the dense node indices from start to goal."""
+        nodes, _ = _csr_astar(self.navmesh, start, goal)
+        return nodes
+
     def search(self, start_pos: Tuple[float, float], goal_pos: Tuple[float, float]) -> bool:
         start_id = self.navmesh.find_trapezoid_id_by_coord(start_pos)
         goal_id = self.navmesh.find_trapezoid_id_by_coord(goal_pos)
@@ -450,30 +939,26 @@ class AStar:
             Py4GW.Console.Log("A-Star", f"Invalid start or goal trapezoid: {start_id}, {goal_id}", Py4GW.Console.MessageType.Error)
             return False
 
-        open_list: List[AStarNode] = []
-        heapq.heappush(open_list, AStarNode(start_id, 0, self.heuristic(start_id, goal_id)))
-        came_from: Dict[int, int] = {}
-        cost_so_far: Dict[int, float] = {start_id: 0}
-
-        while open_list:
-            current = heapq.heappop(open_list)
-            if current.id == goal_id:
-                self._reconstruct(came_from, goal_id)
-                # Prepend exact start position, append exact goal position
-                self.path.insert(0, start_pos)
-                self.path.append(goal_pos)
-                return True
+        key = (self.navmesh.map_id, start_id, goal_id)
+        route = AStar._cache_get(key)
+        if route is None:
+            nav = self.navmesh
+            nav.ensure_adjacency()
+            nodes = self._search_nodes(nav.node_index[start_id], nav.node_index[goal_id])
+            if nodes is None:
+                route = _NO_PATH
+            else:
+                route = tuple((nav.node_x[i], nav.node_y[i]) for i in nodes)
+            AStar._cache_put(key, route)
 
-            for neighbor in self.navmesh.get_neighbors(current.id):
-                new_cost = cost_so_far[current.id] + self.heuristic(current.id, neighbor)
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self.heuristic(neighbor, goal_id)
-                    heapq.heappush(open_list, AStarNode(neighbor, new_cost, priority, current.id))
-                    came_from[neighbor] = current.id
+        if route is _NO_PATH:
+            Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
+            self.path = []
+            return False
 
-        Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
-        return False
+        # Prepend exact start position, append exact goal position
+        self.path = [start_pos, *route, goal_pos]
+        return True
 
     def _reconstruct(self, came_from: Dict[int, int], end_id: int):
         self.path = []
@@ -487,6 +972,285 @@ class AStar:
         return self.path
 
 
+#region Hierarchical
+
+class HierarchicalNavMesh:
+    """Two-level abstraction of a NavMesh for long routes (HPA*-style).
+
+    Trapezoids are grouped into clusters: connected components inside square
+    grid cells of cluster_size. Each contiguous run of portal edges between
+    two clusters becomes one entrance pair, or a few when the run is longer
+    than entrance_spacing. The abstract graph links the two sides of an
+    entrance through their portal edge and entrances of the same cluster with
+    their in-cluster shortest distance. The distance from every entrance to
+    every trapezoid of its cluster is kept, so connecting the start and goal
+    of a query is a table lookup and a long query only expands entrances.
+    """
+
+    CLUSTER_SIZE = 2500.0
+
+    def __init__(self, navmesh: NavMesh, cluster_size: float = CLUSTER_SIZE,
+                 entrance_spacing: Optional[float] = None):
+        navmesh.ensure_adjacency()
+        self.navmesh = navmesh
+        self.cluster_size = cluster_size
+        self.entrance_spacing = cluster_size / 2 if entrance_spacing is None else entrance_spacing
+
+        offsets, targets, costs = navmesh.adj_offsets, navmesh.adj_targets, navmesh.adj_costs
+        node_x, node_y = navmesh.node_x, navmesh.node_y
+        count = len(navmesh.node_ids)
+        inv = 1.0 / cluster_size
+        cells = [(int(math.floor(node_x[i] * inv)), int(math.floor(node_y[i] * inv))) for i in range(count)]
+
+        cluster_of = array('i', [-1]) * count
+        clusters: List[List[int]] = []
+        for seed in range(count):
+            if cluster_of[seed] >= 0:
+                continue
+            cluster_id = len(clusters)
+            cell = cells[seed]
+            members = [seed]
+            cluster_of[seed] = cluster_id
+            stack = [seed]
+            while stack:
+                node = stack.pop()
+                for k in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[k]
+                    if cluster_of[neighbor] < 0 and cells[neighbor] == cell:
+                        cluster_of[neighbor] = cluster_id
+                        members.append(neighbor)
+                        stack.append(neighbor)
+            clusters.append(members)
+
+        self.cluster_of = cluster_of
+        self.clusters = clusters
+        self.abstract_edges: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        entrances: Dict[int, List[int]] = defaultdict(list)
+
+        for a, b, cost in self._select_entrances():
+            for node, other in ((a, b), (b, a)):
+                if node not in self.abstract_edges:
+                    entrances[cluster_of[node]].append(node)
+                self.abstract_edges[node].append((other, cost))
+
+        # In-cluster distances from each entrance, reused by every query
+        self.entrance_dist: Dict[int, Dict[int, float]] = {}
+        for cluster_id, nodes in entrances.items():
+            for node in nodes:
+                dist = _csr_dijkstra(navmesh, node, cluster_of, cluster_id)
+                self.entrance_dist[node] = dist
+                for other in nodes:
+                    if other != node and other in dist:
+                        self.abstract_edges[node].append((other, dist[other]))
+
+        self.entrances = dict(entrances)
+
+    def _select_entrances(self) -> List[Tuple[int, int, float]]:
+        """Representative portal edges (a, b, cost) of every border run between two clusters."""
+        nav, cluster_of = self.navmesh, self.cluster_of
+        offsets, targets, costs = nav.adj_offsets, nav.adj_targets, nav.adj_costs
+        node_x, node_y = nav.node_x, nav.node_y
+
+        border: Dict[Tuple[int, int], List[Tuple[int, int, float]]] = defaultdict(list)
+        for node in range(len(cluster_of)):
+            cluster_a = cluster_of[node]
+            for k in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[k]
+                cluster_b = cluster_of[neighbor]
+                if cluster_a < cluster_b:
+                    border[(cluster_a, cluster_b)].append((node, neighbor, costs[k]))
+
+        selected: List[Tuple[int, int, float]] = []
+        for edges in border.values():
+            # Border trapezoids of this cluster pair, joined into runs by the
+            # portal edges between them and by in-cluster adjacency
+            parent: Dict[int, int] = {}
+
+            def find(n: int) -> int:
+                while parent[n] != n:
+                    parent[n] = parent[parent[n]]
+                    n = parent[n]
+                return n
+
+            for a, b, _ in edges:
+                parent.setdefault(a, a)
+                parent.setdefault(b, b)
+                parent[find(a)] = find(b)
+            for node in list(parent):
+                for k in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[k]
+                    if neighbor in parent and cluster_of[neighbor] == cluster_of[node]:
+                        parent[find(node)] = find(neighbor)
+
+            runs: Dict[int, List[Tuple[int, int, float]]] = defaultdict(list)
+            for edge in edges:
+                runs[find(edge[0])].append(edge)
+            for run in runs.values():
+                selected.extend(self._split_run(run, node_x, node_y))
+        return selected
+
+    def _split_run(self, run: List[Tuple[int, int, float]], node_x: array, node_y: array) -> List[Tuple[int, int, float]]:
+        """Middle portal edge of each entrance_spacing-long piece of a border run."""
+        if len(run) == 1:
+            return run
+        mids = [((node_x[a] + node_x[b]) * 0.5, (node_y[a] + node_y[b]) * 0.5) for a, b, _ in run]
+        xs = [m[0] for m in mids]
+        ys = [m[1] for m in mids]
+        axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+        order = sorted(range(len(run)), key=lambda i: mids[i][axis])
+
+        picks: List[Tuple[int, int, float]] = []
+        chunk: List[int] = []
+        for i in order:
+            if chunk and mids[i][axis] - mids[chunk[0]][axis] > self.entrance_spacing:
+                picks.append(run[chunk[len(chunk) // 2]])
+                chunk = []
+            chunk.append(i)
+        picks.append(run[chunk[len(chunk) // 2]])
+        return picks
+
+    def _entrance_links(self, node: int) -> List[Tuple[int, float]]:
+        """(entrance, in-cluster distance) for every entrance of node's cluster."""
+        links = []
+        for entrance in self.entrances.get(self.cluster_of[node], []):
+            dist = self.entrance_dist[entrance].get(node)
+            if dist is not None:
+                links.append((entrance, dist))
+        return links
+
+    def find_path(self, start_pos: Tuple[float, float], goal_pos: Tuple[float, float]) -> Optional["HierarchicalPath"]:
+        """Plan an abstract route between two positions. Returns None if either end is off-mesh or unreachable."""
+        nav = self.navmesh
+        start_id = nav.find_trapezoid_id_by_coord(start_pos)
+        goal_id = nav.find_trapezoid_id_by_coord(goal_pos)
+        if start_id is None or goal_id is None:
+            return None
+        start, goal = nav.node_index[start_id], nav.node_index[goal_id]
+        nodes, expansions = self._search_abstract(start, goal)
+        if nodes is None:
+            return None
+        return HierarchicalPath(self, nodes, start_pos, goal_pos, expansions)
+
+    def _search_abstract(self, start: int, goal: int) -> Tuple[Optional[List[int]], int]:
+        nav, cluster_of = self.navmesh, self.cluster_of
+        node_x, node_y = nav.node_x, nav.node_y
+        if start == goal:
+            return [start], 0
+
+        # Temporary links from start into its cluster and from the goal cluster to goal
+        expansions = 0
+        start_edges = self._entrance_links(start)
+        goal_links = dict(self._entrance_links(goal))
+        if cluster_of[start] == cluster_of[goal]:
+            nodes, expansions = _csr_astar(nav, start, goal, cluster_of, cluster_of[start])
+            if nodes is not None:
+                direct = sum(math.hypot(node_x[b] - node_x[a], node_y[b] - node_y[a]) for a, b in zip(nodes, nodes[1:]))
+                start_edges.append((goal, direct))
+
+        gx, gy = node_x[goal], node_y[goal]
+        hypot = math.hypot
+        inf = math.inf
+        g_score: Dict[int, float] = {start: 0.0}
+        came_from: Dict[int, int] = {}
+        open_list = [(hypot(gx - node_x[start], gy - node_y[start]), 0.0, start)]
+
+        while open_list:
+            _, g, current = heapq.heappop(open_list)
+            if current == goal:
+                nodes = [goal]
+                while current in came_from:
+                    current = came_from[current]
+                    nodes.append(current)
+                nodes.reverse()
+                return nodes, expansions
+            if g > g_score.get(current, inf):
+                continue
+            expansions += 1
+
+            edges = self.abstract_edges.get(current, [])
+            if current == start:
+                edges = edges + start_edges
+            to_goal = goal_links.get(current)
+            if to_goal is not None:
+                edges = edges + [(goal, to_goal)]
+
+            for neighbor, cost in edges:
+                new_cost = g + cost
+                if new_cost < g_score.get(neighbor, inf):
+                    g_score[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(open_list, (new_cost + hypot(gx - node_x[neighbor], gy - node_y[neighbor]), new_cost, neighbor))
+        return None, expansions
+
+    def refine_segment(self, a: int, b: int) -> Tuple[List[int], int]:
+        """Concrete node indices after `a` up to and including `b` for one abstract hop."""
+        if self.cluster_of[a] != self.cluster_of[b]:
+            return [b], 0  # portal edge between neighboring clusters
+        nodes, expansions = _csr_astar(self.navmesh, a, b, self.cluster_of, self.cluster_of[a])
+        if nodes is None:
+            return [b], expansions
+        return nodes[1:], expansions
+
+
+class HierarchicalPath:
+    """Abstract route from HierarchicalNavMesh.find_path, refined segment by segment on demand."""
+
+    def __init__(self, hierarchy: HierarchicalNavMesh, abstract_nodes: List[int],
+                 start_pos: Tuple[float, float], goal_pos: Tuple[float, float], expansions: int):
+        self.hierarchy = hierarchy
+        self.abstract_nodes = abstract_nodes
+        self.start_pos = start_pos
+        self.goal_pos = goal_pos
+        self.expansions = expansions
+        self._next_segment = 0
+        self._refined_nodes: List[int] = abstract_nodes[:1]
+        self._refined: List[Tuple[float, float]] = [start_pos, self._position(abstract_nodes[0])]
+
+    def _position(self, node: int) -> Tuple[float, float]:
+        nav = self.hierarchy.navmesh
+        return (nav.node_x[node], nav.node_y[node])
+
+    @property
+    def is_refined(self) -> bool:
+        return self._next_segment >= len(self.abstract_nodes) - 1
+
+    def get_coarse_path(self) -> List[Tuple[float, float]]:
+        """Start, entrance centroids and goal of the abstract route."""
+        return [self.start_pos, *(self._position(n) for n in self.abstract_nodes), self.goal_pos]
+
+    def refine(self, segments: int = 1) -> List[Tuple[float, float]]:
+        """Refine the next `segments` abstract hops and return the newly added points."""
+        added: List[Tuple[float, float]] = []
+        while segments > 0 and not self.is_refined:
+            a = self.abstract_nodes[self._next_segment]
+            b = self.abstract_nodes[self._next_segment + 1]
+            nodes, expansions = self.hierarchy.refine_segment(a, b)
+            self.expansions += expansions
+            self._refined_nodes.extend(nodes)
+            added.extend(self._position(n) for n in nodes)
+            self._next_segment += 1
+            segments -= 1
+        if self.is_refined and (not self._refined or self._refined[-1] != self.goal_pos):
+            added.append(self.goal_pos)
+        self._refined.extend(added)
+        return added
+
+    def refine_ahead(self, position: Tuple[float, float], lookahead: float = 2500.0) -> List[Tuple[float, float]]:
+        """Refine until the refined part of the route reaches `lookahead` beyond `position`."""
+        while not self.is_refined and math.dist(position, self._refined[-1]) < lookahead:
+            self.refine(1)
+        return self.get_refined_path()
+
+    def get_refined_path(self) -> List[Tuple[float, float]]:
+        """Concrete path refined so far, starting at start_pos."""
+        return list(self._refined)
+
+    def get_path(self) -> List[Tuple[float, float]]:
+        """Refine every remaining hop and return the full concrete path."""
+        self.refine(len(self.abstract_nodes))
+        return self.get_refined_path()
+
+
 def chaikin_smooth_path(points: List[Tuple[float, float]], iterations: int = 1) -> List[Tuple[float, float]]:
     for _ in range(iterations):
         new_points = [points[0]]
@@ -532,6 +1296,43 @@ def densify_path2d(points: List[Tuple[float, float]], threshold: float = 500.0)
     return out
 
 
+def chaikin_smooth_path_np(points, iterations: int = 1):
+    """Vectorized chaikin_smooth_path() over an (N, 2) array."""
+    _require_numpy("chaikin_smooth_path_np")
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    for _ in range(iterations):
+        p0 = points[:-1]
+        p1 = points[1:]
+        corners = np.empty((2 * len(p0), 2), dtype=np.float64)
+        corners[0::2] = 0.75 * p0 + 0.25 * p1
+        corners[1::2] = 0.25 * p0 + 0.75 * p1
+        points = np.concatenate((points[:1], corners, points[-1:]))
+    return points
+
+
+def densify_path2d_np(points, threshold: float = 500.0):
+    """Vectorized densify_path2d() over an (N, 2) array."""
+    _require_numpy("densify_path2d_np")
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if threshold <= 0 or len(points) <= 1:
+        return points.copy()
+
+    eps = 1e-6
+    p0 = points[:-1]
+    deltas = points[1:] - p0
+    dists = np.hypot(deltas[:, 0], deltas[:, 1])
+    # intermediate points at threshold, 2*threshold, ... strictly before the segment end
+    inner = np.where(dists > threshold + eps, np.ceil((dists - eps) / threshold) - 1, 0).astype(np.int64)
+    counts = inner + 1
+    owner = np.repeat(np.arange(len(p0)), counts)
+    first = np.cumsum(counts) - counts
+    k = np.arange(counts.sum()) - np.repeat(first, counts)
+    safe = np.where(dists > 0, dists, 1.0)
+    frac = np.where(k < inner[owner], (k + 1) * threshold / safe[owner], 1.0)
+    out = p0[owner] + deltas[owner] * frac[:, None]
+    return np.concatenate((points[:1], out))
+
+
 PATHING_MAP_GROUPS = [
     [
         name_to_map_id["Great Temple of Balthazar"],
@@ -625,6 +1426,14 @@ PATHING_MAP_GROUPS = [
     ],
 ]
 
+class NavMeshStatus(Enum):
+    """State of the NavMesh for the current map, as reported by AutoPathing."""
+    MISSING = "missing"   # no pathing data for this map (outpost/loading) or build not requested
+    PENDING = "pending"   # being built on the background thread
+    READY = "ready"       # loaded and usable
+    FAILED = "failed"     # background build raised
+
+
 class AutoPathing:
     _instance = None
 
@@ -641,6 +1450,14 @@ class AutoPathing:
         self.is_ready: bool = False
         self.pathing_map_cache: dict[tuple[int, ...], NavMesh] = {}
         self._last_group_key: Optional[tuple[int, ...]] = None
+        self.use_binary_cache: bool = True
+        self.binary_cache_folder: str = os.path.join(Py4GW.Console.get_projects_path(), "NavMeshCache")
+        # Build the NavMesh on a worker thread instead of inside load_pathing_maps/get_path
+        self.async_build: bool = False
+        self.last_path_status: NavMeshStatus = NavMeshStatus.MISSING
+        self._build_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_builds: dict[tuple[int, ...], tuple[int, Future]] = {}
+        self._failed_builds: dict[tuple[int, ...], int] = {}  # group -> map_id whose build raised
         self._initialized = True
 
     def _get_group_key(self, map_id: int) -> tuple[int, ...]:
@@ -658,16 +1475,108 @@ class AutoPathing:
         group_key = self._get_group_key(map_id)
         yield
 
+        if self.async_build:
+            # Poll the worker instead of building on this thread
+            self.start_navmesh_build()
+            while self.get_navmesh_status() == NavMeshStatus.PENDING:
+                yield
+            return
+
         cached = self.pathing_map_cache.get(group_key)
         if cached is not None and cached.map_id == map_id and cached.trapezoids:
             yield
             return
         pathing_maps = Map.Pathing.GetPathingMaps()
-        navmesh = NavMesh(pathing_maps, map_id) if pathing_maps else None
+        navmesh = self._build_navmesh(pathing_maps, map_id) if pathing_maps else None
         if navmesh and navmesh.trapezoids:
             self.pathing_map_cache[group_key] = navmesh
         yield
 
+    def _build_navmesh(self, pathing_maps, map_id: int) -> NavMesh:
+        """Load the NavMesh from the binary cache, or build it and refresh the cache."""
+        if not self.use_binary_cache:
+            return NavMesh(pathing_maps, map_id)
+
+        pathing_hash = pathing_maps_hash(pathing_maps)
+        filepath = NavMesh.binary_cache_path(self.binary_cache_folder, map_id, pathing_hash)
+        navmesh = NavMesh.load_binary(pathing_maps, map_id, filepath, pathing_hash)
+        if navmesh is not None:
+            return navmesh
+
+        navmesh = NavMesh(pathing_maps, map_id)
+        if navmesh.trapezoids:
+            try:
+                navmesh.save_binary(filepath, pathing_hash)
+            except OSError as e:
+                Py4GW.Console.Log("NavMesh", f"Failed to write navmesh cache {filepath}: {e}", Py4GW.Console.MessageType.Warning)
+        return navmesh
+
+
+    def _collect_build(self, group_key: tuple[int, ...]) -> None:
+        """Move a finished background build into pathing_map_cache (main thread only)."""
+        pending = self._pending_builds.get(group_key)
+        if pending is None or not pending[1].done():
+            return
+        del self._pending_builds[group_key]
+        try:
+            navmesh = pending[1].result()
+        except Exception as e:
+            self._failed_builds[group_key] = pending[0]
+            Py4GW.Console.Log("AutoPathing", f"Background NavMesh build for map {pending[0]} failed: {e}", Py4GW.Console.MessageType.Error)
+            return
+        if navmesh is not None and navmesh.trapezoids:
+            self.pathing_map_cache[group_key] = navmesh
+            self._failed_builds.pop(group_key, None)
+
+    def _build_failed(self, group_key: tuple[int, ...], map_id: int) -> bool:
+        """True while the background build for this map has failed; entering another map allows a new attempt."""
+        if any(failed_map != map_id for failed_map in self._failed_builds.values()):
+            self._failed_builds = {key: failed_map for key, failed_map in self._failed_builds.items() if failed_map == map_id}
+        return group_key in self._failed_builds
+
+    def start_navmesh_build(self) -> NavMeshStatus:
+        """Snapshot the pathing maps on this thread and build the NavMesh on the worker thread.
+
+        Returns immediately; poll get_navmesh_status() or get_navmesh() for the result.
+        A build that raised is reported as FAILED and not retried until the map changes.
+        """
+        map_id = Map.GetMapID()
+        if not map_id or not Map.IsMapReady():
+            return NavMeshStatus.MISSING
+
+        group_key = self._get_group_key(map_id)
+        if self.get_navmesh() is not None:
+            return NavMeshStatus.READY
+        if self._build_failed(group_key, map_id):
+            return NavMeshStatus.FAILED  # don't rebuild a failing map on every request
+
+        pending = self._pending_builds.get(group_key)
+        if pending is not None and pending[0] == map_id:
+            return NavMeshStatus.PENDING
+
+        pathing_maps = Map.Pathing.GetPathingMaps()
+        if not pathing_maps:
+            return NavMeshStatus.MISSING
+
+        if self._build_executor is None:
+            self._build_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NavMeshBuild")
+        future = self._build_executor.submit(self._build_navmesh, pathing_maps, map_id)
+        self._pending_builds[group_key] = (map_id, future)
+        return NavMeshStatus.PENDING
+
+    def get_navmesh_status(self) -> NavMeshStatus:
+        map_id = Map.GetMapID()
+        if not map_id:
+            return NavMeshStatus.MISSING
+        group_key = self._get_group_key(map_id)
+        if self.get_navmesh() is not None:
+            return NavMeshStatus.READY
+        pending = self._pending_builds.get(group_key)
+        if pending is not None and pending[0] == map_id:
+            return NavMeshStatus.PENDING
+        if self._build_failed(group_key, map_id):
+            return NavMeshStatus.FAILED
+        return NavMeshStatus.MISSING
 
     def get_navmesh(self) -> Optional[NavMesh]:
         map_id = Map.GetMapID()
@@ -675,6 +1584,8 @@ class AutoPathing:
             return None
 
         group_key = self._get_group_key(map_id)
+        if self._pending_builds:
+            self._collect_build(group_key)
         nav = self.pathing_map_cache.get(group_key)
 
         if nav is None or nav.map_id != map_id or not nav.trapezoids:
@@ -690,7 +1601,18 @@ class AutoPathing:
                  margin: float = 100,
                  step_dist: float = 200.0,
                  smooth_by_chaikin: bool = False,
-                 chaikin_iterations: int = 1):
+                 chaikin_iterations: int = 1,
+                 straight_line_fallback: bool = False,
+                 vectorized: bool = False):
+        """Plan a path from start to goal (generator, returns [(x, y, z), ...]).
+
+        With async_build enabled and the NavMesh still building, the path is not
+        computed: last_path_status is set to NavMeshStatus.PENDING and the result is
+        [] (or a densified straight line when straight_line_fallback is True).
+
+        vectorized=True runs LOS smoothing, chaikin and densify through the NumPy
+        pipeline (falls back to the Python one when NumPy is not installed).
+        """
         from . import Routines
 
         def _prepend_start(path2d, sx, sy):
@@ -707,11 +1629,40 @@ class AutoPathing:
 
             return path2d
 
+        use_np = vectorized and np is not None
+
+        def _finish_np(navmesh, path2d):
+            points = np.asarray(path2d, dtype=np.float64)
+            if navmesh is not None and smooth_by_los:
+                points = navmesh.smooth_path_by_los_np(points, margin, step_dist)
+            if smooth_by_chaikin:
+                points = chaikin_smooth_path_np(points, chaikin_iterations)
+            points = densify_path2d_np(points)
+            return [(x, y, start[2]) for (x, y) in points.tolist()]
+
+        def _finish_navmesh_path(navmesh, raw_path):
+            raw_path = _prepend_start(raw_path, start[0], start[1])
+            if use_np:
+                return _finish_np(navmesh, raw_path)
+            if smooth_by_los:
+                smoothed = navmesh.smooth_path_by_los(raw_path, margin, step_dist)
+            else:
+                smoothed = raw_path
+
+            if smooth_by_chaikin:
+                smoothed = chaikin_smooth_path(smoothed, chaikin_iterations)
+
+            path2d = densify_path2d(smoothed)  # split long hops into ≤750
+
+            return [(x, y, start[2]) for (x, y) in path2d]
+
         map_id = Map.GetMapID()
         if not map_id:
+            self.last_path_status = NavMeshStatus.MISSING
             yield
             return []
         group_key = self._get_group_key(map_id)
+        self.last_path_status = NavMeshStatus.READY
 
         # --- Try fast planner first ---
         path_planner = PyPathing.PathPlanner()
@@ -733,6 +1684,8 @@ class AutoPathing:
                 path2d = [(pt[0], pt[1]) for pt in raw_path]
 
                 path2d = _prepend_start(path2d, start[0], start[1])
+                if use_np:
+                    return _finish_np(None, path2d)
 
                 if smooth_by_chaikin:
                     path2d = chaikin_smooth_path(path2d, chaikin_iterations)
@@ -745,10 +1698,19 @@ class AutoPathing:
             yield
 
         navmesh = self.get_navmesh()
+        if not navmesh and self.async_build:
+            self.last_path_status = self.start_navmesh_build()
+            yield
+            if straight_line_fallback and self.last_path_status == NavMeshStatus.PENDING:
+                path2d = densify_path2d([(start[0], start[1]), (goal[0], goal[1])])
+                return [(x, y, start[2]) for (x, y) in path2d]
+            return []
+
         if not navmesh:
             yield from self.load_pathing_maps()
             navmesh = self.get_navmesh()
             if not navmesh:
+                self.last_path_status = NavMeshStatus.MISSING
                 yield
                 return []
 
@@ -761,27 +1723,39 @@ class AutoPathing:
         if success:
             raw_path = astar.get_path()
             yield
-            raw_path = _prepend_start(raw_path, start[0], start[1])
-            if smooth_by_los:
-                smoothed = navmesh.smooth_path_by_los(raw_path, margin, step_dist)
-            else:
-                smoothed = raw_path
+            return _finish_navmesh_path(navmesh, raw_path)
 
-            if smooth_by_chaikin:
-                smoothed = chaikin_smooth_path(smoothed, chaikin_iterations)
+        return []
 
-            path2d = densify_path2d(smoothed)  # split long hops into ≤750
+    def get_hierarchical_path(self,
+                              start: Tuple[float, float, float],
+                              goal: Tuple[float, float, float]):
+        """Plan a long route on the region graph of the current NavMesh (generator).
 
-            return [(x, y, start[2]) for (x, y) in path2d]
+        Returns a HierarchicalPath, or None when no NavMesh/route is available.
+        Call refine()/refine_ahead() while walking to expand it into trapezoid
+        waypoints only as far as needed.
+        """
+        navmesh = self.get_navmesh()
+        if not navmesh:
+            yield from self.load_pathing_maps()
+            navmesh = self.get_navmesh()
+            if not navmesh:
+                yield
+                return None
 
-        return []
+        hierarchy = navmesh.get_hierarchy()
+        yield
+        return hierarchy.find_path((start[0], start[1]), (goal[0], goal[1]))
 
     def get_path_to(self, x: float, y: float,
                     smooth_by_los: bool = True,
                     margin: float = 100,
                     step_dist: float = 200.0,
                     smooth_by_chaikin: bool = False,
-                    chaikin_iterations: int = 1):
+                    chaikin_iterations: int = 1,
+                    straight_line_fallback: bool = False,
+                    vectorized: bool = False):
         from .Agent import Agent
         from .Player import Player
 
@@ -800,5 +1774,7 @@ class AutoPathing:
                                         margin=margin,
                                         step_dist=step_dist,
                                         smooth_by_chaikin=smooth_by_chaikin,
-                                        chaikin_iterations=chaikin_iterations)
+                                        chaikin_iterations=chaikin_iterations,
+                                        straight_line_fallback=straight_line_fallback,
+                                        vectorized=vectorized)
         return [(x, y) for (x, y, _) in path]
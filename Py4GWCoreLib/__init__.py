@@ -88,6 +88,8 @@ from .BuildMgr import BuildMgr
 from .Botting import BottingClass as Botting
 from .Context import GWContext
 from .CombatEvents import CombatEvents
+from .AgentSpatialIndex import AgentSpatialIndex
+from .AgentSnapshot import AgentSnapshot
 from .IniManager import IniManager
 from .GWUI import GWUI
 
@@ -22,6 +22,45 @@ class SharedMemoryHeader(Structure):
     process_id: int
     window_handle: int
 
+# AgentArraySHMemStruct field -> (ctype, offset, size)
+_AGENT_FIELDS = {
+    name: (ctype, getattr(AgentArraySHMemStruct, name).offset, getattr(AgentArraySHMemStruct, name).size)
+    for name, ctype in AgentArraySHMemStruct._fields_
+}
+
+
+class LazyAgentArraySHMem:
+    """
+    Stand-in for AgentArraySHMemStruct that copies fields out of the mapping on demand.
+
+    A field is copied the first time it is read and then kept for the rest of
+    the frame, so a frame that only asks for the enemy array copies roughly
+    2.4 KB instead of the whole agent block. Every field copy re-checks the
+    header sequence against the one taken in PreUpdate; on mismatch (the
+    writer published mid-frame) the manager does one full seqlock copy and all
+    fields not yet read come from it.
+    """
+
+    def __init__(self, manager: "SystemSharedMemoryManager", sequence: int):
+        self._manager = manager
+        self._sequence = sequence
+        self._fallback: AgentArraySHMemStruct | None = None
+
+    def __getattr__(self, name: str):
+        if name not in _AGENT_FIELDS:
+            raise AttributeError(name)
+        value = None
+        if self._fallback is None:
+            value = self._manager._read_agent_field(name, self._sequence)
+            if value is None:
+                self._fallback = self._manager._fallback_agent_array()
+        if self._fallback is not None:
+            value = getattr(self._fallback, name)
+        # cached on the instance, __getattr__ is not consulted again for this field
+        self.__dict__[name] = value
+        return value
+
+
 class SystemSharedMemoryManager:
     _instance = None  # Singleton instance
     def __new__(cls):
@@ -44,10 +83,13 @@ class SystemSharedMemoryManager:
             self.expected_size = self.end_pointers
             self.size = 0
             self.header_struct: SharedMemoryHeader | None = None
-            self.agent_array_struct: AgentArraySHMemStruct | None = None
+            self.agent_array_struct: AgentArraySHMemStruct | LazyAgentArraySHMem | None = None
             self.agent_array_wrapper: AgentArraySHMemWrapper | None = None
             self.pointers_struct: Pointers_SHMemStruct | None = None
             self.last_error: str = ""
+            self.sequence_offset = SharedMemoryHeader.sequence.offset
+            self.lazy = True
+            self.torn_reads = 0
             self._enabled = False
             self._connect()
             self._initialized = True
@@ -93,22 +135,29 @@ class SystemSharedMemoryManager:
         self.agent_array_wrapper = None
         self.pointers_struct = None
 
-    def get_payload(self):
-        self.reset_data()
-        if not self._connect():
-            return
+    def set_lazy_mode(self, enabled: bool) -> None:
+        """
+        Toggle lazy reads.
 
-        if self.shm is None or self.shm.buf is None:
-            self.last_error = "Shared memory buffer is not available."
-            return
+        Lazy (default): each frame only the header and the small pointers
+        struct are copied; agent array fields are copied out of the mapping the
+        first time they are accessed that frame. Eager: the whole agent array
+        is copied every frame.
+        """
+        self.lazy = bool(enabled)
 
-        if self.size < self.expected_size:
-            self.last_error = (
-                f"Shared memory is too small: got {self.size} bytes, "
-                f"expected at least {self.expected_size} bytes."
-            )
-            return
+    def _read_sequence(self) -> int:
+        return int.from_bytes(
+            self.shm.buf[self.sequence_offset:self.sequence_offset + 4], "little"
+        )
 
+    def _copy_snapshot(self, include_agents: bool = True):
+        """
+        Seqlock read of the header, pointers and (optionally) the whole agent array.
+
+        Returns (header, agent_payload, pointers_payload) or None when the writer
+        kept changing the block; sets last_error on failure.
+        """
         for _ in range(3):
             header_before = SharedMemoryHeader.from_buffer_copy(self.shm.buf[:self.header_size])
             if header_before.sequence & 1:
@@ -119,11 +168,13 @@ class SystemSharedMemoryManager:
                     f"Shared memory header reports {header_before.total_size} bytes, "
                     f"expected at least {self.expected_size} bytes."
                 )
-                return
+                return None
 
-            agent_payload = AgentArraySHMemStruct.from_buffer_copy(
-                self.shm.buf[self.start_agent:self.end_agent]
-            )
+            agent_payload = None
+            if include_agents:
+                agent_payload = AgentArraySHMemStruct.from_buffer_copy(
+                    self.shm.buf[self.start_agent:self.end_agent]
+                )
             pointers_payload = Pointers_SHMemStruct.from_buffer_copy(
                 self.shm.buf[self.start_pointers:self.end_pointers]
             )
@@ -135,15 +186,68 @@ class SystemSharedMemoryManager:
             if header_after.sequence & 1:
                 continue
 
-            self.header_struct = header_after
-            self.agent_array_struct = agent_payload
-            self.agent_array_wrapper = AgentArraySHMemWrapper(agent_payload)
-            self.pointers_struct = pointers_payload
-            self.last_error = ""
-            return
+            return header_after, agent_payload, pointers_payload
 
         self.last_error = "Snapshot changed while reading."
-        return
+        return None
+
+    def _read_agent_field(self, name: str, sequence: int):
+        """
+        Copy one AgentArraySHMemStruct field straight out of the mapping.
+
+        Returns None when the block is gone or the writer published since the
+        frame's sequence was taken (torn read).
+        """
+        shm = self.shm
+        if shm is None or shm.buf is None:
+            return None
+        ctype, offset, size = _AGENT_FIELDS[name]
+        start = self.start_agent + offset
+        value = ctype.from_buffer_copy(shm.buf[start:start + size])
+        if self._read_sequence() != sequence:
+            return None
+        if isinstance(value, ctypes._SimpleCData):
+            return value.value
+        return value
+
+    def _fallback_agent_array(self) -> AgentArraySHMemStruct:
+        """Full seqlock copy used once a lazy read came back torn."""
+        self.torn_reads += 1
+        snapshot = None
+        if self.shm is not None and self.shm.buf is not None:
+            snapshot = self._copy_snapshot()
+        if snapshot is None:
+            return AgentArraySHMemStruct()
+        return snapshot[1]
+
+    def get_payload(self):
+        self.reset_data()
+        if not self._connect():
+            return
+
+        if self.shm is None or self.shm.buf is None:
+            self.last_error = "Shared memory buffer is not available."
+            return
+
+        if self.size < self.expected_size:
+            self.last_error = (
+                f"Shared memory is too small: got {self.size} bytes, "
+                f"expected at least {self.expected_size} bytes."
+            )
+            return
+
+        snapshot = self._copy_snapshot(include_agents=not self.lazy)
+        if snapshot is None:
+            return
+        header, agent_payload, pointers_payload = snapshot
+        if agent_payload is None:
+            agent_payload = LazyAgentArraySHMem(self, header.sequence)
+
+        self.header_struct = header
+        self.agent_array_struct = agent_payload
+        self.agent_array_wrapper = AgentArraySHMemWrapper(agent_payload)
+        self.pointers_struct = pointers_payload
+        self.last_error = ""
 
     def enable(self):
         if self._enabled:
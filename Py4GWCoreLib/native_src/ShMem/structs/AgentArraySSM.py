@@ -1,5 +1,10 @@
 from ctypes import Structure, c_float, c_uint32, c_void_p
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ...internals.types import GamePos, Vec2f
 from .constants import AGENT_ARRAY_MAX_SIZE
 
@@ -37,17 +42,28 @@ class AgentRefArraySHMemStruct(Structure):
     entries: list[AgentRefSHMemStruct]
     
     def to_list(self) -> list[int]:
+        return list(self.to_tuple())
+
+    def to_tuple(self) -> tuple[int, ...]:
+        """Non-zero agent ids of the first `count` entries, in order."""
+        count: int = min(self.count, AGENT_ARRAY_MAX_SIZE)
+        if count <= 0:
+            return ()
+
+        if np is not None:
+            # count word followed by (agent_id, index) pairs
+            words = np.frombuffer(self, dtype=np.uint32, count=1 + 2 * count)
+            ids = words[1::2]
+            return tuple(ids[ids != 0].tolist())
+
         result = []
-        count:int = min(self.count, AGENT_ARRAY_MAX_SIZE)
         entries: list[AgentRefSHMemStruct] = self.entries
-        
-        for i in range(min(count, AGENT_ARRAY_MAX_SIZE)):
-            ref:AgentRefSHMemStruct = entries[i]
-            agent_id = int(ref.agent_id)
+        for i in range(count):
+            agent_id = int(entries[i].agent_id)
             if agent_id == 0:
                 continue
-            result.append(ref.agent_id)
-        return result
+            result.append(agent_id)
+        return tuple(result)
 
 
 
@@ -96,6 +112,7 @@ class AgentArraySHMemWrapper:
     def __init__(self, raw: AgentArraySHMemStruct):
         self._raw = raw
         self._agents_dict: dict[int, AgentSHMemStruct] | None = None
+        self._category_cache: dict[str, tuple[int, ...]] = {}
         
     def _build_agents_dict(self):
         if self._agents_dict is None:
@@ -123,42 +140,49 @@ class AgentArraySHMemWrapper:
     def to_int_list(self) -> list[int]:
         return list(self.to_dict().keys())
 
-    def get_all_array(self) -> list[int]:
-        return self._raw.AllArray.to_list()
-    
-    def get_ally_array(self) -> list[int]:
-        return self._raw.AllyArray.to_list()
+    def _get_category(self, field_name: str) -> tuple[int, ...]:
+        # decoded once per snapshot; the tuple is shared by every caller this frame
+        cached = self._category_cache.get(field_name)
+        if cached is None:
+            cached = getattr(self._raw, field_name).to_tuple()
+            self._category_cache[field_name] = cached
+        return cached
+
+    def get_all_array(self) -> tuple[int, ...]:
+        return self._get_category("AllArray")
     
-    def get_neutral_array(self) -> list[int]:
-        return self._raw.NeutralArray.to_list()
+    def get_ally_array(self) -> tuple[int, ...]:
+        return self._get_category("AllyArray")
     
-    def get_enemy_array(self) -> list[int]:
-        return self._raw.EnemyArray.to_list()
+    def get_neutral_array(self) -> tuple[int, ...]:
+        return self._get_category("NeutralArray")
     
-    def get_spirit_pet_array(self) -> list[int]:
-        return self._raw.SpiritPetArray.to_list()
+    def get_enemy_array(self) -> tuple[int, ...]:
+        return self._get_category("EnemyArray")
     
-    def get_minion_array(self) -> list[int]:
-        return self._raw.MinionArray.to_list()
+    def get_spirit_pet_array(self) -> tuple[int, ...]:
+        return self._get_category("SpiritPetArray")
     
-    def get_npc_minipet_array(self) -> list[int]:
-        return self._raw.NPCMinipetArray.to_list()
+    def get_minion_array(self) -> tuple[int, ...]:
+        return self._get_category("MinionArray")
     
-    def get_living_array(self) -> list[int]:
-        return self._raw.LivingArray.to_list()
+    def get_npc_minipet_array(self) -> tuple[int, ...]:
+        return self._get_category("NPCMinipetArray")
     
-    def get_item_array(self) -> list[int]:
-        return self._raw.ItemArray.to_list()
+    def get_living_array(self) -> tuple[int, ...]:
+        return self._get_category("LivingArray")
     
-    def get_owned_item_array(self) -> list[int]:
-        return self._raw.OwnedItemArray.to_list()
+    def get_item_array(self) -> tuple[int, ...]:
+        return self._get_category("ItemArray")
     
-    def get_gadget_array(self) -> list[int]:
-        return self._raw.GadgetArray.to_list()
+    def get_owned_item_array(self) -> tuple[int, ...]:
+        return self._get_category("OwnedItemArray")
     
-    def get_dead_ally_array(self) -> list[int]:
-        return self._raw.DeadAllyArray.to_list()
+    def get_gadget_array(self) -> tuple[int, ...]:
+        return self._get_category("GadgetArray")
     
-    def get_dead_enemy_array(self) -> list[int]:
-        return self._raw.DeadEnemyArray.to_list()
+    def get_dead_ally_array(self) -> tuple[int, ...]:
+        return self._get_category("DeadAllyArray")
     
+    def get_dead_enemy_array(self) -> tuple[int, ...]:
+        return self._get_category("DeadEnemyArray")
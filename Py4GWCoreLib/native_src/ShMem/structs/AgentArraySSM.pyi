@@ -31,6 +31,7 @@ class AgentRefArraySHMemStruct(Structure):
     count: int
     entries: list[AgentRefSHMemStruct]
     def to_list(self) -> list[int]: ...
+    def to_tuple(self) -> tuple[int, ...]: ...
 
 class AgentArraySHMemStruct(Structure):
     max_size: int
@@ -52,21 +53,23 @@ class AgentArraySHMemStruct(Structure):
     
 class AgentArraySHMemWrapper:
     def __init__(self, struct: AgentArraySHMemStruct):...
-    def _build_agent_dict(self) -> dict[int, AgentSHMemStruct]: ...
+    def _build_agents_dict(self) -> None: ...
+    def _get_category(self, field_name: str) -> tuple[int, ...]: ...
     def get_agent_by_id(self, agent_id: int) -> AgentSHMemStruct | None: ...
     def to_dict(self) -> dict[int, AgentSHMemStruct]: ...
     def to_list(self) -> list[AgentSHMemStruct]: ...
     def to_int_list(self) -> list[int]: ...
-    def get_ally_array(self) -> list[int]:...
-    def get_neutral_array(self) -> list[int]:...
-    def get_enemy_array(self) -> list[int]:...
-    def get_spirit_pet_array(self) -> list[int]:...
-    def get_minion_array(self) -> list[int]:...
-    def get_npc_minipet_array(self) -> list[int]:...
-    def get_living_array(self) -> list[int]:...
-    def get_item_array(self) -> list[int]:...
-    def get_owned_item_array(self) -> list[int]:...
-    def get_gadget_array(self) -> list[int]:...
-    def get_dead_ally_array(self) -> list[int]:...
-    def get_dead_enemy_array(self) -> list[int]:...
+    def get_all_array(self) -> tuple[int, ...]:...
+    def get_ally_array(self) -> tuple[int, ...]:...
+    def get_neutral_array(self) -> tuple[int, ...]:...
+    def get_enemy_array(self) -> tuple[int, ...]:...
+    def get_spirit_pet_array(self) -> tuple[int, ...]:...
+    def get_minion_array(self) -> tuple[int, ...]:...
+    def get_npc_minipet_array(self) -> tuple[int, ...]:...
+    def get_living_array(self) -> tuple[int, ...]:...
+    def get_item_array(self) -> tuple[int, ...]:...
+    def get_owned_item_array(self) -> tuple[int, ...]:...
+    def get_gadget_array(self) -> tuple[int, ...]:...
+    def get_dead_ally_array(self) -> tuple[int, ...]:...
+    def get_dead_enemy_array(self) -> tuple[int, ...]:...
         
\ No newline at end of file
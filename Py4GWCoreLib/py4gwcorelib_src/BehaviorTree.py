@@ -86,6 +86,103 @@ class BehaviorTree:
         RUNNING = auto()
         SUCCESS = auto()
         FAILURE = auto()
+
+    # --------------------------------------------------------
+    #region Scheduler
+    # --------------------------------------------------------
+
+    class Scheduler:
+        """
+        Wake-up events for sleeping trees.
+
+        A waiting node that has nothing to do until a deadline or an event
+        calls `sleep_until()`. When every RUNNING branch of a tree tick is
+        asleep, `BehaviorTree.tick()` skips the whole tree until the earliest
+        deadline passes or one of the watched events is signalled.
+
+        Built-in event names (sources are hooked on first use):
+        - "combat.<name>" for every CombatEvents.on_<name> callback, for example
+          "combat.skill_recharged" or "combat.aftercast_ended".
+        - "map.changed", "map.loading", "map.ready" from a per-frame map state poll.
+        Any other name can be raised by user code with `signal()`.
+        """
+
+        _generation: dict[str, int] = {}
+        _sources: set[str] = set()
+        _map_state: Optional[tuple[int, bool]] = None
+
+        @staticmethod
+        def signal(event: str) -> None:
+            """Wake every tree sleeping on `event`."""
+            generation = BehaviorTree.Scheduler._generation
+            generation[event] = generation.get(event, 0) + 1
+
+        @staticmethod
+        def snapshot(events: Sequence[str]) -> dict[str, int]:
+            """Current generation of each event, compared later by changed()."""
+            generation = BehaviorTree.Scheduler._generation
+            for event in events:
+                BehaviorTree.Scheduler._ensure_source(event)
+            return {event: generation.get(event, 0) for event in events}
+
+        @staticmethod
+        def changed(snapshot: dict[str, int]) -> bool:
+            generation = BehaviorTree.Scheduler._generation
+            for event, seen in snapshot.items():
+                if generation.get(event, 0) != seen:
+                    return True
+            return False
+
+        @staticmethod
+        def _ensure_source(event: str) -> None:
+            sources = BehaviorTree.Scheduler._sources
+            if event in sources:
+                return
+            sources.add(event)
+            if event.startswith("combat."):
+                from ..CombatEvents import CombatEvents
+                register = getattr(CombatEvents, "on_" + event[len("combat."):], None)
+                if register is None:
+                    ConsoleLog("BT", f"Scheduler: unknown combat event '{event}'", Console.MessageType.Warning)
+                    return
+                register(lambda *args, _event=event: BehaviorTree.Scheduler.signal(_event))
+            elif event.startswith("map.") and "map.*" not in sources:
+                sources.add("map.*")
+                import PyCallback
+                PyCallback.PyCallback.Register(
+                    "BehaviorTree.Scheduler.MapState",
+                    PyCallback.Phase.PreUpdate,
+                    BehaviorTree.Scheduler._poll_map,
+                    priority=10
+                )
+
+        @staticmethod
+        def _poll_map() -> None:
+            from ..Map import Map
+            state = (Map.GetMapID(), Map.IsMapReady())
+            previous = BehaviorTree.Scheduler._map_state
+            BehaviorTree.Scheduler._map_state = state
+            if previous is None or previous == state:
+                return
+            if state[0] != previous[0]:
+                BehaviorTree.Scheduler.signal("map.changed")
+            if state[1] and not previous[1]:
+                BehaviorTree.Scheduler.signal("map.ready")
+            elif previous[1] and not state[1]:
+                BehaviorTree.Scheduler.signal("map.loading")
+
+    class _TickContext:
+        """Per tree tick bookkeeping: RUNNING nodes that need polling vs. asleep ones."""
+
+        __slots__ = ("busy", "sleeping", "deadline", "events")
+
+        def __init__(self):
+            self.busy: int = 0
+            self.sleeping: int = 0
+            self.deadline: Optional[int] = None
+            self.events: dict[str, int] = {}
+
+    _tick_context: Optional["BehaviorTree._TickContext"] = None
         
     # --------------------------------------------------------
     #region Base Node
@@ -109,6 +206,15 @@ class BehaviorTree:
           Notes: Supplies the public tick wrapper, reset behavior, child inspection helpers, and runtime metadata used by all built-in nodes.
         """
 
+        # Timing/trace sampling for tick(): 1 profiles every tick (debug),
+        # 0 never (release), N profiles one tick in N. Nodes with their own
+        # `profile_every` (see set_profiling) ignore this default.
+        PROFILE_EVERY: int = 1
+
+        # True for nodes whose RUNNING only mirrors a RUNNING child and that do
+        # no polling of their own; such a node sleeps when that child sleeps.
+        _sleep_transparent: bool = False
+
         def __init__(
             self,
             name: str = "",
@@ -132,6 +238,9 @@ class BehaviorTree:
             self.last_tick_time_ms: float = 0.0
             self.total_time_ms: float = 0.0
             self.avg_time_ms: float = 0.0
+            self.timed_tick_count: int = 0
+            self.profile_every: Optional[int] = None
+            self._slept: bool = False
             
             self._run_start_time_ms: Optional[int] = None
             self.run_last_duration_ms: float = 0.0
@@ -149,24 +258,48 @@ class BehaviorTree:
         def tick(self) -> BehaviorTree.NodeState:
             """
             Wrapper around _tick_impl():
-            - Starts timer
             - Calls child implementation
-            - Ends timer
-            - Updates metadata
+            - Updates state and tick count
+            - On profiled ticks (see PROFILE_EVERY / set_profiling) also
+              times the call, tracks RUNNING durations and honours BT_TRACE
             """
+            ctx = BehaviorTree._tick_context
+            busy = sleeping = 0
+            if ctx is not None:
+                busy = ctx.busy
+                sleeping = ctx.sleeping
+                self._slept = False
+
+            every = self.profile_every
+            if every is None:
+                every = BehaviorTree.Node.PROFILE_EVERY
+            if every == 1 or (every > 1 and self.tick_count % every == 0):
+                result = self._tick_profiled()
+            else:
+                # release path: no timestamps, no trace lookup
+                result = self._tick_impl()
+                if result.__class__ is not BehaviorTree.NodeState:
+                    result = self._checked_state(result)
+                self.tick_count += 1
+                if result is not BehaviorTree.NodeState.RUNNING:
+                    # keep the next profiled activation from spanning this one
+                    self._run_start_time_ms = None
+                self.last_state = result
+
+            if ctx is not None and result is BehaviorTree.NodeState.RUNNING:
+                if self._slept:
+                    ctx.sleeping += 1
+                elif not (self._sleep_transparent and ctx.busy == busy and ctx.sleeping != sleeping):
+                    ctx.busy += 1
+            return result
+
+        def _tick_profiled(self) -> BehaviorTree.NodeState:
             start = Utils.GetBaseTimestamp()
             trace_enabled = bool(self.blackboard.get("BT_TRACE", False)) if isinstance(self.blackboard, dict) else False
             if trace_enabled:
                 ConsoleLog("BT", f"ENTER {self.node_type}:{self.name}", Console.MessageType.Debug, log=True)
 
-            result = self._tick_impl()   # <--- overridden in subclasses
-            normalized = self._normalize_state(result)
-            if normalized is None:
-                raise TypeError(
-                    f"{self.node_type}:{self.name} returned invalid state "
-                    f"{result!r} ({type(result).__name__}); expected BehaviorTree.NodeState."
-                )
-            result = normalized
+            result = self._checked_state(self._tick_impl())   # <--- overridden in subclasses
 
             end = Utils.GetBaseTimestamp()
             
@@ -174,11 +307,11 @@ class BehaviorTree:
             self.last_tick_time_ms = elapsed_cpu
             self.total_time_ms += elapsed_cpu
             self.tick_count += 1
-            if self.tick_count > 0:
-                self.avg_time_ms = self.total_time_ms / self.tick_count
+            self.timed_tick_count += 1
+            self.avg_time_ms = self.total_time_ms / self.timed_tick_count
                 
             # ========= REAL "LOGICAL RUNTIME" TRACKING =========
-            now = Utils.GetBaseTimestamp()
+            now = end
 
             if result == BehaviorTree.NodeState.RUNNING:
                 # First time entering RUNNING
@@ -200,6 +333,58 @@ class BehaviorTree:
                 ConsoleLog("BT", f"EXIT  {self.node_type}:{self.name} -> {result}", Console.MessageType.Debug, log=True)
             return result
 
+        def _checked_state(self, result) -> "BehaviorTree.NodeState":
+            normalized = self._normalize_state(result)
+            if normalized is None:
+                raise TypeError(
+                    f"{self.node_type}:{self.name} returned invalid state "
+                    f"{result!r} ({type(result).__name__}); expected BehaviorTree.NodeState."
+                )
+            return normalized
+
+        def sleep_until(self, deadline_ms: Optional[int] = None, wake_on: Sequence[str] = ()) -> None:
+            """
+            Declare that this RUNNING node has nothing to do until `deadline_ms`
+            (Utils.GetBaseTimestamp() time) or one of the `wake_on` Scheduler events.
+
+            Call it from _tick_impl right before returning RUNNING. Without a
+            deadline or events the node stays awake.
+            """
+            ctx = BehaviorTree._tick_context
+            if ctx is None or (deadline_ms is None and not wake_on):
+                return
+            self._slept = True
+            if deadline_ms is not None and (ctx.deadline is None or deadline_ms < ctx.deadline):
+                ctx.deadline = deadline_ms
+            if wake_on:
+                for event, generation in BehaviorTree.Scheduler.snapshot(wake_on).items():
+                    ctx.events.setdefault(event, generation)
+
+        def wake_at(self, deadline_ms: int) -> None:
+            """Make sure a sleeping tree is ticked again by `deadline_ms` (own timeouts of decorators)."""
+            ctx = BehaviorTree._tick_context
+            if ctx is not None and (ctx.deadline is None or deadline_ms < ctx.deadline):
+                ctx.deadline = deadline_ms
+
+        def keep_awake(self) -> None:
+            """Prevent the current tree tick from putting the tree to sleep."""
+            ctx = BehaviorTree._tick_context
+            if ctx is not None:
+                ctx.busy += 1
+
+        def set_profiling(self, every: Optional[int], recursive: bool = True) -> None:
+            """
+            Override timing/trace sampling for this node (and by default its current subtree).
+
+            every: 1 = every tick, 0 = off, N = one tick in N, None = follow PROFILE_EVERY.
+            Children created later (SubtreeNode, SwitchNode) keep following the default.
+            """
+            self.profile_every = None if every is None else max(0, int(every))
+            if recursive:
+                for child in self.get_children():
+                    if hasattr(child, "set_profiling"):
+                        child.set_profiling(every, recursive=True)
+
         @staticmethod
         def _normalize_state(result) -> Optional["BehaviorTree.NodeState"]:
             if isinstance(result, BehaviorTree.NodeState):
@@ -467,6 +652,8 @@ class BehaviorTree:
                 self._action_done = True
                 self._action_result = result
                 self._start_time = Utils.GetBaseTimestamp()
+                if self.aftercast_ms > 0:
+                    self.sleep_until(self._start_time + self.aftercast_ms)
                 return BehaviorTree.NodeState.RUNNING
 
             # 2) Action finished → now wait
@@ -483,6 +670,7 @@ class BehaviorTree:
                 self._start_time = None
                 return final  # SUCCESS or FAILURE (propagates action result)
 
+            self.sleep_until(self._start_time + self.aftercast_ms)
             return BehaviorTree.NodeState.RUNNING
 
         def reset(self) -> None:
@@ -584,6 +772,8 @@ class BehaviorTree:
           Notes: Stops on first failure. Resumes from the running child on the next tick.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, children=None, name: str = "SequenceNode"):
             super().__init__(name=name, node_type="SequenceNode", 
                              node_category="composite",
@@ -663,6 +853,8 @@ class BehaviorTree:
           Notes: Stops on first success. Resumes from the running child on the next tick.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, children=None, name: str = "SelectorNode"):
             super().__init__(name=name, node_type="SelectorNode", 
                              node_category="composite",
@@ -913,6 +1105,8 @@ class BehaviorTree:
           Notes: The repeat counter only advances after success or failure, not while the child is running.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, child: "BehaviorTree.Node", repeat_count: int = 1, name: str = "RepeaterNode"):
             super().__init__(name=name, node_type="RepeaterNode", 
                              node_category="repeater",
@@ -983,6 +1177,8 @@ class BehaviorTree:
           Notes: Failure retries immediately. Timeout causes the repeater itself to fail.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, child: "BehaviorTree.Node", timeout_ms: int = 0, name: str = "RepeaterUntilSuccessNode"):
             super().__init__(name=name, node_type="RepeaterUntilSuccessNode", 
                              node_category="repeater",
@@ -1030,6 +1226,8 @@ class BehaviorTree:
                     return BehaviorTree.NodeState.FAILURE
 
                 if result == BehaviorTree.NodeState.RUNNING:
+                    if self.timeout_ms > 0:
+                        self.wake_at(self._start_time_ms + self.timeout_ms)
                     return BehaviorTree.NodeState.RUNNING
 
                 if result == BehaviorTree.NodeState.SUCCESS:
@@ -1065,6 +1263,8 @@ class BehaviorTree:
           Notes: Child failure makes this node succeed. Timeout makes the repeater fail.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, child: "BehaviorTree.Node", timeout_ms: int = 0, name: str = "RepeaterUntilFailureNode"):
             super().__init__(name=name, node_type="RepeaterUntilFailureNode", 
                              node_category="repeater",
@@ -1112,6 +1312,8 @@ class BehaviorTree:
                     return BehaviorTree.NodeState.FAILURE
 
                 if result == BehaviorTree.NodeState.RUNNING:
+                    if self.timeout_ms > 0:
+                        self.wake_at(self._start_time_ms + self.timeout_ms)
                     return BehaviorTree.NodeState.RUNNING
 
                 if result == BehaviorTree.NodeState.FAILURE:
@@ -1146,6 +1348,8 @@ class BehaviorTree:
           Notes: Ignores the child result and returns running unless the optional timeout is exceeded.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, child: "BehaviorTree.Node", timeout_ms: int = 0, name: str = "RepeaterForeverNode"):
             super().__init__(name=name, node_type="RepeaterForeverNode", 
                              node_category="repeater",
@@ -1184,6 +1388,8 @@ class BehaviorTree:
             self.child.tick()
 
             # Always RUNNING
+            if self.timeout_ms > 0:
+                self.wake_at(self._start_time_ms + self.timeout_ms)
             return BehaviorTree.NodeState.RUNNING
         
     # --------------------------------------------------------
@@ -1210,6 +1416,8 @@ class BehaviorTree:
           Notes: Any child failure fails the node. All-child success succeeds the node.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, children=None, name: str = "ParallelNode"):
             super().__init__(name=name, node_type="ParallelNode", 
                              node_category="composite",
@@ -1237,6 +1445,7 @@ class BehaviorTree:
             # ---------------------------
 
             all_success = True
+            any_finished = False
 
             for child in self.children:
                 result = self._normalize_state(child.tick())
@@ -1255,11 +1464,16 @@ class BehaviorTree:
 
                 if result == BehaviorTree.NodeState.RUNNING:
                     all_success = False
+                else:
+                    any_finished = True
 
             if all_success:
                 self._reset_children()
                 return BehaviorTree.NodeState.SUCCESS
 
+            if any_finished:
+                # finished children run again next tick, the tree cannot sleep
+                self.keep_awake()
             return BehaviorTree.NodeState.RUNNING
             
     # --------------------------------------------------------
@@ -1293,6 +1507,8 @@ class BehaviorTree:
           Notes: The subtree is created on first use and can depend on live blackboard state.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, subtree_fn: Callable[["BehaviorTree.Node"], "BehaviorTree | BehaviorTree.Node"], name: str = "SubtreeNode"):
             if not callable(subtree_fn):
                 raise TypeError("SubtreeNode requires a callable returning a BehaviorTree or BehaviorTree.Node.")
@@ -1382,6 +1598,8 @@ class BehaviorTree:
           Notes: Running stays running. Only success and failure are flipped.
         """
 
+        _sleep_transparent = True
+
         def __init__(self, child: "BehaviorTree.Node", name: str = "InverterNode"):
             super().__init__(name=name, node_type="InverterNode", 
                              node_category="decorator",
@@ -1438,6 +1656,9 @@ class BehaviorTree:
             - If timeout_ms = 0 → no timeout (wait indefinitely).
             - check_fn must return a NodeState (SUCCESS / FAILURE / RUNNING).
             - THIS NODE IS NOT THROTTLED: check_fn is called every tick.
+            - With wake_on (Scheduler event names) the node sleeps instead and
+              check_fn only runs again once one of the events fires (or the
+              timeout is reached).
 
         Meta:
           Expose: true
@@ -1445,16 +1666,17 @@ class BehaviorTree:
           Display: Wait Node
           Purpose: Keep checking a callback until it resolves.
           UserDescription: Use this when something should be checked continuously until it completes.
-          Notes: This node is not throttled. The callback runs every tick.
+          Notes: This node is not throttled. The callback runs every tick unless wake_on events are given.
         """
 
-        def __init__(self, check_fn, timeout_ms: int = 0, name: str = "WaitNode"):
+        def __init__(self, check_fn, timeout_ms: int = 0, name: str = "WaitNode", wake_on: Sequence[str] = ()):
             super().__init__(name=name, node_type="WaitNode", 
                              node_category="wait",
                              icon=IconsFontAwesome5.ICON_HAND,
                              color = ColorPalette.GetColor("light_cyan"))
             self.check_fn = check_fn
             self.timeout_ms = timeout_ms
+            self.wake_on: tuple[str, ...] = tuple(wake_on)
             self._start_time_ms: Optional[int] = None
 
         def _tick_impl(self) -> BehaviorTree.NodeState:
@@ -1491,6 +1713,9 @@ class BehaviorTree:
                     return BehaviorTree.NodeState.FAILURE
 
             # continue waiting
+            if self.wake_on:
+                deadline = self._start_time_ms + self.timeout_ms if self.timeout_ms > 0 else None
+                self.sleep_until(deadline, self.wake_on)
             return BehaviorTree.NodeState.RUNNING
 
         def reset(self) -> None:
@@ -1514,6 +1739,8 @@ class BehaviorTree:
             - Evaluates at most once every interval_ms.
             - If timeout_ms > 0 and exceeded → FAILURE.
             - THIS NODE IS THROTTLED: condition_fn is called at most once every interval_ms.
+            - Between checks the node sleeps (see BehaviorTree.Scheduler); wake_on
+              events trigger an immediate re-check.
 
         Meta:
           Expose: true
@@ -1527,7 +1754,8 @@ class BehaviorTree:
         def __init__(self, condition_fn,
                     throttle_interval_ms: int = 100,
                     timeout_ms: int = 0,
-                    name: str = "WaitUntilNode"):
+                    name: str = "WaitUntilNode",
+                    wake_on: Sequence[str] = ()):
 
             super().__init__(
                 name=name,
@@ -1540,6 +1768,8 @@ class BehaviorTree:
             self.condition_fn = condition_fn
             self.interval_ms = throttle_interval_ms
             self.timeout_ms = timeout_ms
+            self.wake_on: tuple[str, ...] = tuple(wake_on)
+            self._wake_snapshot: Optional[dict[str, int]] = None
 
             try:
                 sig = inspect.signature(condition_fn)
@@ -1550,6 +1780,15 @@ class BehaviorTree:
             self._start_time_ms = None
             self._last_check_time_ms = None
 
+        def _sleep_until_next_check(self) -> None:
+            deadline = self._last_check_time_ms + self.interval_ms
+            if self.timeout_ms > 0:
+                deadline = min(deadline, self._start_time_ms + self.timeout_ms)
+            self.sleep_until(deadline, self.wake_on)
+
+        def _woken_early(self) -> bool:
+            return self._wake_snapshot is not None and BehaviorTree.Scheduler.changed(self._wake_snapshot)
+
         def _tick_impl(self) -> BehaviorTree.NodeState:
             now = Utils.GetBaseTimestamp()
 
@@ -1567,11 +1806,14 @@ class BehaviorTree:
                 return BehaviorTree.NodeState.FAILURE
 
             # --- THROTTLE ---
-            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms):
+            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms) and not self._woken_early():
                 #ConsoleLog("WaitUntilNode",f"[{self.name}] Throttled ({now - self._last_check_time_ms} < {self.interval_ms})",log=True)
+                self._sleep_until_next_check()
                 return BehaviorTree.NodeState.RUNNING
 
             self._last_check_time_ms = now
+            if self.wake_on:
+                self._wake_snapshot = BehaviorTree.Scheduler.snapshot(self.wake_on)
 
             # --- CALL CONDITION ---
             #ConsoleLog("WaitUntilNode",f"[{self.name}] Calling condition_fn (_accepts_node={self._accepts_node})",log=True)
@@ -1592,7 +1834,12 @@ class BehaviorTree:
             # --- NodeState ---
             if isinstance(result, BehaviorTree.NodeState):
                 #ConsoleLog("WaitUntilNode", f"[{self.name}] Returning NodeState: {result}",log=True)
-                
+
+                # Still waiting: keep the check time so the next ticks are throttled
+                if result == BehaviorTree.NodeState.RUNNING:
+                    self._sleep_until_next_check()
+                    return result
+
                 # FIX: reset state so next tick does not throttle
                 self._start_time_ms = None
                 self._last_check_time_ms = None
@@ -1623,6 +1870,7 @@ class BehaviorTree:
             super().reset()
             self._start_time_ms = None
             self._last_check_time_ms = None
+            self._wake_snapshot = None
 
 
     # --------------------------------------------------------
@@ -1652,7 +1900,8 @@ class BehaviorTree:
         def __init__(self, condition_fn,
                     throttle_interval_ms: int = 100,
                     timeout_ms: int = 0,
-                    name: str = "WaitUntilSuccessNode"):
+                    name: str = "WaitUntilSuccessNode",
+                    wake_on: Sequence[str] = ()):
 
             super().__init__(
                 name=name,
@@ -1665,6 +1914,8 @@ class BehaviorTree:
             self.condition_fn = condition_fn
             self.interval_ms = throttle_interval_ms
             self.timeout_ms = timeout_ms
+            self.wake_on: tuple[str, ...] = tuple(wake_on)
+            self._wake_snapshot: Optional[dict[str, int]] = None
 
             try:
                 sig = inspect.signature(condition_fn)
@@ -1675,6 +1926,15 @@ class BehaviorTree:
             self._start_time_ms = None
             self._last_check_time_ms = None
 
+        def _sleep_until_next_check(self) -> None:
+            deadline = self._last_check_time_ms + self.interval_ms
+            if self.timeout_ms > 0:
+                deadline = min(deadline, self._start_time_ms + self.timeout_ms)
+            self.sleep_until(deadline, self.wake_on)
+
+        def _woken_early(self) -> bool:
+            return self._wake_snapshot is not None and BehaviorTree.Scheduler.changed(self._wake_snapshot)
+
         def _tick_impl(self) -> BehaviorTree.NodeState:
             now = Utils.GetBaseTimestamp()
 
@@ -1695,13 +1955,16 @@ class BehaviorTree:
                 return BehaviorTree.NodeState.FAILURE
 
             # --- THROTTLE ---
-            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms):
+            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms) and not self._woken_early():
                 ConsoleLog("WaitUntilSuccessNode",
                     f"[{self.name}] Throttled ({now - self._last_check_time_ms} < {self.interval_ms})",
                     log=True)
+                self._sleep_until_next_check()
                 return BehaviorTree.NodeState.RUNNING
 
             self._last_check_time_ms = now
+            if self.wake_on:
+                self._wake_snapshot = BehaviorTree.Scheduler.snapshot(self.wake_on)
 
             # --- CALL CONDITION ---
             ConsoleLog("WaitUntilSuccessNode",
@@ -1744,6 +2007,7 @@ class BehaviorTree:
                 ConsoleLog("WaitUntilSuccessNode",
                     f"[{self.name}] Retry (result={result})",
                     log=True)
+                self._sleep_until_next_check()
                 return BehaviorTree.NodeState.RUNNING
 
             # --- INVALID ---
@@ -1759,6 +2023,7 @@ class BehaviorTree:
             super().reset()
             self._start_time_ms = None
             self._last_check_time_ms = None
+            self._wake_snapshot = None
 
 
 
@@ -1788,7 +2053,8 @@ class BehaviorTree:
         def __init__(self, condition_fn,
                     throttle_interval_ms: int = 100,
                     timeout_ms: int = 0,
-                    name: str = "WaitUntilFailureNode"):
+                    name: str = "WaitUntilFailureNode",
+                    wake_on: Sequence[str] = ()):
 
             super().__init__(
                 name=name,
@@ -1801,6 +2067,8 @@ class BehaviorTree:
             self.condition_fn = condition_fn
             self.interval_ms = throttle_interval_ms
             self.timeout_ms = timeout_ms
+            self.wake_on: tuple[str, ...] = tuple(wake_on)
+            self._wake_snapshot: Optional[dict[str, int]] = None
 
             try:
                 sig = inspect.signature(condition_fn)
@@ -1811,6 +2079,15 @@ class BehaviorTree:
             self._start_time_ms = None
             self._last_check_time_ms = None
 
+        def _sleep_until_next_check(self) -> None:
+            deadline = self._last_check_time_ms + self.interval_ms
+            if self.timeout_ms > 0:
+                deadline = min(deadline, self._start_time_ms + self.timeout_ms)
+            self.sleep_until(deadline, self.wake_on)
+
+        def _woken_early(self) -> bool:
+            return self._wake_snapshot is not None and BehaviorTree.Scheduler.changed(self._wake_snapshot)
+
         def _tick_impl(self) -> BehaviorTree.NodeState:
             now = Utils.GetBaseTimestamp()
 
@@ -1831,13 +2108,16 @@ class BehaviorTree:
                 return BehaviorTree.NodeState.FAILURE
 
             # --- THROTTLE ---
-            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms):
+            if self._last_check_time_ms and ((now - self._last_check_time_ms) < self.interval_ms) and not self._woken_early():
                 ConsoleLog("WaitUntilFailureNode",
                     f"[{self.name}] Throttled ({now - self._last_check_time_ms} < {self.interval_ms})",
                     log=True)
+                self._sleep_until_next_check()
                 return BehaviorTree.NodeState.RUNNING
 
             self._last_check_time_ms = now
+            if self.wake_on:
+                self._wake_snapshot = BehaviorTree.Scheduler.snapshot(self.wake_on)
 
             # --- CALL CONDITION ---
             ConsoleLog("WaitUntilFailureNode",
@@ -1880,12 +2160,14 @@ class BehaviorTree:
                 f"[{self.name}] Retry (result={result})",
                 log=True)
 
+            self._sleep_until_next_check()
             return BehaviorTree.NodeState.RUNNING
 
         def reset(self) -> None:
             super().reset()
             self._start_time_ms = None
             self._last_check_time_ms = None
+            self._wake_snapshot = None
 
 
 
@@ -1932,6 +2214,7 @@ class BehaviorTree:
                 self._start_time_ms = None  # reset for next activation
                 return BehaviorTree.NodeState.SUCCESS
 
+            self.sleep_until(self._start_time_ms + self.duration_ms)
             return BehaviorTree.NodeState.RUNNING
 
         def reset(self) -> None:
@@ -2014,7 +2297,60 @@ class BehaviorTree:
     def __init__(self, root: Node):
         self.root: BehaviorTree.Node = root
         self.blackboard = {} # Shared data storage for the tree
+
+        # ---- scheduler: skip ticks while every RUNNING branch sleeps ----
+        self.scheduling: bool = True
+        self.skipped_ticks: int = 0
+        self._asleep: bool = False
+        self._sleep_started_ms: int = 0
+        self._wake_deadline_ms: Optional[int] = None
+        self._wake_events: dict[str, int] = {}
         
+    @staticmethod
+    def set_execution_mode(mode: str, sample_every: int = 0) -> None:
+        """
+        Select the default per-node timing/trace behaviour for every tree.
+
+        "debug": time and trace every tick (the historical behaviour).
+        "release": skip timing and BT_TRACE, or sample one tick in `sample_every`
+        when it is > 1. Subtrees can still opt in with Node.set_profiling().
+        """
+        if mode == "debug":
+            BehaviorTree.Node.PROFILE_EVERY = 1
+        elif mode == "release":
+            BehaviorTree.Node.PROFILE_EVERY = int(sample_every) if sample_every > 1 else 0
+        else:
+            raise ValueError(f"Unknown BehaviorTree execution mode {mode!r}; expected 'debug' or 'release'.")
+
+    @staticmethod
+    def is_release_mode() -> bool:
+        return BehaviorTree.Node.PROFILE_EVERY != 1
+
+    def set_profiling(self, every: Optional[int]) -> None:
+        """Override timing/trace sampling for the whole tree, see Node.set_profiling()."""
+        self.root.set_profiling(every, recursive=True)
+
+    @property
+    def asleep(self) -> bool:
+        return self._asleep
+
+    def wake(self) -> None:
+        """
+        Tick the tree again on the next tick() call.
+
+        Call this after changing state a sleeping wait node depends on without
+        a Scheduler event, for example a blackboard flag set from outside.
+        """
+        self._asleep = False
+
+    def _should_wake(self) -> bool:
+        if self._wake_deadline_ms is not None:
+            now = Utils.GetBaseTimestamp()
+            # base timestamps restart at 0 every day, wake on wrap-around
+            if now >= self._wake_deadline_ms or now < self._sleep_started_ms:
+                return True
+        return bool(self._wake_events) and BehaviorTree.Scheduler.changed(self._wake_events)
+
     def _propagate_blackboard(self, node: "BehaviorTree.Node"):
         """
         Assigns this tree’s blackboard to `node` and all its descendants.
@@ -2027,17 +2363,50 @@ class BehaviorTree:
     def tick(self) -> BehaviorTree.NodeState:
         """
         Ticks the root node once and returns its resulting NodeState.
+
+        While the tree sleeps (every RUNNING branch is waiting on a deadline or
+        Scheduler event) the root is not ticked and RUNNING is returned.
         """
-        self._propagate_blackboard(self.root)
-        result = self.Node._normalize_state(self.root.tick())
+        if self._asleep:
+            if not self._should_wake():
+                self.skipped_ticks += 1
+                return BehaviorTree.NodeState.RUNNING
+            self._asleep = False
+
+        if BehaviorTree.Node.PROFILE_EVERY == 1:
+            self._propagate_blackboard(self.root)
+        else:
+            # composites hand the blackboard to each child they tick,
+            # release mode skips the full-tree walk
+            self.root.blackboard = self.blackboard
+        outer = BehaviorTree._tick_context
+        ctx = BehaviorTree._TickContext()
+        BehaviorTree._tick_context = ctx
+        try:
+            result = self.Node._normalize_state(self.root.tick())
+        finally:
+            BehaviorTree._tick_context = outer
         if result is None:
             raise TypeError("BehaviorTree root returned a non-NodeState result.")
+
+        if (
+            self.scheduling
+            and result is BehaviorTree.NodeState.RUNNING
+            and ctx.busy == 0
+            and ctx.sleeping > 0
+            and (ctx.deadline is not None or ctx.events)
+        ):
+            self._asleep = True
+            self._sleep_started_ms = Utils.GetBaseTimestamp()
+            self._wake_deadline_ms = ctx.deadline
+            self._wake_events = ctx.events
         return result
 
     def reset(self) -> None:
         """
         Resets the root node and its subtree execution state.
         """
+        self._asleep = False
         self.root.reset()
 
     # -------- tree-level debug helpers --------
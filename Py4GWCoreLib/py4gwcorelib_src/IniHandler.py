@@ -1,46 +1,133 @@
 import os
 import configparser
+import tempfile
+import threading
+import time
+
+
+class _SharedIni:
+    """Parsed state of one INI path, shared by every IniHandler opened on it."""
+
+    __slots__ = ("config", "last_modified", "next_check")
+
+    def __init__(self):
+        self.config = configparser.ConfigParser()
+        self.last_modified = 0.0
+        self.next_check = 0.0
+
 
 #region IniHandler
 class IniHandler:
-    def __init__(self, filename: str):
+    # Seconds between two mtime checks of the same file. Changes made by other
+    # processes are picked up at most this late; writes through any handler of
+    # this process are visible immediately. 0 checks on every read.
+    check_interval: float = 0.25
+
+    _shared: dict[str, _SharedIni] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, filename: str, check_interval: float | None = None):
         """
         Initialize the handler with the given INI file.
+
+        Handlers opened on the same path share one parsed ConfigParser.
         """
         self.filename = filename
-        self.last_modified = 0
-        self.config = configparser.ConfigParser()
-        self.reload()  # Load the config initially
+        if check_interval is not None:
+            self.check_interval = check_interval
+        key = os.path.normcase(os.path.abspath(filename))
+        with IniHandler._shared_lock:
+            state = IniHandler._shared.get(key)
+            if state is None:
+                state = _SharedIni()
+                IniHandler._shared[key] = state
+        self._state = state
+        self.reload(force=True)  # Load the config initially
+
+    @staticmethod
+    def set_check_interval(seconds: float) -> None:
+        """Change the default mtime check interval for all handlers."""
+        IniHandler.check_interval = max(0.0, float(seconds))
+
+    @staticmethod
+    def clear_shared_cache() -> None:
+        """Forget every shared parse; new handlers re-read their file from disk."""
+        with IniHandler._shared_lock:
+            IniHandler._shared.clear()
+
+    @property
+    def config(self) -> configparser.ConfigParser:
+        return self._state.config
+
+    @config.setter
+    def config(self, value: configparser.ConfigParser) -> None:
+        self._state.config = value
+
+    @property
+    def last_modified(self) -> float:
+        return self._state.last_modified
+
+    @last_modified.setter
+    def last_modified(self, value: float) -> None:
+        self._state.last_modified = value
 
     # ----------------------------
     # Core Methods
     # ----------------------------
     
-    def reload(self) -> configparser.ConfigParser:
+    def reload(self, force: bool = False) -> configparser.ConfigParser:
         """Reload the INI file only if it has changed.
         
+        The file is stat'ed at most once per check_interval (per path, across
+        handlers) unless force is set.
         If the file doesn't exist, create an empty file.
         """
-        if not os.path.exists(self.filename):
+        state = self._state
+        now = time.monotonic()
+        if not force and now < state.next_check:
+            return state.config
+        state.next_check = now + self.check_interval
+
+        try:
+            current_mtime = os.path.getmtime(self.filename)
+        except OSError:
             # Create an empty file if it doesn't exist.
             with open(self.filename, 'w') as f:
                 f.write("")
             # Update last_modified since a new file was created.
-            self.last_modified = os.path.getmtime(self.filename)
-            return self.config
+            state.last_modified = os.path.getmtime(self.filename)
+            return state.config
 
-        current_mtime = os.path.getmtime(self.filename)
-        if current_mtime != self.last_modified:
-            self.last_modified = current_mtime
-            self.config.read(self.filename)
-        return self.config
+        if current_mtime != state.last_modified:
+            state.last_modified = current_mtime
+            state.config.read(self.filename)
+        return state.config
 
-    def save(self, config: configparser.ConfigParser) -> None:
+    def save(self, config: configparser.ConfigParser) -> int:
         """
         Save changes to the INI file.
+
+        The config is written to a temp file next to the target and renamed
+        over it, so readers in other processes never see a half written file.
+        Returns the number of bytes written.
         """
-        with open(self.filename, 'w') as configfile:
-            config.write(configfile)
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmp_path = tempfile.mkstemp(prefix=".ini-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as configfile:
+                config.write(configfile)
+                size = configfile.tell()
+            os.replace(tmp_path, self.filename)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        if config is self.config:
+            # our own write, no need to parse it back on the next reload
+            self._state.last_modified = os.path.getmtime(self.filename)
+        return size
 
     # ----------------------------
     # Read Methods
@@ -94,12 +181,27 @@ class IniHandler:
         """
         Write or update a key-value pair.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if not config.has_section(section):
             config.add_section(section)
         config.set(section, key, str(value))
         self.save(config)
 
+    def write_keys(self, values: dict[tuple[str, str], str]) -> int:
+        """
+        Write several (section, key) -> value pairs with a single file write.
+
+        Returns the number of bytes written, 0 if nothing was written.
+        """
+        if not values:
+            return 0
+        config = self.reload(force=True)
+        for (section, key), value in values.items():
+            if not config.has_section(section):
+                config.add_section(section)
+            config.set(section, key, str(value))
+        return self.save(config)
+
     # ----------------------------
     # Delete Methods
     # ----------------------------
@@ -108,7 +210,7 @@ class IniHandler:
         """
         Delete a specific key.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(section) and config.has_option(section, key):
             config.remove_option(section, key)
             self.save(config)
@@ -117,7 +219,7 @@ class IniHandler:
         """
         Delete an entire section.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(section):
             config.remove_section(section)
             self.save(config)
@@ -153,7 +255,7 @@ class IniHandler:
         """
         Clone all keys from one section to another.
         """
-        config = self.reload()
+        config = self.reload(force=True)
         if config.has_section(source_section):
             if not config.has_section(target_section):
                 config.add_section(target_section)
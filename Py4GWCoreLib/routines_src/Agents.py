@@ -1,20 +1,33 @@
-import importlib
-
-class _RProxy:
-    def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
-
-Routines = _RProxy()
-
+from typing import TYPE_CHECKING
+
+from .LazyImport import lazy_import
+
+# resolved on first use, see LazyImport
+lazy_import(globals(), "..Agent", "Agent")
+lazy_import(globals(), "..AgentArray", "AgentArray")
+lazy_import(globals(), "..GlobalCache", "GLOBAL_CACHE")
+lazy_import(globals(), "..Py4GWcorelib", "Utils")
+lazy_import(globals(), "..Routines", "Routines")
+lazy_import(globals(), "..AgentSnapshot", "AgentSnapshot")
+lazy_import(globals(), "..EnemyBlacklist", "EnemyBlacklist")
+lazy_import(globals(), ".Party", "Party")
+if TYPE_CHECKING:
+    from ..Agent import Agent
+    from ..AgentArray import AgentArray
+    from ..GlobalCache import GLOBAL_CACHE
+    from ..Py4GWcorelib import Utils
+    from ..Routines import Routines
+    from ..AgentSnapshot import AgentSnapshot
+    from ..EnemyBlacklist import EnemyBlacklist
+    from .Party import Party
+
+from ..enums_src.Model_enums import GadgetModelID
 from ..Player import Player
 
 #region Agents
 class Agents:    
     @staticmethod
     def GetNearestNPCXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         npc_array = AgentArray.GetNPCMinipetArray()
         npc_array = AgentArray.Filter.ByDistance(npc_array,scan_pos, distance)
@@ -25,8 +38,6 @@ class Agents:
     
     @staticmethod
     def GetNearestGadgetXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         gadget_array = AgentArray.GetGadgetArray()
         gadget_array = AgentArray.Filter.ByDistance(gadget_array,scan_pos, distance)
@@ -37,8 +48,6 @@ class Agents:
                 
     @staticmethod
     def GetNearestItemXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         item_array = AgentArray.GetItemArray()
         item_array = AgentArray.Filter.ByDistance(item_array,scan_pos, distance)
@@ -49,7 +58,6 @@ class Agents:
     
     @staticmethod
     def GetNearestNPC(distance:float = 4500.0):
-        from ..GlobalCache import GLOBAL_CACHE
         player_pos = Player.GetXY()
         return Agents.GetNearestNPCXY(player_pos[0], player_pos[1], distance)
     
@@ -62,10 +70,6 @@ class Agents:
         Returns:
             int: The closest matching agent ID, or 0 if none found.
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
 
         agent_ids = AgentArray.GetAgentArray()
         px, py = Player.GetXY()
@@ -90,8 +94,6 @@ class Agents:
         Scans all agent arrays (ally, NPC, enemy, etc.).
         Returns 0 if none found.
         """
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
         player_pos = Player.GetXY()
         agent_array = AgentArray.GetAgentArray()
         agent_array = AgentArray.Filter.ByDistance(agent_array, player_pos, max_distance)
@@ -114,10 +116,6 @@ class Agents:
         Returns:
             int: The closest matching item agent ID, or 0 if none found.
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
 
         # Required bit rules
         BIT22 = 1 << 22
@@ -153,97 +151,71 @@ class Agents:
 
 
         
+    @staticmethod
+    def QueryFilteredEnemies(x, y, max_distance=4500.0, aggressive_only = False):
+        """
+        Purpose: fused query behind GetFilteredEnemyArray, for callers that add
+        their own filters and reduce (nearest, lowest hp, ...) in the same pass.
+        Returns: AgentQuery over alive enemies in range, the player excluded.
+        """
+        query = (AgentSnapshot.Query("enemy")
+                 .InRange((x, y), max_distance)
+                 .Alive()
+                 .Exclude(Player.GetAgentID()))
+        if aggressive_only:
+            query.Has("aggressive")
+        return query
+
     @staticmethod
     def GetFilteredEnemyArray(x, y, max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..Agent import Agent
         """
         Purpose: filters enemies within the specified range.
         Args:
             range (int): The maximum distance to search for enemies.
         Returns: List of enemy agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        enemy_array = AgentArray.GetEnemyArray()
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Utils.Distance((x,y), Agent.GetXY(agent_id)) <= max_distance)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsAlive(agent_id))
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Player.GetAgentID() != agent_id)
-        if aggressive_only:
-            enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsAggressive(agent_id))
-        return enemy_array
+        return Agents.QueryFilteredEnemies(x, y, max_distance, aggressive_only).ToList()
                     
     @staticmethod
     def GetNearestEnemy(max_distance=4500.0, aggressive_only=False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..EnemyBlacklist import EnemyBlacklist
 
         bl = EnemyBlacklist()
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
         if not bl.is_empty():
-            enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: not bl.is_blacklisted(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+            query.Where(lambda agent_id: not bl.is_blacklisted(agent_id))
+        return query.Nearest(player_pos)
     
     @staticmethod
     def GetNearestEnemyCaster(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsCaster(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Where(Agent.IsCaster).Nearest(player_pos)
         
     @staticmethod
     def GetNearestEnemyMartial(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsMartial(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)   
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Where(Agent.IsMartial).Nearest(player_pos)
     
     @staticmethod
     def GetNearestEnemyMelee(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsMelee(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Where(Agent.IsMelee).Nearest(player_pos)
     
     @staticmethod
     def GetNearestEnemyRanged(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsRanged(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Where(Agent.IsRanged).Nearest(player_pos)
 
     @staticmethod
     def GetFilteredAllyArray(x, y, max_distance=4500.0, other_ally=False):
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
         """
         Purpose: filters allies within the specified range.
         Args:
@@ -251,7 +223,6 @@ class Agents:
             other_ally (bool): Whether to include other allies in the search.
         Returns: List of ally agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         ally_array = AgentArray.GetAllyArray()
         ally_array = AgentArray.Filter.ByDistance(ally_array, (x,y), max_distance)
         ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: Agent.IsAlive(agent_id))
@@ -263,10 +234,6 @@ class Agents:
     
     @staticmethod
     def GetNearestAlly(max_distance=4500.0, exclude_self=True):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         self_id = Player.GetAgentID()
         player_pos = Player.GetXY()
@@ -280,10 +247,6 @@ class Agents:
     
     @staticmethod   
     def GetDeadAlly(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         distance = max_distance
         ally_array = AgentArray.GetAllyArray()
@@ -294,10 +257,6 @@ class Agents:
 
     @staticmethod
     def GetCorpses(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         def _AllowedAlliegance(agent_id):
             _, alliegance = Agent.GetAllegiance(agent_id)
@@ -319,10 +278,6 @@ class Agents:
 
     @staticmethod
     def GetNearestCorpse(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         
         def _AllowedAlliegance(agent_id):
             _, alliegance = Agent.GetAllegiance(agent_id)
@@ -345,10 +300,6 @@ class Agents:
         
     @staticmethod
     def GetNearestSpirit(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         
         distance = max_distance
         spirit_array = AgentArray.GetSpiritPetArray()
@@ -360,15 +311,12 @@ class Agents:
     
     @staticmethod
     def GetFilteredSpiritArray(x, y, max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
         """
         Purpose: filters spirits within the specified range.
         Args:
             range (int): The maximum distance to search for spirits.
         Returns: List of spirit agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         spirit_array = AgentArray.GetSpiritPetArray()
         spirit_array = AgentArray.Filter.ByDistance(spirit_array, (x,y), max_distance)
         spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: Agent.IsAlive(agent_id))
@@ -377,10 +325,6 @@ class Agents:
         
     @staticmethod
     def GetLowestMinion(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         
         distance = max_distance
         minion_array = AgentArray.GetMinionArray()
@@ -391,15 +335,12 @@ class Agents:
         
     @staticmethod
     def GetFilteredMinionArray(x, y, max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
         """
         Purpose: filters minions within the specified range.
         Args:
             range (int): The maximum distance to search for minions.
         Returns: List of minion agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         minion_array = AgentArray.GetMinionArray()
         minion_array = AgentArray.Filter.ByDistance(minion_array, (x,y), max_distance)
         minion_array = AgentArray.Filter.ByCondition(minion_array, lambda agent_id: Agent.IsAlive(agent_id))
@@ -408,9 +349,6 @@ class Agents:
     
     @staticmethod
     def GetNearestItem(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         item_array = AgentArray.GetItemArray()
         item_array = AgentArray.Filter.ByDistance(item_array, Player.GetXY(), max_distance)
@@ -419,9 +357,6 @@ class Agents:
 
     @staticmethod
     def GetNearestGadget(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         gadget_array = AgentArray.GetGadgetArray()
         gadget_array = AgentArray.Filter.ByDistance(gadget_array, Player.GetXY(), max_distance)
@@ -430,10 +365,6 @@ class Agents:
     
     @staticmethod
     def GetNearestGadgetByID(gadget_id: int, max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         gadget_array = AgentArray.GetGadgetArray()
         gadget_array = AgentArray.Filter.ByCondition(gadget_array, lambda agent_id: Agent.GetGadgetID(agent_id) == gadget_id)
@@ -443,10 +374,6 @@ class Agents:
         
     @staticmethod
     def GetNearestChest(max_distance=5000):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..enums_src.Model_enums import GadgetModelID
-        from ..Agent import Agent
         """
         Purpose: Get the nearest chest within the specified range.
         Args:
@@ -479,10 +406,6 @@ class Agents:
             enchanted_only (bool): If True, only select agents that are enchanted.
         Returns: PyAgent.PyAgent: The best target agent object, or None if no target matches.
         """
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         best_target = None
         lowest_sum = float('inf')
@@ -547,10 +470,6 @@ class Agents:
             enchanted_only (bool): If True, only select agents that are enchanted.
         Returns: PyAgent.PyAgent: The best melee target agent object, or None if no target matches.
         """
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         best_target = None
         lowest_sum = float('inf')
@@ -609,13 +528,10 @@ class Agents:
     
     @staticmethod
     def GetPartyTargetID():
-        from .Party import Party
         return Party.GetPartyTargetID()
     
     @staticmethod
     def SafeInteract(target_id):
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         if Agent.IsValid(target_id):
             Player.ChangeTarget(target_id)
             Player.Interact(target_id, False)
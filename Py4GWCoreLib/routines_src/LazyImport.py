@@ -0,0 +1,105 @@
+"""
+LazyImport - module-level bindings resolved on first use.
+
+The routines modules cannot import Agent, AgentArray, GLOBAL_CACHE, ... at
+module load time without creating import cycles through the Py4GWCoreLib
+package, so historically every method started with a few function-local
+`from ..X import Y` statements. Those run through the import system on every
+call.
+
+`lazy_import` puts a placeholder into the calling module's globals instead.
+The first attribute access or call on the placeholder performs the real
+import and overwrites the global with the imported object, so every later
+lookup is a plain global read. Resolution happens at call time, when the
+package is fully initialised, which keeps it cycle-safe.
+
+Only the binding module's own global is rewritten, so lazily bound names must
+not be re-exported: `from .Agents import Routines` elsewhere copies the
+placeholder, which then re-imports on every use. Import the name from its real
+home instead. Enums and other values used through iteration or membership
+tests should be imported eagerly when that does not create a cycle; the
+placeholder resolves on `iter`, `in` and `len` as a fallback only.
+
+Usage:
+    ```python
+    from typing import TYPE_CHECKING
+    from .LazyImport import lazy_import
+
+    lazy_import(globals(), "..Agent", "Agent")
+    lazy_import(globals(), "..GlobalCache", "GLOBAL_CACHE")
+    if TYPE_CHECKING:
+        from ..Agent import Agent
+        from ..GlobalCache import GLOBAL_CACHE
+    ```
+"""
+
+import importlib
+from typing import Any
+
+
+class LazyBinding:
+    """Placeholder for a module global; replaces itself with the real object on first use."""
+
+    __slots__ = ("_namespace", "_alias", "_module", "_attr", "_package")
+
+    def __init__(self, namespace: dict[str, Any], alias: str, module: str, attr: str | None, package: str | None):
+        self._namespace = namespace
+        self._alias = alias
+        self._module = module
+        self._attr = attr
+        self._package = package
+
+    def resolve(self) -> Any:
+        module = importlib.import_module(self._module, self._package)
+        if self._attr is None:
+            value = module
+        else:
+            try:
+                value = getattr(module, self._attr)
+            except AttributeError:
+                # target module is still initialising (import cycle); stay unbound and retry next time
+                raise ImportError(
+                    f"cannot resolve {self._attr!r} from partially initialised module {module.__name__!r}"
+                ) from None
+        if self._namespace.get(self._alias) is self:
+            self._namespace[self._alias] = value
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.resolve()
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __repr__(self) -> str:
+        target = f"{self._module}.{self._attr}" if self._attr else self._module
+        return f"<LazyBinding {self._alias} -> {target}>"
+
+
+def lazy_import(namespace: dict[str, Any], module: str, attr: str | None = None, alias: str | None = None) -> LazyBinding:
+    """
+    Bind `alias` in `namespace` to `attr` of `module`, imported on first use.
+
+    Args:
+        namespace (dict): The globals() of the binding module.
+        module (str): Module name, relative names resolve against namespace["__package__"].
+        attr (str | None): Attribute to bind, None binds the module itself.
+        alias (str | None): Global name to bind, defaults to attr (or the last module component).
+
+    Returns:
+        LazyBinding: The placeholder stored in namespace.
+    """
+    if alias is None:
+        alias = attr or module.rsplit(".", 1)[-1]
+    binding = LazyBinding(namespace, alias, module, attr, namespace.get("__package__"))
+    namespace[alias] = binding
+    return binding
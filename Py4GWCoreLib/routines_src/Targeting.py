@@ -1,11 +1,23 @@
-import importlib
-
-class _RProxy:
-    def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
-
-Routines = _RProxy()
+from typing import TYPE_CHECKING
+
+from .LazyImport import lazy_import
+
+# resolved on first use, see LazyImport
+lazy_import(globals(), "..Agent", "Agent")
+lazy_import(globals(), "..AgentArray", "AgentArray")
+lazy_import(globals(), "..GlobalCache", "GLOBAL_CACHE")
+lazy_import(globals(), "..Py4GWcorelib", "Utils")
+lazy_import(globals(), "..Routines", "Routines")
+lazy_import(globals(), ".Agents", "Agents")
+lazy_import(globals(), ".Checks", "Checks")
+if TYPE_CHECKING:
+    from ..Agent import Agent
+    from ..AgentArray import AgentArray
+    from ..GlobalCache import GLOBAL_CACHE
+    from ..Py4GWcorelib import Utils
+    from ..Routines import Routines
+    from .Agents import Agents
+    from .Checks import Checks
 
 from ..enums_src.GameData_enums import Range
 from ..Player import Player
@@ -15,23 +27,17 @@ class Targeting:
     
     @staticmethod
     def InteractTarget():
-        from ..GlobalCache import GLOBAL_CACHE
         """Interact with the target"""
         Player.Interact(Player.GetTargetID(), False)
     
     @staticmethod
     def SafeChangeTarget( target_id):
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         
         if Agent.IsValid(target_id):
             Player.ChangeTarget(target_id)
         
     @staticmethod
     def HasArrivedToTarget():
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
         """Check if the player has arrived at the target."""
         player_x, player_y = Player.GetXY()
         target_id = Player.GetTargetID()
@@ -40,9 +46,6 @@ class Targeting:
     
     @staticmethod
     def GetAllAlliesArray(distance=Range.SafeCompass.value):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         ally_array = AgentArray.GetAllyArray()
         ally_array = AgentArray.Filter.ByDistance(ally_array, Player.GetXY(), distance)
@@ -58,16 +61,11 @@ class Targeting:
     
     @staticmethod
     def GetNearestSpirit(distance=Range.Earshot.value):
-        from ..Routines import Routines
         v_target = Routines.Agents.GetNearestSpirit(distance)
         return v_target
 
     @staticmethod
     def FilterAllyArray(array, distance, other_ally=False, filter_skill_id=0):
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         array = AgentArray.Filter.ByDistance(array, Player.GetXY(), distance)
         array = AgentArray.Filter.ByCondition(array, lambda agent_id: Agent.IsAlive(agent_id))
@@ -82,9 +80,6 @@ class Targeting:
 
     @staticmethod
     def TargetLowestAlly(other_ally=False,filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
 
         distance = Range.Spellcast.value
         ally_array = AgentArray.GetAllyArray()
@@ -101,11 +96,6 @@ class Targeting:
         
     @staticmethod
     def TargetLowestAllyEnergy(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         BLOOD_IS_POWER = GLOBAL_CACHE.Skill.GetID("Blood_is_Power")
         BLOOD_RITUAL = GLOBAL_CACHE.Skill.GetID("Blood_Ritual")
@@ -127,9 +117,6 @@ class Targeting:
 
     @staticmethod
     def TargetLowestAllyCaster(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from .Checks import Checks
 
         distance = Range.Spellcast.value
         ally_array = AgentArray.GetAllyArray()
@@ -141,10 +128,6 @@ class Targeting:
 
     @staticmethod
     def TargetLowestAllyMartial(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
-        from .Checks import Checks
 
         distance = Range.Spellcast.value
         ally_array = AgentArray.GetAllyArray()
@@ -161,10 +144,6 @@ class Targeting:
 
     @staticmethod
     def TargetLowestAllyMelee(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..Agent import Agent
-        from .Checks import Checks
 
         distance = Range.Spellcast.value
         ally_array = AgentArray.GetAllyArray()
@@ -181,9 +160,6 @@ class Targeting:
 
     @staticmethod
     def TargetLowestAllyRanged(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from .Checks import Checks
 
         distance = Range.Spellcast.value
         ally_array = AgentArray.GetAllyArray()
@@ -195,10 +171,6 @@ class Targeting:
 
     @staticmethod  
     def TargetNearestItem():
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Agent import Agent
 
         def IsValidItem(item_id):
             if item_id == 0:
@@ -219,9 +191,6 @@ class Targeting:
 
     @staticmethod
     def TargetClusteredEnemy(area=4500.0):
-        from ..Agent import Agent
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
         distance = area
         enemy_array = AgentArray.GetEnemyArray()
@@ -234,219 +203,96 @@ class Targeting:
 
     @staticmethod
     def GetEnemyAttacking(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsAttacking(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("attacking").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyCasting(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsCasting(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("casting").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyCastingSpell(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
-        def _filter_spells(enemy_array):
-            result_array = []
-            for enemy_id in enemy_array:
-                casting_skill_id = Agent.GetCastingSkillID(enemy_id)
-                if GLOBAL_CACHE.Skill.Flags.IsSpell(casting_skill_id):
-                    result_array.append(enemy_id)
-            return result_array
-
-                    
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsCasting(agent_id))
-        enemy_array = _filter_spells(enemy_array)
-        
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        query.Has("casting").Where(
+            lambda agent_id: GLOBAL_CACHE.Skill.Flags.IsSpell(Agent.GetCastingSkillID(agent_id))
+        )
+        return query.Nearest(player_pos)
 
     @staticmethod
     def GetEnemyInjured(max_distance=4500.0, aggressive_only = False): 
-        from ..Py4GWcorelib import Utils 
-        from ..AgentArray import AgentArray 
-        from ..GlobalCache import GLOBAL_CACHE 
-        from .Agents import Agents 
-        from ..Agent import Agent
         player_pos = Player.GetXY() 
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only) 
-        # sort by lowest HP, then by distance 
-        enemy_array = AgentArray.Sort.ByCondition( 
-            enemy_array, 
-            lambda agent_id: ( 
-                Agent.GetHealth(agent_id),
-                Utils.Distance(player_pos, Agent.GetXY(agent_id)) 
-                ) 
-        ) 
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        # lowest HP, then by distance
+        return query.Lowest("hp", player_pos)
 
     @staticmethod
     def GetEnemyHealthy(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils 
-        from ..AgentArray import AgentArray 
-        from ..GlobalCache import GLOBAL_CACHE 
-        from .Agents import Agents 
-        from ..Agent import Agent
         player_pos = Player.GetXY() 
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only) 
-        # sort by lowest HP, then by distance 
-        enemy_array = AgentArray.Sort.ByCondition( 
-            enemy_array, 
-            lambda agent_id: ( 
-                -Agent.GetHealth(agent_id),
-                Utils.Distance(player_pos, Agent.GetXY(agent_id)) 
-                ) 
-        ) 
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        # highest HP, then by distance
+        return query.Highest("hp", player_pos)
 
     @staticmethod
     def GetEnemyConditioned(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsConditioned(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("conditioned").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyBleeding(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsBleeding(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("bleeding").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyPoisoned(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsPoisoned(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
-     
-    @staticmethod   
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("poisoned").Nearest(player_pos)
+
+    @staticmethod
     def GetEnemyCrippled(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsCrippled(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("crippled").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyHexed(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsHexed(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("hexed").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyDegenHexed(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsDegenHexed(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("degen_hexed").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyEnchanted(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsEnchanted(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("enchanted").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyMoving(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsMoving(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("moving").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyKnockedDown(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
-        from ..Agent import Agent
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Agent.IsKnockedDown(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Has("knocked_down").Nearest(player_pos)
 
     @staticmethod
     def GetEnemyWithEffect(effect_skill_id, max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Checks.Effects.HasEffect(agent_id, effect_skill_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        query = Agents.QueryFilteredEnemies(player_pos[0], player_pos[1], max_distance, aggressive_only)
+        return query.Where(lambda agent_id: Checks.Effects.HasEffect(agent_id, effect_skill_id)).Nearest(player_pos)
 #endregion
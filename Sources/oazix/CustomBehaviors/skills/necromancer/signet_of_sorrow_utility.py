@@ -1,7 +1,7 @@
 from typing import Any, Generator, override, Tuple
 
 from Py4GWCoreLib import GLOBAL_CACHE, Range, Agent, Player, AgentArray
-from Py4GWCoreLib.routines_src.Agents import Routines
+from Py4GWCoreLib.Routines import Routines
 from Sources.oazix.CustomBehaviors.primitives.behavior_state import BehaviorState
 from Sources.oazix.CustomBehaviors.primitives.bus.event_bus import EventBus
 from Sources.oazix.CustomBehaviors.primitives.helpers import custom_behavior_helpers
@@ -1,12 +1,11 @@
 import argparse
 import json
-import socket
 import sys
 import time
 import uuid
 from typing import Any
 
-from BridgeRuntime.protocol import recv_json_message, send_json_message
+from BridgeRuntime import client as bridge_client
 
 
 def _request(
@@ -17,23 +16,7 @@ def _request(
     timeout: float = 5.0,
     request_id: str | None = None,
 ) -> dict[str, Any]:
-    req = {
-        "type": "request",
-        "request_id": request_id or uuid.uuid4().hex,
-        "command": command,
-        "params": params or {},
-    }
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
-    try:
-        sock.connect((host, port))
-        send_json_message(sock, req)
-        return recv_json_message(sock, timeout=timeout)
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
+    return bridge_client.request(host, port, command, params, timeout=timeout, request_id=request_id)
 
 
 def _target_args(args: argparse.Namespace) -> dict[str, Any]:
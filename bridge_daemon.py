@@ -4,7 +4,7 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable
 
 from BridgeRuntime.protocol import (
     PROTOCOL_VERSION,
@@ -28,6 +28,105 @@ class ForwardRecord:
     last_response: dict[str, Any] | None = None
 
 
+@dataclass
+class ControlPlan:
+    request_id: str
+    response: dict[str, Any] | None = None
+    client: Any = None
+    bridge_command: str = ""
+    bridge_params: dict[str, Any] = field(default_factory=dict)
+    timeout_s: float = 3.0
+    bridge_request_id: str | None = None
+    record_id: str = ""
+    finish: Callable[[Any, dict[str, Any]], dict[str, Any]] | None = None
+
+
+# control command -> (bridge command, result key)
+_STATE_COMMANDS: dict[str, tuple[str, str]] = {
+    "client.describe_runtime": ("client.describe", "client_state"),
+    "client.get_map_state": ("map.get_state", "map_state"),
+    "client.get_player_state": ("player.get_state", "player_state"),
+}
+
+
+def _finish_state(request_id: str, result_key: str, client: Any, resp: dict[str, Any]) -> dict[str, Any]:
+    if not resp.get("ok"):
+        return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
+    return make_response(
+        request_id,
+        {
+            "target": client.describe(),
+            result_key: resp.get("result"),
+            "bridge_response": resp,
+        },
+    )
+
+
+def _finish_list_agents(request_id: str, group: str, client: Any, resp: dict[str, Any]) -> dict[str, Any]:
+    if not resp.get("ok"):
+        return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
+    bridge_result = resp.get("result") or {}
+    if not isinstance(bridge_result, dict):
+        return make_error_response(request_id, "invalid_bridge_response", "agent result must be object")
+    return make_response(
+        request_id,
+        {
+            "target": client.describe(),
+            "group": str(bridge_result.get("group") or group),
+            "agents": bridge_result.get("agents", []),
+            "bridge_response": resp,
+        },
+    )
+
+
+def _finish_list_namespaces(request_id: str, client: Any, resp: dict[str, Any]) -> dict[str, Any]:
+    if not resp.get("ok"):
+        return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
+    bridge_result = resp.get("result") or {}
+    if not isinstance(bridge_result, dict):
+        return make_error_response(request_id, "invalid_bridge_response", "namespace result must be object")
+    namespaces = bridge_result.get("namespaces", [])
+    details = bridge_result.get("details", [])
+    if not isinstance(namespaces, list) or not isinstance(details, list):
+        return make_error_response(
+            request_id,
+            "invalid_bridge_response",
+            "namespace result must include list fields",
+        )
+    return make_response(
+        request_id,
+        {
+            "target": client.describe(),
+            "namespaces": namespaces,
+            "details": details,
+            "bridge_response": resp,
+        },
+    )
+
+
+def _finish_list_commands(request_id: str, client: Any, resp: dict[str, Any]) -> dict[str, Any]:
+    if not resp.get("ok"):
+        return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
+    bridge_result = resp.get("result") or {}
+    if not isinstance(bridge_result, dict):
+        return make_error_response(request_id, "invalid_bridge_response", "command result must be object")
+    commands = bridge_result.get("commands", [])
+    if not isinstance(commands, list):
+        return make_error_response(
+            request_id,
+            "invalid_bridge_response",
+            "command result must include commands list",
+        )
+    return make_response(
+        request_id,
+        {
+            "target": client.describe(),
+            "commands": commands,
+            "bridge_response": resp,
+        },
+    )
+
+
 @dataclass
 class BridgeClientSession:
     sock: socket.socket
@@ -205,170 +304,129 @@ class BridgeDaemon:
             return None, make_error_response(request_id, "client_not_found", "target client not connected")
         return client, None
 
-    def _call_bridge_command(
+    def plan_control(self, request_id: str, request: dict[str, Any]) -> ControlPlan:
+        """
+        Validate a control request and decide how to answer it.
+
+        Returns a plan that is either answered directly (`response`) or needs one
+        round-trip to a bridge client; the caller performs that round-trip (blocking
+        or async) and hands the bridge response to `finish_control`.
+        """
+        command = str(request.get("command") or "")
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return ControlPlan(request_id, response=make_error_response(request_id, "validation_params", "params must be object"))
+        if command == "system.ping":
+            return ControlPlan(request_id, response=make_response(request_id, {"pong": True, "time_ms": _now_ms()}))
+        if command == "system.list_clients":
+            return ControlPlan(request_id, response=make_response(request_id, {"clients": self.list_clients()}))
+
+        if command in _STATE_COMMANDS:
+            bridge_command, result_key = _STATE_COMMANDS[command]
+            return self._plan_forward(
+                request_id, params, bridge_command, {},
+                finish=lambda client, resp: _finish_state(request_id, result_key, client, resp),
+            )
+        if command == "client.list_agents":
+            group = str(params.get("group") or "all").lower()
+            if group not in {"all", "ally", "enemy", "item", "gadget", "npc"}:
+                return ControlPlan(request_id, response=make_error_response(request_id, "validation_group", f"unsupported group: {group}"))
+            return self._plan_forward(
+                request_id, params, "agent.list", {"group": group},
+                finish=lambda client, resp: _finish_list_agents(request_id, group, client, resp),
+            )
+        if command == "client.list_namespaces":
+            return self._plan_forward(
+                request_id, params, "system.list_namespaces", {},
+                finish=lambda client, resp: _finish_list_namespaces(request_id, client, resp),
+            )
+        if command == "client.list_commands":
+            return self._plan_forward(
+                request_id, params, "system.list_commands", {},
+                finish=lambda client, resp: _finish_list_commands(request_id, client, resp),
+            )
+        if command == "client.request":
+            payload = params.get("payload", {})
+            if not isinstance(payload, dict):
+                return ControlPlan(request_id, response=make_error_response(request_id, "validation_payload", "payload must be object"))
+            client, error = self._resolve_target_client(request_id, params)
+            if error is not None or client is None:
+                return ControlPlan(request_id, response=error or make_error_response(request_id, "client_not_found", "target client not connected"))
+            payload_cmd = str(payload.get("command") or "")
+            payload_params = payload.get("params", {})
+            if not payload_cmd or not isinstance(payload_params, dict):
+                return ControlPlan(
+                    request_id,
+                    response=make_error_response(request_id, "validation_payload", "payload.command and payload.params required"),
+                )
+            return ControlPlan(
+                request_id,
+                client=client,
+                bridge_command=payload_cmd,
+                bridge_params=dict(payload_params),
+                timeout_s=3.0,
+                bridge_request_id=request_id,
+                record_id=request_id,
+            )
+        if command == "client.get_status":
+            tracked_request_id = str(params.get("tracked_request_id") or "")
+            if not tracked_request_id:
+                return ControlPlan(
+                    request_id,
+                    response=make_error_response(request_id, "validation_status", "target and tracked_request_id required"),
+                )
+            client, error = self._resolve_target_client(request_id, params)
+            if error is not None or client is None:
+                return ControlPlan(request_id, response=error or make_error_response(request_id, "client_not_found", "target client not connected"))
+            return ControlPlan(
+                request_id,
+                client=client,
+                bridge_command="ops.get_status",
+                bridge_params={"request_id": tracked_request_id},
+                timeout_s=2.0,
+                record_id=tracked_request_id,
+            )
+        return ControlPlan(request_id, response=make_error_response(request_id, "not_supported", f"unsupported command: {command}"))
+
+    def _plan_forward(
         self,
         request_id: str,
         params: dict[str, Any],
         bridge_command: str,
-        bridge_params: dict[str, Any] | None = None,
-        timeout_s: float = 3.0,
-    ) -> tuple[BridgeClientSession | None, dict[str, Any] | None, dict[str, Any] | None]:
+        bridge_params: dict[str, Any],
+        finish: Callable[[Any, dict[str, Any]], dict[str, Any]],
+    ) -> ControlPlan:
         client, error = self._resolve_target_client(request_id, params)
         if error is not None or client is None:
-            return client, error, None
-        resp = client.call_client(bridge_command, bridge_params or {}, timeout_s=timeout_s)
-        self._record_forward(request_id, client, resp)
-        return client, None, resp
+            return ControlPlan(request_id, response=error or make_error_response(request_id, "client_not_found", "target client not connected"))
+        return ControlPlan(
+            request_id,
+            client=client,
+            bridge_command=bridge_command,
+            bridge_params=bridge_params,
+            record_id=request_id,
+            finish=finish,
+        )
+
+    def finish_control(self, plan: ControlPlan, resp: dict[str, Any]) -> dict[str, Any]:
+        self._record_forward(plan.record_id, plan.client, resp)
+        if plan.finish is not None:
+            return plan.finish(plan.client, resp)
+        return make_response(plan.request_id, {"target": plan.client.describe(), "bridge_response": resp})
 
     def control_dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
         request_id = str(request.get("request_id") or uuid.uuid4().hex)
-        command = str(request.get("command") or "")
-        params = request.get("params", {})
-        if not isinstance(params, dict):
-            return make_error_response(request_id, "validation_params", "params must be object")
         try:
-            if command == "system.ping":
-                return make_response(request_id, {"pong": True, "time_ms": _now_ms()})
-            if command == "system.list_clients":
-                return make_response(request_id, {"clients": self.list_clients()})
-            if command == "client.describe_runtime":
-                client, error, resp = self._call_bridge_command(request_id, params, "client.describe")
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "client_state": resp.get("result"),
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.get_map_state":
-                client, error, resp = self._call_bridge_command(request_id, params, "map.get_state")
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "map_state": resp.get("result"),
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.get_player_state":
-                client, error, resp = self._call_bridge_command(request_id, params, "player.get_state")
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "player_state": resp.get("result"),
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.list_agents":
-                group = str(params.get("group") or "all").lower()
-                if group not in {"all", "ally", "enemy", "item", "gadget", "npc"}:
-                    return make_error_response(request_id, "validation_group", f"unsupported group: {group}")
-                client, error, resp = self._call_bridge_command(request_id, params, "agent.list", {"group": group})
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                bridge_result = resp.get("result") or {}
-                if not isinstance(bridge_result, dict):
-                    return make_error_response(request_id, "invalid_bridge_response", "agent result must be object")
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "group": str(bridge_result.get("group") or group),
-                        "agents": bridge_result.get("agents", []),
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.list_namespaces":
-                client, error, resp = self._call_bridge_command(request_id, params, "system.list_namespaces")
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                bridge_result = resp.get("result") or {}
-                if not isinstance(bridge_result, dict):
-                    return make_error_response(request_id, "invalid_bridge_response", "namespace result must be object")
-                namespaces = bridge_result.get("namespaces", [])
-                details = bridge_result.get("details", [])
-                if not isinstance(namespaces, list) or not isinstance(details, list):
-                    return make_error_response(
-                        request_id,
-                        "invalid_bridge_response",
-                        "namespace result must include list fields",
-                    )
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "namespaces": namespaces,
-                        "details": details,
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.list_commands":
-                client, error, resp = self._call_bridge_command(request_id, params, "system.list_commands")
-                if error is not None or client is None or resp is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                if not resp.get("ok"):
-                    return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-                bridge_result = resp.get("result") or {}
-                if not isinstance(bridge_result, dict):
-                    return make_error_response(request_id, "invalid_bridge_response", "command result must be object")
-                commands = bridge_result.get("commands", [])
-                if not isinstance(commands, list):
-                    return make_error_response(
-                        request_id,
-                        "invalid_bridge_response",
-                        "command result must include commands list",
-                    )
-                return make_response(
-                    request_id,
-                    {
-                        "target": client.describe(),
-                        "commands": commands,
-                        "bridge_response": resp,
-                    },
-                )
-            if command == "client.request":
-                payload = params.get("payload", {})
-                if not isinstance(payload, dict):
-                    return make_error_response(request_id, "validation_payload", "payload must be object")
-                client, error = self._resolve_target_client(request_id, params)
-                if error is not None or client is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                payload_cmd = str(payload.get("command") or "")
-                payload_params = payload.get("params", {})
-                if not payload_cmd or not isinstance(payload_params, dict):
-                    return make_error_response(request_id, "validation_payload", "payload.command and payload.params required")
-                resp = client.call_client(payload_cmd, dict(payload_params), timeout_s=3.0, request_id_override=request_id)
-                self._record_forward(request_id, client, resp)
-                return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-            if command == "client.get_status":
-                tracked_request_id = str(params.get("tracked_request_id") or "")
-                if not tracked_request_id:
-                    return make_error_response(request_id, "validation_status", "target and tracked_request_id required")
-                client, error = self._resolve_target_client(request_id, params)
-                if error is not None or client is None:
-                    return error or make_error_response(request_id, "client_not_found", "target client not connected")
-                resp = client.call_client("ops.get_status", {"request_id": tracked_request_id}, timeout_s=2.0)
-                self._record_forward(tracked_request_id, client, resp)
-                return make_response(request_id, {"target": client.describe(), "bridge_response": resp})
-            return make_error_response(request_id, "not_supported", f"unsupported command: {command}")
+            plan = self.plan_control(request_id, request)
+            if plan.response is not None:
+                return plan.response
+            resp = plan.client.call_client(
+                plan.bridge_command,
+                plan.bridge_params,
+                timeout_s=plan.timeout_s,
+                request_id_override=plan.bridge_request_id,
+            )
+            return self.finish_control(plan, resp)
         except TimeoutError as exc:
             return make_error_response(request_id, "timeout", str(exc), retryable=True)
         except Exception as exc:
@@ -388,14 +446,31 @@ class BridgeDaemon:
                 daemon=True,
             ).start()
 
+    def _dispatch_control_request(self, sock: socket.socket, send_lock: threading.Lock, req: dict[str, Any]) -> None:
+        resp = self.control_dispatch(req)
+        try:
+            with send_lock:
+                send_json_message(sock, resp)
+        except Exception:
+            pass
+
     def _handle_control_conn(self, sock: socket.socket) -> None:
+        # Pooled clients pipeline several requests on one connection. Each one is
+        # dispatched on its own thread so a slow client call does not hold up the
+        # rest; responses are matched back by request_id, not by order.
+        send_lock = threading.Lock()
         try:
             while True:
                 req = recv_json_message(sock, timeout=300.0)
                 if req.get("type") != "request":
-                    send_json_message(sock, make_error_response("", "protocol_type", "expected request"))
+                    with send_lock:
+                        send_json_message(sock, make_error_response("", "protocol_type", "expected request"))
                     continue
-                send_json_message(sock, self.control_dispatch(req))
+                threading.Thread(
+                    target=self._dispatch_control_request,
+                    args=(sock, send_lock, req),
+                    daemon=True,
+                ).start()
         except Exception:
             pass
         finally:
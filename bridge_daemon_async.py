@@ -0,0 +1,203 @@
+import argparse
+import asyncio
+import socket
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from BridgeRuntime.protocol import (
+    PROTOCOL_VERSION,
+    ProtocolError,
+    make_error_response,
+    recv_json_message_async,
+    send_json_message_async,
+)
+from bridge_daemon import BridgeClientSession, BridgeDaemon, _now_ms
+
+
+@dataclass
+class AsyncBridgeClientSession(BridgeClientSession):
+    """Widget client session driven by the event loop instead of a dedicated thread."""
+
+    reader: asyncio.StreamReader | None = None
+    writer: asyncio.StreamWriter | None = None
+    futures: dict[str, asyncio.Future] = field(default_factory=dict)
+
+    async def call_client_async(
+        self,
+        command: str,
+        params: dict[str, Any],
+        timeout_s: float = 2.0,
+        request_id_override: str | None = None,
+    ) -> dict[str, Any]:
+        if not self.alive or self.writer is None:
+            raise RuntimeError("client disconnected")
+        request_id = request_id_override or uuid.uuid4().hex
+        fut = asyncio.get_running_loop().create_future()
+        self.futures[request_id] = fut
+        try:
+            await send_json_message_async(
+                self.writer,
+                {"type": "request", "request_id": request_id, "command": command, "params": params},
+            )
+            try:
+                return await asyncio.wait_for(fut, timeout_s)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"client timeout for {command}") from None
+        finally:
+            self.futures.pop(request_id, None)
+
+    async def recv_loop_async(self) -> None:
+        assert self.reader is not None and self.writer is not None
+        try:
+            hello = await recv_json_message_async(self.reader, timeout=10.0)
+            if hello.get("type") != "hello":
+                raise ProtocolError("expected hello")
+            if int(hello.get("protocol_version", 0)) != PROTOCOL_VERSION:
+                raise ProtocolError("protocol version mismatch")
+            if self.daemon.token and str(hello.get("token") or "") != self.daemon.token:
+                raise ProtocolError("auth token mismatch")
+            self.set_handshake(hello)
+            self.daemon.register_client(self)
+            await send_json_message_async(
+                self.writer,
+                {
+                    "type": "hello_ack",
+                    "protocol_version": PROTOCOL_VERSION,
+                    "session_id": self.session_id,
+                    "server_time_ms": _now_ms(),
+                },
+            )
+            while self.alive:
+                msg = await recv_json_message_async(self.reader, timeout=30.0)
+                self.meta["last_seen_ms"] = _now_ms()
+                mtype = str(msg.get("type") or "")
+                if mtype == "response":
+                    fut = self.futures.get(str(msg.get("request_id") or ""))
+                    if fut is not None and not fut.done():
+                        fut.set_result(msg)
+                elif mtype == "heartbeat":
+                    client = msg.get("client", {})
+                    if isinstance(client, dict):
+                        self.account_email = str(client.get("account_email") or self.account_email)
+                        self.character_name = str(client.get("character_name") or self.character_name)
+        except Exception as exc:
+            print(f"[daemon] client disconnected {self.addr}: {exc}")
+        finally:
+            self.alive = False
+            self.daemon.unregister_client(self)
+            for fut in self.futures.values():
+                if not fut.done():
+                    fut.set_exception(RuntimeError("client disconnected"))
+            self.writer.close()
+
+
+class AsyncBridgeDaemon(BridgeDaemon):
+    """
+    Single event-loop variant of BridgeDaemon.
+
+    Same wire protocol and control API; command routing and response shaping
+    come from BridgeDaemon.plan_control/finish_control. Widget clients,
+    control connections and every pending client call live on one asyncio
+    loop instead of a thread each.
+    """
+
+    def __init__(self, widget_host: str, widget_port: int, control_host: str, control_port: int, token: str):
+        super().__init__(widget_host, widget_port, control_host, control_port, token)
+        self._tasks: set[asyncio.Task] = set()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def control_dispatch_async(self, request: dict[str, Any]) -> dict[str, Any]:
+        request_id = str(request.get("request_id") or uuid.uuid4().hex)
+        try:
+            plan = self.plan_control(request_id, request)
+            if plan.response is not None:
+                return plan.response
+            resp = await plan.client.call_client_async(
+                plan.bridge_command,
+                plan.bridge_params,
+                timeout_s=plan.timeout_s,
+                request_id_override=plan.bridge_request_id,
+            )
+            return self.finish_control(plan, resp)
+        except TimeoutError as exc:
+            return make_error_response(request_id, "timeout", str(exc), retryable=True)
+        except Exception as exc:
+            return make_error_response(request_id, "internal_error", str(exc))
+
+    @staticmethod
+    def _set_nodelay(writer: asyncio.StreamWriter) -> None:
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def _on_widget_conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._set_nodelay(writer)
+        session = AsyncBridgeClientSession(
+            sock=writer.get_extra_info("socket"),
+            addr=writer.get_extra_info("peername"),
+            daemon=self,
+            reader=reader,
+            writer=writer,
+        )
+        await session.recv_loop_async()
+
+    async def _answer_control(self, writer: asyncio.StreamWriter, req: dict[str, Any]) -> None:
+        resp = await self.control_dispatch_async(req)
+        try:
+            await send_json_message_async(writer, resp)
+        except Exception:
+            pass
+
+    async def _on_control_conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._set_nodelay(writer)
+        try:
+            while True:
+                req = await recv_json_message_async(reader, timeout=300.0)
+                if req.get("type") != "request":
+                    await send_json_message_async(writer, make_error_response("", "protocol_type", "expected request"))
+                    continue
+                self._spawn(self._answer_control(writer, req))
+        except Exception:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        widget_server = await asyncio.start_server(self._on_widget_conn, self.widget_host, self.widget_port)
+        control_server = await asyncio.start_server(self._on_control_conn, self.control_host, self.control_port)
+        print(f"[daemon] widget server {self.widget_host}:{self.widget_port}")
+        print(f"[daemon] control server {self.control_host}:{self.control_port}")
+        async with widget_server, control_server:
+            await asyncio.gather(widget_server.serve_forever(), control_server.serve_forever())
+
+    def run(self) -> None:
+        asyncio.run(self.serve())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Py4GW bridge daemon (asyncio)")
+    parser.add_argument("--widget-host", default="127.0.0.1")
+    parser.add_argument("--widget-port", type=int, default=47811)
+    parser.add_argument("--control-host", default="127.0.0.1")
+    parser.add_argument("--control-port", type=int, default=47812)
+    parser.add_argument("--token", default="")
+    args = parser.parse_args()
+    try:
+        AsyncBridgeDaemon(
+            widget_host=args.widget_host,
+            widget_port=args.widget_port,
+            control_host=args.control_host,
+            control_port=args.control_port,
+            token=args.token,
+        ).run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
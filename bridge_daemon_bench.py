@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from BridgeRuntime.protocol import (
+    PROTOCOL_VERSION,
+    recv_json_message_async,
+    send_json_message_async,
+)
+
+DAEMONS = {
+    "threaded": "bridge_daemon.py",
+    "asyncio": "bridge_daemon_async.py",
+}
+
+
+async def _fake_widget(host: str, port: int, hwnd: int, stop: asyncio.Event) -> None:
+    """Minimal injected client: handshake, then answer every request immediately."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await send_json_message_async(
+        writer,
+        {
+            "type": "hello",
+            "protocol_version": PROTOCOL_VERSION,
+            "token": "",
+            "client": {"hwnd": hwnd, "pid": 10000 + hwnd, "account_email": f"bench{hwnd}@local", "character_name": ""},
+        },
+    )
+    await recv_json_message_async(reader, timeout=10.0)
+    try:
+        while not stop.is_set():
+            try:
+                msg = await recv_json_message_async(reader, timeout=1.0)
+            except TimeoutError:
+                await send_json_message_async(writer, {"type": "heartbeat", "client": {}})
+                continue
+            if msg.get("type") != "request":
+                continue
+            await send_json_message_async(
+                writer,
+                {
+                    "type": "response",
+                    "request_id": msg.get("request_id"),
+                    "ok": True,
+                    "result": {"map_id": 1, "hwnd": hwnd},
+                },
+            )
+    except Exception:
+        pass
+    finally:
+        writer.close()
+
+
+async def _control_worker(host: str, port: int, clients: int, deadline: float, latencies: list[float]) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    done = 0
+    try:
+        while time.perf_counter() < deadline:
+            request_id = uuid.uuid4().hex
+            started = time.perf_counter()
+            await send_json_message_async(
+                writer,
+                {
+                    "type": "request",
+                    "request_id": request_id,
+                    "command": "client.get_map_state",
+                    "params": {"target": {"hwnd": random.randint(1, clients)}},
+                },
+            )
+            resp = await recv_json_message_async(reader, timeout=10.0)
+            if not resp.get("ok"):
+                raise RuntimeError(f"request failed: {resp}")
+            latencies.append(time.perf_counter() - started)
+            done += 1
+    finally:
+        writer.close()
+    return done
+
+
+async def _run_load(host: str, widget_port: int, control_port: int, clients: int, concurrency: int, seconds: float) -> dict:
+    stop = asyncio.Event()
+    widgets = [asyncio.create_task(_fake_widget(host, widget_port, hwnd, stop)) for hwnd in range(1, clients + 1)]
+    await asyncio.sleep(0.5)
+
+    latencies: list[float] = []
+    started = time.perf_counter()
+    deadline = started + seconds
+    counts = await asyncio.gather(
+        *(_control_worker(host, control_port, clients, deadline, latencies) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await asyncio.gather(*widgets, return_exceptions=True)
+    latencies.sort()
+    total = sum(counts)
+    return {
+        "requests": total,
+        "req_per_s": total / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0,
+    }
+
+
+def _bench_daemon(name: str, args: argparse.Namespace) -> dict:
+    script = Path(__file__).with_name(DAEMONS[name])
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(script),
+            "--widget-host", args.host,
+            "--widget-port", str(args.widget_port),
+            "--control-host", args.host,
+            "--control-port", str(args.control_port),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    try:
+        time.sleep(1.0)
+        return asyncio.run(
+            _run_load(args.host, args.widget_port, args.control_port, args.clients, args.concurrency, args.seconds)
+        )
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare control throughput of the threaded and asyncio bridge daemons")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--widget-port", type=int, default=47911)
+    parser.add_argument("--control-port", type=int, default=47912)
+    parser.add_argument("--clients", type=int, default=24, help="Simulated injected clients")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent control connections")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Load duration per daemon")
+    parser.add_argument("--daemon", choices=["both", *DAEMONS], default="both")
+    args = parser.parse_args()
+
+    names = list(DAEMONS) if args.daemon == "both" else [args.daemon]
+    for name in names:
+        result = _bench_daemon(name, args)
+        print(
+            f"{name:9s} {result['requests']:7d} req  {result['req_per_s']:9.1f} req/s  "
+            f"p50 {result['p50_ms']:6.2f} ms  p99 {result['p99_ms']:6.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,13 +1,12 @@
 import argparse
 import json
-import socket
 import sys
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from BridgeRuntime.protocol import recv_json_message
-from BridgeRuntime.protocol import send_json_message
+from BridgeRuntime import client as bridge_client
 
 
 SERVER_NAME = "py4gw-bridge-mcp"
@@ -20,6 +19,7 @@ SUPPORTED_MCP_PROTOCOL_VERSIONS = (
 )
 LOG_PATH = Path(__file__).with_name("py4gw_mcp_server.log")
 STDIO_MODE = "auto"
+STDOUT_LOCK = threading.Lock()
 
 
 def _log_stderr(message: str) -> None:
@@ -42,23 +42,7 @@ def _daemon_request(
     params: dict[str, Any] | None = None,
     timeout: float = 5.0,
 ) -> dict[str, Any]:
-    req = {
-        "type": "request",
-        "request_id": uuid.uuid4().hex,
-        "command": command,
-        "params": params or {},
-    }
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
-    try:
-        sock.connect((host, port))
-        send_json_message(sock, req)
-        return recv_json_message(sock, timeout=timeout)
-    finally:
-        try:
-            sock.close()
-        except Exception:
-            pass
+    return bridge_client.request(host, port, command, params, timeout=timeout)
 
 
 def _read_stdio_message() -> dict[str, Any] | None:
@@ -103,13 +87,14 @@ def _write_stdio_message(payload: dict[str, Any]) -> None:
     _log_debug(
         f"send mode={STDIO_MODE!r} id={payload.get('id')!r} keys={sorted(payload.keys())!r} bytes={len(raw)}"
     )
-    if STDIO_MODE == "jsonl":
-        sys.stdout.buffer.write(raw + b"\n")
-    else:
-        header = f"Content-Length: {len(raw)}\r\n\r\n".encode("ascii")
-        sys.stdout.buffer.write(header)
-        sys.stdout.buffer.write(raw)
-    sys.stdout.buffer.flush()
+    with STDOUT_LOCK:
+        if STDIO_MODE == "jsonl":
+            sys.stdout.buffer.write(raw + b"\n")
+        else:
+            header = f"Content-Length: {len(raw)}\r\n\r\n".encode("ascii")
+            sys.stdout.buffer.write(header)
+            sys.stdout.buffer.write(raw)
+        sys.stdout.buffer.flush()
 
 
 def _make_jsonrpc_result(msg_id: Any, result: dict[str, Any]) -> dict[str, Any]:
@@ -207,10 +192,11 @@ def _tool_list() -> list[dict[str, Any]]:
 
 
 class Py4GWMcpServer:
-    def __init__(self, daemon_host: str, daemon_port: int, timeout: float):
+    def __init__(self, daemon_host: str, daemon_port: int, timeout: float, max_workers: int = 8):
         self.daemon_host = daemon_host
         self.daemon_port = daemon_port
         self.timeout = timeout
+        self.max_workers = max(1, int(max_workers))
 
     def _target_params(self, arguments: dict[str, Any]) -> dict[str, Any]:
         target: dict[str, Any] = {}
@@ -354,18 +340,31 @@ class Py4GWMcpServer:
             return None
         return _make_jsonrpc_error(msg_id, -32601, f"Method not found: {method}")
 
-    def run(self) -> int:
-        while True:
-            try:
-                message = _read_stdio_message()
-            except Exception as exc:
-                _write_stdio_message(_make_jsonrpc_error(None, -32700, f"Parse error: {exc}"))
-                return 1
-            if message is None:
-                return 0
+    def _handle_and_write(self, message: dict[str, Any]) -> None:
+        try:
             response = self.handle_message(message)
-            if response is not None:
-                _write_stdio_message(response)
+        except Exception as exc:
+            response = _make_jsonrpc_error(message.get("id"), -32603, str(exc))
+        if response is not None:
+            _write_stdio_message(response)
+
+    def run(self) -> int:
+        # tools/call round-trips to the daemon run on worker threads so several
+        # calls share the pooled daemon connections concurrently; everything
+        # else is answered inline to keep initialize/list ordering intact.
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-tool") as executor:
+            while True:
+                try:
+                    message = _read_stdio_message()
+                except Exception as exc:
+                    _write_stdio_message(_make_jsonrpc_error(None, -32700, f"Parse error: {exc}"))
+                    return 1
+                if message is None:
+                    return 0
+                if str(message.get("method") or "") == "tools/call":
+                    executor.submit(self._handle_and_write, message)
+                    continue
+                self._handle_and_write(message)
 
 
 def main() -> int:
@@ -373,11 +372,12 @@ def main() -> int:
     parser.add_argument("--host", default="127.0.0.1", help="Bridge daemon control host")
     parser.add_argument("--port", type=int, default=47812, help="Bridge daemon control port")
     parser.add_argument("--timeout", type=float, default=5.0, help="Bridge daemon request timeout seconds")
+    parser.add_argument("--workers", type=int, default=8, help="Max concurrent tools/call requests")
     args = parser.parse_args()
     _log_debug(
         f"start argv={sys.argv!r} daemon={args.host}:{args.port} timeout={args.timeout}"
     )
-    server = Py4GWMcpServer(args.host, args.port, args.timeout)
+    server = Py4GWMcpServer(args.host, args.port, args.timeout, max_workers=args.workers)
     try:
         return server.run()
     except KeyboardInterrupt:
@@ -0,0 +1,97 @@
+"""
+Micro-benchmark for the per-call import overhead of the routines GetEnemy* family.
+
+Run it as a script in an explorable area. It times every Targeting.GetEnemy*
+and Agents.GetNearestEnemy* helper with the module-level lazy bindings, then
+times the function-local import statements each of them used to execute on
+every call (replayed from the same package context) and reports both.
+"""
+
+import time
+
+import Py4GW
+import PyImGui
+
+from Py4GWCoreLib import Routines
+from Py4GWCoreLib.routines_src import Agents as agents_module
+
+MODULE_NAME = "Routines Import Bench"
+ITERATIONS = 2000
+
+# the local imports each helper ran per call before the lazy bindings
+_OLD_QUERY_IMPORTS = ("from .Agents import Agents", "from ..AgentSnapshot import AgentSnapshot")
+_OLD_NEAREST_IMPORTS = ("from ..EnemyBlacklist import EnemyBlacklist", "from ..AgentSnapshot import AgentSnapshot")
+_OLD_NEAREST_CLASS_IMPORTS = ("from ..Agent import Agent", "from ..AgentSnapshot import AgentSnapshot")
+_OLD_CASTING_SPELL_IMPORTS = _OLD_QUERY_IMPORTS + ("from ..GlobalCache import GLOBAL_CACHE", "from ..Agent import Agent")
+
+CASES = [
+    ("Targeting.GetEnemyAttacking", lambda: Routines.Targeting.GetEnemyAttacking(), _OLD_QUERY_IMPORTS),
+    ("Targeting.GetEnemyCasting", lambda: Routines.Targeting.GetEnemyCasting(), _OLD_QUERY_IMPORTS),
+    ("Targeting.GetEnemyCastingSpell", lambda: Routines.Targeting.GetEnemyCastingSpell(), _OLD_CASTING_SPELL_IMPORTS),
+    ("Targeting.GetEnemyInjured", lambda: Routines.Targeting.GetEnemyInjured(), _OLD_QUERY_IMPORTS),
+    ("Targeting.GetEnemyHealthy", lambda: Routines.Targeting.GetEnemyHealthy(), _OLD_QUERY_IMPORTS),
+    ("Targeting.GetEnemyHexed", lambda: Routines.Targeting.GetEnemyHexed(), _OLD_QUERY_IMPORTS),
+    ("Targeting.GetEnemyMoving", lambda: Routines.Targeting.GetEnemyMoving(), _OLD_QUERY_IMPORTS),
+    ("Agents.GetNearestEnemy", lambda: Routines.Agents.GetNearestEnemy(), _OLD_NEAREST_IMPORTS),
+    ("Agents.GetNearestEnemyCaster", lambda: Routines.Agents.GetNearestEnemyCaster(), _OLD_NEAREST_CLASS_IMPORTS),
+    ("Agents.GetNearestEnemyMelee", lambda: Routines.Agents.GetNearestEnemyMelee(), _OLD_NEAREST_CLASS_IMPORTS),
+]
+
+results: list[tuple[str, float, float]] = []
+
+
+def _time_call(fn, iterations: int) -> float:
+    fn()  # resolve lazy bindings / warm caches outside the measurement
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def _time_imports(statements: tuple[str, ...], iterations: int) -> float:
+    code = compile("\n".join(statements), "<bench>", "exec")
+    namespace = {"__package__": agents_module.__package__, "__name__": agents_module.__name__}
+    exec(code, namespace)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        exec(code, namespace)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run_bench() -> None:
+    results.clear()
+    for name, fn, old_imports in CASES:
+        now_us = _time_call(fn, ITERATIONS)
+        import_us = _time_imports(old_imports, ITERATIONS)
+        results.append((name, now_us, now_us + import_us))
+        Py4GW.Console.Log(
+            MODULE_NAME,
+            f"{name}: {now_us:.2f} us/call now, ~{now_us + import_us:.2f} us/call with local imports (+{import_us:.2f})",
+            Py4GW.Console.MessageType.Info,
+        )
+
+
+def main():
+    if PyImGui.begin(MODULE_NAME):
+        PyImGui.text(f"{ITERATIONS} calls per helper")
+        if PyImGui.button("Run"):
+            run_bench()
+        if results and PyImGui.begin_table("bench", 3):
+            PyImGui.table_setup_column("Helper")
+            PyImGui.table_setup_column("Lazy bound (us)")
+            PyImGui.table_setup_column("Local imports (us)")
+            PyImGui.table_headers_row()
+            for name, now_us, before_us in results:
+                PyImGui.table_next_row()
+                PyImGui.table_next_column()
+                PyImGui.text(name)
+                PyImGui.table_next_column()
+                PyImGui.text(f"{now_us:.2f}")
+                PyImGui.table_next_column()
+                PyImGui.text(f"{before_us:.2f}")
+            PyImGui.end_table()
+    PyImGui.end()
+
+
+if __name__ == "__main__":
+    main()